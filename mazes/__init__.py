@@ -0,0 +1,15 @@
+"""
+Maze solving library: breadth-first and heuristic searches over a
+compact Grid, with the tools built on them.
+
+    mazes.maze          Maze: file parsing and the breadth-first modes
+    mazes.astar_maze    Maze with the A* family of modes
+    mazes.cli           the solve.py command line
+
+Importing the package loads neither NumPy nor PIL; rendering, random
+maze generation and the plotting report import them when used.
+"""
+from .grid import Grid
+from .maze import Maze
+
+__all__ = ["Grid", "Maze"]
@@ -0,0 +1,209 @@
+import argparse
+import heapq
+import time
+from array import array
+
+INFINITY = 2 ** 31 - 1
+
+DEFAULT_EPSILON = 3.0
+DEFAULT_STEP = 0.5
+
+
+class ARAStar():
+    """
+    Anytime Repairing A* on a Grid: a series of weighted A* searches with
+    f = g + epsilon * h, starting at a large epsilon and lowering it
+    towards 1 until the time budget runs out.
+
+    The first search returns quickly with a path at most epsilon times
+    longer than optimal. Each later search keeps g, the parents and the
+    open list of the previous one and only re-expands cells whose g has
+    improved since they were last expanded (kept on an "inconsistent"
+    list until the next search), so tightening epsilon repairs the
+    previous search instead of starting over.
+
+    After every search the proven suboptimality bound is
+
+        bound = min(epsilon, cost / min(g + h over open and inconsistent cells))
+
+    which is at most epsilon and is 1 once the path is provably optimal.
+    solutions records (epsilon, bound, cost, seconds) for each published
+    path; search() returns the last one.
+    """
+
+    def __init__(self, grid, epsilon=DEFAULT_EPSILON, step=DEFAULT_STEP):
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1")
+        self.grid = grid
+        self.initial_epsilon = epsilon
+        self.step = step
+        size = grid.height * grid.width
+        self.g = array("i", [INFINITY]) * size
+        self.parent = array("i", [-1]) * size
+        self.closed = array("i", [0]) * size
+        self.reached = []
+        self.neighbors = [tuple(offset for _, offset in moves) for moves in grid.moves]
+        self.generation = 0
+        self.epsilon = epsilon
+        self.bound = float("inf")
+        self.solutions = []
+        self.num_explored = 0
+        self.iterations = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.peak = 0
+
+    def search(self, start, goal, budget_ms=None, estimate=None, on_expand=None):
+        """
+        Returns the best (actions, cells) path from start to goal found
+        within budget_ms milliseconds, or None if goal is unreachable.
+        The first weighted search always runs to completion, so a path is
+        returned even when the budget is shorter than that search.
+        estimate(index, goal) replaces Manhattan distance; it must be
+        consistent for the bound to hold. on_expand(index, open_size) is
+        called per expansion.
+        """
+        grid = self.grid
+        if estimate is None:
+            estimate = grid.manhattan
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+        began = time.perf_counter()
+        masks, neighbors = grid.masks, self.neighbors
+        g, parent, closed = self.g, self.parent, self.closed
+
+        # Only the cells the previous search reached need their g reset
+        for index in self.reached:
+            g[index] = INFINITY
+        self.reached = reached = [start]
+        g[start] = 0
+        parent[start] = -1
+
+        self.epsilon = self.initial_epsilon
+        self.bound = float("inf")
+        self.solutions = []
+        self.num_explored = 0
+        self.iterations = 0
+        self.pushes = 1
+        self.pops = 0
+        self.stale_pops = 0
+        self.peak = 1
+        best = None
+
+        # Heap entries are (f, -g, cell); an entry is stale once its cell
+        # is closed in this iteration or its g has improved since the push
+        h_start = estimate(start, goal)
+        heap = [(self.epsilon * h_start, 0, start)]
+        incons = []
+        while True:
+            # closed is stamped per iteration, so each one starts with
+            # nothing closed without clearing the array
+            self.iterations += 1
+            self.generation += 1
+            iteration = self.generation
+            epsilon = self.epsilon
+            aborted = False
+            while heap:
+                f, negative_g, cell = heap[0]
+                if closed[cell] == iteration or -negative_g != g[cell]:
+                    heapq.heappop(heap)
+                    self.stale_pops += 1
+                    continue
+                if g[goal] <= f:
+                    break
+                if deadline is not None and best is not None and self.num_explored & 255 == 0 \
+                        and time.perf_counter() > deadline:
+                    aborted = True
+                    break
+                heapq.heappop(heap)
+                self.pops += 1
+                closed[cell] = iteration
+                self.num_explored += 1
+                if on_expand is not None:
+                    on_expand(cell, len(heap))
+                child_g = g[cell] + 1
+                for offset in neighbors[masks[cell]]:
+                    child = cell + offset
+                    if child_g < g[child]:
+                        if g[child] == INFINITY:
+                            reached.append(child)
+                        g[child] = child_g
+                        parent[child] = cell
+                        if closed[child] == iteration:
+                            incons.append(child)
+                        else:
+                            heapq.heappush(heap, (child_g + epsilon * estimate(child, goal), -child_g, child))
+                            self.pushes += 1
+                if len(heap) > self.peak:
+                    self.peak = len(heap)
+            if aborted:
+                break
+
+            # The open list ran dry without reaching the goal
+            if g[goal] == INFINITY:
+                return None
+
+            # Cells still open or made inconsistent in this iteration are
+            # the frontier of the next one, and give the lower bound
+            frontier = {cell for _, negative_g, cell in heap
+                        if closed[cell] != iteration and -negative_g == g[cell]}
+            frontier.update(incons)
+            incons = []
+            # Record the cost of the path actually returned, which is what
+            # the caller sees and what the bound has to hold for
+            best = self._path(goal)
+            cost = len(best[0])
+            lower = min((g[cell] + estimate(cell, goal) for cell in frontier), default=cost)
+            bound = max(1.0, min(epsilon, cost / lower)) if lower > 0 else 1.0
+            self.bound = bound
+            self.solutions.append((epsilon, bound, cost, time.perf_counter() - began))
+            if bound <= 1 or (deadline is not None and time.perf_counter() > deadline):
+                break
+
+            self.epsilon = max(1.0, epsilon - self.step)
+            heap = [(g[cell] + self.epsilon * estimate(cell, goal), -g[cell], cell) for cell in frontier]
+            heapq.heapify(heap)
+
+        return best
+
+    def _path(self, goal):
+        actions = {offset: action for action, offset in self.grid.offsets.items()}
+        cells = []
+        index = goal
+        while self.parent[index] != -1:
+            cells.append(index)
+            index = self.parent[index]
+        cells.append(index)
+        cells.reverse()
+        return [actions[b - a] for a, b in zip(cells, cells[1:])], cells[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run ARA* on random mazes and print each path it publishes before the deadline."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[200, 500, 1000])
+    parser.add_argument("--obstacles", type=float, default=0.25)
+    parser.add_argument("--budget-ms", type=float, default=50)
+    parser.add_argument("--epsilon", type=float, default=DEFAULT_EPSILON)
+    parser.add_argument("--step", type=float, default=DEFAULT_STEP)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from .maze_generator import random_maze, to_grid
+    from .search import SearchSpace
+
+    print(f"{'size':>6} {'epsilon':>8} {'bound':>7} {'cost':>7} {'optimal':>8} {'ms':>9}")
+    for size in args.sizes:
+        grid = to_grid(random_maze(size, size, args.obstacles, seed=args.seed))
+        space = SearchSpace(grid)
+        optimal = space.cost[grid.goal] if space.astar(grid.start, grid.goal) else None
+
+        solver = ARAStar(grid, args.epsilon, args.step)
+        solver.search(grid.start, grid.goal, args.budget_ms)
+        for epsilon, bound, cost, seconds in solver.solutions:
+            print(f"{size:>6} {epsilon:>8.2f} {bound:>7.3f} {cost:>7} {str(optimal):>8} {seconds * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+import sys
+
+from . import maze
+from .ara_star import ARAStar
+from .bidirectional import bidirectional_astar
+from .frontier import Node, PriorityFrontier
+from .ida_star import DEFAULT_BUDGET_KB, IDAStar, table_size
+from .landmarks import Landmarks
+from .path_cache import maze_key
+from .search import SearchSpace
+from .search_stats import expansion_hook, phase
+
+# متاهة A*: القراءة والطباعة والصورة و is_solvable من maze.Maze، وهنا بس طرق البحث بالـ heuristic
+class Maze(maze.Maze):
+    MODES = ("astar", "bidirectional", "contracted", "ida", "anytime")
+
+    def __init__(self, filename, compact=False, stats=None):
+        # stats (اختياري): SearchStats من search_stats نعبي فيه العدادات وأوقات المراحل
+        super().__init__(filename, compact, stats)
+        self.landmarks = None
+        self.key = None
+
+        # حد الذاكرة (KB) لجدول IDA* في mode="ida"
+        self.memory_budget_kb = DEFAULT_BUDGET_KB
+
+        # حد الوقت (ms) لـ mode="anytime"؛ None يعني نكمل لين المسار يصير أمثل
+        # بعد الحل: solution_bound أقصى نسبة بين طول المسار والأمثل
+        self.latency_budget_ms = None
+        self.solution_bound = None
+
+    def set_wall(self, cell, blocked=True):
+        # الـ landmarks ومفتاح الـ PathCache محسوبين على الجدران القديمة
+        super().set_wall(cell, blocked)
+        self.landmarks = None
+        self.key = None
+
+    def heuristic(self, state):
+        # إذا حسبنا الـ landmarks نستخدم ALT (أدق من مانهاتن في المتاهات اللي فيها ممرات)
+        if self.landmarks is not None:
+            if self.grid is not None:
+                return self.landmarks.estimate(state, self.grid.goal)
+            return self.landmarks.heuristic(state, self.goal)
+
+        # نحسب المسافة بين النقطة الحالية والهدف (Manhattan Distance)
+        if self.grid is not None:
+            return self.grid.manhattan(state, self.grid.goal)
+        row1, col1 = state
+        row2, col2 = self.goal
+        return abs(row1 - row2) + abs(col1 - col2)
+
+    # solve(mode) من maze.Maze: "astar" (الافتراضي)، أو "bidirectional" للبحث من البداية والهدف مع بعض
+    # أو "contracted": A* على graph الممرات بعد ما نسد الطرق المسدودة
+    # أو "ida": IDA* بذاكرة محدودة بـ memory_budget_kb
+    # أو "anytime": ARA* يرجع أحسن مسار لقاه خلال latency_budget_ms
+    def search(self, mode):
+        # إذا الهدف مو متصل بالبداية أصلاً، نوقف قبل لا نبحث
+        if not self.is_solvable():
+            self.num_explored = 0
+            self.num_stale_pops = 0
+            self.explored = set()
+            raise Exception("ما فيه حل")
+
+        if mode == "bidirectional":
+            return self.solve_bidirectional()
+        if mode == "contracted":
+            return self.solve_contracted()
+        if mode == "ida":
+            return self.solve_ida()
+        if mode == "anytime":
+            return self.solve_anytime()
+
+        self.num_explored = 0
+        self.num_stale_pops = 0
+
+        # في الـ Grid المضغوط نبحث على مصفوفات مسطحة بدل كائنات Node
+        if self.grid is not None:
+            return self.solve_compact()
+
+        # البداية
+        start = Node(state=self.start, parent=None, action=None, cost=0, heuristic=self.heuristic(self.start))
+        frontier = PriorityFrontier()
+        frontier.add(start)
+        self.queue = frontier
+        on_expand = expansion_hook(self.stats)
+
+        # مجموعة تخزن النقاط اللي زرناها
+        self.explored = set()
+
+        while True:
+            if frontier.empty():
+                raise Exception("ما فيه حل")
+
+            # نختار النقطة الأقل تكلفة
+            node = frontier.remove()
+            self.num_explored += 1
+            if on_expand is not None:
+                on_expand(node.state, len(frontier))
+
+            # عدد العقد القديمة اللي انشالت من الـ queue وتجاهلناها
+            self.num_stale_pops = frontier.stale_pops
+
+            # إذا وصلنا الهدف، نرجع الحل
+            if node.state == self.goal:
+                with phase(self.stats, "reconstruct"):
+                    actions = []
+                    cells = []
+                    while node.parent is not None:
+                        actions.append(node.action)
+                        cells.append(node.state)
+                        node = node.parent
+                    actions.reverse()
+                    cells.reverse()
+                self.solution = (actions, cells)
+                return
+
+            # نضيف النقطة الحالية إلى النقاط اللي زرناها
+            self.explored.add(node.state)
+
+            # نضيف الجيران إلى الـ Frontier
+            for action, state in self.neighbors(node.state):
+                if state not in self.explored:
+                    child = Node(
+                        state=state,
+                        parent=node,
+                        action=action,
+                        cost=node.cost + 1,
+                        heuristic=self.heuristic(state)
+                    )
+                    frontier.add(child)
+
+    def solve_bidirectional(self):
+        # A* من الطرفين، ونحسب عدد النقاط المستكشفة لكل جهة
+        if self.grid is not None:
+            start, goal, neighbors = self.grid.start, self.grid.goal, self.grid.neighbors
+            distance = self.grid.manhattan
+        else:
+            start, goal, neighbors = self.start, self.goal, self.neighbors
+            distance = lambda a, b: abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        solution, forward, backward = bidirectional_astar(start, goal, neighbors, distance)
+        self.num_explored_forward = len(forward)
+        self.num_explored_backward = len(backward)
+        self.num_explored = self.num_explored_forward + self.num_explored_backward
+        self.explored = forward | backward
+        if self.grid is not None:
+            self.explored = {self.grid.cell(index) for index in self.explored}
+        if solution is None:
+            raise Exception("ما فيه حل")
+
+        actions, cells = solution
+        if self.grid is not None:
+            cells = [self.grid.cell(index) for index in cells]
+        self.solution = (actions, cells)
+
+    def solve_contracted(self):
+        # A* على التقاطعات بس، وبعدين نرجع المسار خلية خلية
+        graph = self.contract()
+        solution = graph.astar(graph.grid.start, graph.grid.goal)
+        self.num_explored = graph.num_explored
+        self.explored = set()
+        if solution is None:
+            raise Exception("ما فيه حل")
+
+        actions, cells = solution
+        self.solution = (actions, [graph.grid.cell(index) for index in cells])
+
+    def solve_ida(self):
+        # IDA*: ما نخزن إلا المسار الحالي وجدول بحجم ثابت، بدل الـ frontier والـ explored
+        # num_re_expansions: كم خلية رجعنا وسعناها لأن الجدول نساها
+        grid = self.as_grid()
+        solver = IDAStar(grid, table_size(self.memory_budget_kb))
+        estimate = self.landmarks.estimate if self.landmarks is not None else None
+        on_expand = expansion_hook(self.stats)
+        if on_expand is not None:
+            hook, cell = on_expand, grid.cell
+            on_expand = lambda index, depth: hook(cell(index), depth)
+
+        solution = solver.search(grid.start, grid.goal, estimate, on_expand)
+        self.num_explored = solver.num_explored
+        self.num_re_expansions = solver.re_expansions
+        if self.stats is not None:
+            self.stats["re_expansions"] = solver.re_expansions
+            self.stats["iterations"] = solver.iterations
+            self.stats["table_overflows"] = solver.table_overflows
+        self.explored = set()
+        if solution is None:
+            raise Exception("ما فيه حل")
+
+        actions, cells = solution
+        self.solution = (actions, [grid.cell(index) for index in cells])
+
+    def solve_anytime(self):
+        # ARA*: أول مسار من weighted A* وبعدين نصغر epsilon لين يخلص الوقت
+        grid = self.as_grid()
+        solver = ARAStar(grid)
+        estimate = self.landmarks.estimate if self.landmarks is not None else None
+        on_expand = expansion_hook(self.stats)
+        if on_expand is not None:
+            hook, cell = on_expand, grid.cell
+            on_expand = lambda index, size: hook(cell(index), size)
+
+        solution = solver.search(grid.start, grid.goal, self.latency_budget_ms, estimate, on_expand)
+        self.num_explored = solver.num_explored
+        self.num_stale_pops = solver.stale_pops
+        self.queue = solver
+        self.solution_bound = solver.bound
+        if self.stats is not None:
+            self.stats["bound"] = solver.bound
+            self.stats["iterations"] = solver.iterations
+        self.explored = set()
+        if solution is None:
+            raise Exception("ما فيه حل")
+
+        actions, cells = solution
+        self.solution = (actions, [grid.cell(index) for index in cells])
+
+    def precompute_landmarks(self, k=4):
+        # مرحلة التحضير لـ ALT: نختار k نقاط ونخزن مسافات BFS من كل وحدة
+        self.landmarks = Landmarks.build(self.as_grid(), k)
+        return self.landmarks
+
+    def solve_between(self, start, goal, cache=None):
+        # أقصر مسار بين أي نقطتين (row, col)، مع PathCache اختياري للاستعلامات المتكررة
+        # نتأكد إن النقطتين داخل المتاهة، وإلا الرقم السالب يلف على المصفوفات المسطحة
+        for row, col in (start, goal):
+            if not (0 <= row < self.height and 0 <= col < self.width):
+                raise ValueError("cell is outside the maze")
+        grid = self.as_grid()
+        if self.key is None:
+            self.key = maze_key(grid)
+        if cache is not None:
+            try:
+                solution = cache.get(self.key, start, goal)
+            except KeyError:
+                pass
+            else:
+                if solution is None:
+                    raise Exception("ما فيه حل")
+                return solution
+
+        # نقطتين في مكونين مختلفين ما بينهم مسار، فنرفضهم بمقارنة labels بدل A* يعبي المكون كله
+        solution = None
+        if self.connected(start, goal):
+            if self.space is None:
+                self.space = SearchSpace(grid)
+            estimate = self.landmarks.estimate if self.landmarks is not None else None
+            if self.space.astar(grid.index(start), grid.index(goal), estimate=estimate):
+                actions, cells = self.space.path(grid.index(goal))
+                solution = (actions, [grid.cell(index) for index in cells])
+        if cache is not None:
+            cache.put(self.key, start, goal, solution)
+        if solution is None:
+            raise Exception("ما فيه حل")
+        return solution
+
+    def solve_compact(self):
+        # A* على مصفوفات parent/action/cost مخصصة مرة وحدة لكل Grid
+        if self.space is None:
+            self.space = SearchSpace(self.grid)
+        self.queue = self.space
+
+        # الـ hook ياخذ (row, col) مثل البحث العادي
+        on_expand = expansion_hook(self.stats)
+        if on_expand is not None:
+            hook, cell = on_expand, self.grid.cell
+            on_expand = lambda index, frontier_size: hook(cell(index), frontier_size)
+
+        estimate = self.landmarks.estimate if self.landmarks is not None else None
+        found = self.space.astar(self.grid.start, self.grid.goal, estimate=estimate, on_expand=on_expand)
+        self.num_explored = self.space.num_explored
+        self.num_stale_pops = self.space.stale_pops
+        self.explored = {self.grid.cell(index) for index in self.space.explored_cells}
+        if not found:
+            raise Exception("ما فيه حل")
+
+        # نرجع المسار من الهدف عن طريق مصفوفة parent
+        with phase(self.stats, "reconstruct"):
+            actions, cells = self.space.path(self.grid.goal)
+            self.solution = (actions, [self.grid.cell(index) for index in cells])
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python AstarMaze.py maze.txt")
+
+    m = Maze(sys.argv[1])
+    print("Maze:")
+    m.print()
+    print("Solving...")
+    m.solve()
+    print("States Explored:", m.num_explored)
+    print("Solution:")
+    m.print()
+    m.output_image("maze_astar.png", show_explored=True)
+
+
+if __name__ == "__main__":
+    main()
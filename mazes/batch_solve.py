@@ -0,0 +1,96 @@
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .grid import Grid
+from .search import SearchSpace
+
+ALGORITHMS = ("astar", "dijkstra")
+
+
+def maze_files(patterns):
+    """Expands directories (to their *.txt files) and glob patterns, sorted."""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(glob.glob(os.path.join(pattern, "*.txt")))
+        else:
+            files.extend(glob.glob(pattern))
+    return sorted(set(files))
+
+
+def solve_file(filename, algorithms=ALGORITHMS):
+    """
+    Parses one maze and solves it with each algorithm. Returns a list of
+    (file, algorithm, explored, cost, seconds) rows; cost is None if the
+    maze has no solution, and a parse error yields a single row with the
+    error message in place of the algorithm.
+    """
+    try:
+        grid = Grid.from_file(filename)
+    except Exception as e:
+        return [(filename, f"error: {e}", 0, None, 0.0)]
+
+    space = SearchSpace(grid)
+    rows = []
+    for algorithm in algorithms:
+        start = time.perf_counter()
+        found = space.astar(grid.start, grid.goal, use_heuristic=algorithm == "astar")
+        elapsed = time.perf_counter() - start
+        cost = space.cost[grid.goal] if found else None
+        rows.append((filename, algorithm, space.num_explored, cost, elapsed))
+    return rows
+
+
+def solve_chunk(filenames, algorithms=ALGORITHMS):
+    rows = []
+    for filename in filenames:
+        rows.extend(solve_file(filename, algorithms))
+    return rows
+
+
+def solve_batch(filenames, workers=None, chunk_size=16, algorithms=ALGORITHMS):
+    """
+    Parses and solves mazes across a process pool, yielding result rows
+    as each chunk of chunk_size files finishes (not in input order).
+    workers=1 solves in this process without a pool.
+    """
+    chunks = [filenames[i:i + chunk_size] for i in range(0, len(filenames), chunk_size)]
+    if workers == 1:
+        for chunk in chunks:
+            yield from solve_chunk(chunk, algorithms)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_chunk, chunk, algorithms) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve many maze files in parallel and stream one row per (file, algorithm)."
+    )
+    parser.add_argument("paths", nargs="+", help="maze files, directories or glob patterns")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="files per task sent to a worker")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    args = parser.parse_args()
+
+    filenames = maze_files(args.paths)
+    if not filenames:
+        sys.exit("no maze files found")
+
+    print("file\talgorithm\texplored\tcost\tseconds", flush=True)
+    for filename, algorithm, explored, cost, elapsed in solve_batch(
+        filenames, args.workers, args.chunk_size, tuple(args.algorithms)
+    ):
+        cost = "-" if cost is None else cost
+        print(f"{filename}\t{algorithm}\t{explored}\t{cost}\t{elapsed:.6f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
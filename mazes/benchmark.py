@@ -0,0 +1,273 @@
+import argparse
+import csv
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .grid import Grid
+from .heuristic_search import (
+    a_star_search,
+    euclidean_distance,
+    generate_maze,
+    greedy_best_first_search,
+    hpa_star_search,
+    ida_star_search,
+    jump_point_search,
+    manhattan_distance,
+)
+from .landmarks import Landmarks
+
+ALGORITHMS = {
+    "A*": a_star_search,
+    "Greedy BFS": greedy_best_first_search,
+    "JPS": jump_point_search,
+    # Builds its cluster abstraction on the first call per maze and
+    # reuses it, so with --warmup 1 or more only queries are timed
+    "HPA*": hpa_star_search,
+    # Memory-bounded: re_expansions counts the cost of its capped table
+    "IDA*": ida_star_search,
+}
+
+# "ALT" is also accepted; its landmarks are built once per maze
+HEURISTICS = {
+    "Manhattan": manhattan_distance,
+    "Euclidean": euclidean_distance,
+}
+
+PRESETS = {
+    "quick": {"sizes": [30, 100, 300], "densities": [0.2, 0.3]},
+    "full": {"sizes": [30, 100, 500, 1000, 2000, 4000], "densities": [0.1, 0.2, 0.3, 0.4]},
+}
+
+METRICS = ("nodes_expanded", "pushes", "peak_frontier", "re_expansions", "time_ms", "peak_memory_kb")
+
+# Metrics compared by --compare; counts are deterministic, so any growth
+# in them is a real change, while time and memory get the threshold
+COMPARED = ("nodes_expanded", "time_ms", "peak_memory_kb")
+
+
+def corpus(sizes, densities, seeds):
+    """
+    Yields (size, density, seed, maze) for every combination. Each maze
+    has its own RNG seeded from its parameters, so the same maze is
+    generated whatever else is in the corpus and across runs.
+    """
+    for size in sizes:
+        for density in densities:
+            for seed in range(seeds):
+                rng = random.Random(f"{size}:{density}:{seed}")
+                yield size, density, seed, generate_maze(size, density, rng)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(algorithm, maze, heuristic, warmup, repeats):
+    """
+    Runs algorithm warmup times untimed, then repeats times timed with
+    perf_counter_ns, then once more under tracemalloc for peak memory
+    (kept separate because tracing slows the run down).
+    Returns (path_cost, {metric: [value per run]}).
+    """
+    for _ in range(warmup):
+        algorithm(maze, heuristic)
+
+    samples = {metric: [] for metric in METRICS}
+    path_cost = None
+    for _ in range(repeats):
+        stats = {}
+        began = time.perf_counter_ns()
+        nodes_expanded, path_cost, _ = algorithm(maze, heuristic, stats)
+        elapsed = time.perf_counter_ns() - began
+        samples["nodes_expanded"].append(nodes_expanded)
+        samples["pushes"].append(stats.get("pushes", 0))
+        samples["peak_frontier"].append(stats.get("peak_frontier", 0))
+        samples["re_expansions"].append(stats.get("re_expansions", 0))
+        samples["time_ms"].append(elapsed / 1e6)
+
+    tracemalloc.start()
+    try:
+        algorithm(maze, heuristic)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    samples["peak_memory_kb"] = [peak / 1024] * repeats
+    return path_cost, samples
+
+
+def run(sizes, densities, seeds, algorithms, heuristics, warmup, repeats, progress=None):
+    records = []
+    for size, density, seed, maze in corpus(sizes, densities, seeds):
+        maze_heuristics = {name: HEURISTICS[name] for name in heuristics if name != "ALT"}
+        if "ALT" in heuristics:
+            grid = Grid.from_walls(maze, (0, 0), (size - 1, size - 1))
+            maze_heuristics["ALT"] = Landmarks.build(grid).heuristic
+
+        for heuristic_name, heuristic in maze_heuristics.items():
+            # A* costs are optimal; other algorithms' paths are compared to them
+            optimal = None
+            for algorithm_name in algorithms:
+                path_cost, samples = measure(ALGORITHMS[algorithm_name], maze, heuristic, warmup, repeats)
+                if algorithm_name == "A*":
+                    optimal = path_cost
+                record = {
+                    "size": size,
+                    "density": density,
+                    "seed": seed,
+                    "algorithm": algorithm_name,
+                    "heuristic": heuristic_name,
+                    "path_cost": None if path_cost == float("inf") else path_cost,
+                    "suboptimality": path_cost / optimal if optimal and path_cost != float("inf") else None,
+                    "metrics": {
+                        metric: {
+                            "median": statistics.median(values),
+                            "p95": percentile(values, 0.95),
+                        }
+                        for metric, values in samples.items()
+                    },
+                }
+                records.append(record)
+                if progress is not None:
+                    progress(record)
+    return records
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def case_key(record):
+    return (record["size"], record["density"], record["seed"], record["algorithm"], record["heuristic"])
+
+
+def write_csv(filename, records):
+    columns = ["size", "density", "seed", "algorithm", "heuristic", "path_cost", "suboptimality"]
+    columns += [f"{metric}_{stat}" for metric in METRICS for stat in ("median", "p95")]
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for record in records:
+            row = [record.get(column) for column in columns[:7]]
+            row += [record["metrics"][metric][stat] for metric in METRICS for stat in ("median", "p95")]
+            writer.writerow(row)
+
+
+def compare(records, baseline, threshold):
+    """
+    Prints how each case's medians moved against a baseline run and
+    returns the number of regressions: a changed path cost, or a
+    compared metric that grew by more than threshold (a fraction).
+    """
+    previous = {case_key(record): record for record in baseline["records"]}
+    regressions = 0
+    print()
+    print(f"Compared with {baseline['environment'].get('commit') or 'baseline'} "
+          f"(threshold {threshold:.0%}):")
+    for record in records:
+        old = previous.get(case_key(record))
+        if old is None:
+            continue
+        label = "{} d={} s={} {}/{}".format(*case_key(record))
+        notes = []
+        if old["path_cost"] != record["path_cost"]:
+            notes.append(f"path cost {old['path_cost']} -> {record['path_cost']}")
+        for metric in COMPARED:
+            before = old["metrics"][metric]["median"]
+            after = record["metrics"][metric]["median"]
+            if before and after > before * (1 + threshold):
+                notes.append(f"{metric} {before:.4g} -> {after:.4g} (+{after / before - 1:.0%})")
+        if notes:
+            regressions += 1
+            print(f"  REGRESSION {label}: " + "; ".join(notes))
+    if not regressions:
+        print("  no regressions")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reproducible heuristic-search benchmark over seeded maze corpora."
+    )
+    parser.add_argument("--preset", choices=PRESETS, default="quick")
+    parser.add_argument("--sizes", nargs="+", type=int, help="override the preset's maze sizes")
+    parser.add_argument("--densities", nargs="+", type=float, help="override the preset's obstacle densities")
+    parser.add_argument("--seeds", type=int, default=1, help="mazes per size and density")
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--heuristics", nargs="+", choices=list(HEURISTICS) + ["ALT"], default=list(HEURISTICS))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--compare", help="baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative growth before --compare reports a regression")
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    sizes = args.sizes or preset["sizes"]
+    densities = args.densities or preset["densities"]
+
+    def progress(record):
+        metrics = record["metrics"]
+        subopt = "-" if record["suboptimality"] is None else f"{record['suboptimality']:.3f}"
+        print(f"{record['size']:>6} {record['density']:>5} {record['seed']:>3} {record['algorithm']:>11} "
+              f"{record['heuristic']:>10} {str(record['path_cost']):>7} {subopt:>7} "
+              f"{metrics['nodes_expanded']['median']:>10.0f} {metrics['pushes']['median']:>10.0f} "
+              f"{metrics['peak_frontier']['median']:>9.0f} {metrics['re_expansions']['median']:>8.0f} "
+              f"{metrics['time_ms']['median']:>10.2f} "
+              f"{metrics['time_ms']['p95']:>10.2f} {metrics['peak_memory_kb']['median']:>10.0f}", flush=True)
+
+    print(f"{'size':>6} {'dens':>5} {'sd':>3} {'algorithm':>11} {'heuristic':>10} {'cost':>7} {'subopt':>7} "
+          f"{'expanded':>10} {'pushes':>10} {'frontier':>9} {'re-exp':>8} {'med ms':>10} {'p95 ms':>10} {'peak KB':>10}")
+    records = run(sizes, densities, args.seeds, args.algorithms, args.heuristics,
+                  args.warmup, args.repeats, progress)
+
+    results = {
+        "environment": environment(),
+        "config": {
+            "sizes": sizes,
+            "densities": densities,
+            "seeds": args.seeds,
+            "warmup": args.warmup,
+            "repeats": args.repeats,
+        },
+        "records": records,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.csv:
+        write_csv(args.csv, records)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(records, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import heapq
+from collections import deque
+
+OPPOSITE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+
+def join_paths(meet, forward_parents, backward_parents):
+    """
+    Builds (actions, cells) from start to goal through meet, given the
+    parent links of both searches. Parent links map a state to the
+    (state, action) it was reached from; the start and goal map to None.
+    """
+    actions = []
+    cells = []
+    state = meet
+    while forward_parents[state] is not None:
+        parent, action = forward_parents[state]
+        actions.append(action)
+        cells.append(state)
+        state = parent
+    actions.reverse()
+    cells.reverse()
+
+    # The backward search stored moves from the goal's side, so each one
+    # is walked in the opposite direction
+    state = meet
+    while backward_parents[state] is not None:
+        parent, action = backward_parents[state]
+        actions.append(OPPOSITE[action])
+        cells.append(parent)
+        state = parent
+    return actions, cells
+
+
+def bidirectional_bfs(start, goal, neighbors):
+    """
+    Breadth-first search from start and goal at the same time, always
+    growing the smaller frontier by one full layer. Once a layer touches
+    the other side, the best meeting point in that layer is optimal.
+
+    Returns (solution, explored_forward, explored_backward), where
+    solution is None if there is no path.
+    """
+    if start == goal:
+        return ([], []), set(), set()
+
+    parents = ({start: None}, {goal: None})
+    distances = ({start: 0}, {goal: 0})
+    frontiers = (deque([start]), deque([goal]))
+    explored = (set(), set())
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        other = 1 - side
+        frontier = frontiers[side]
+
+        best = None
+        for _ in range(len(frontier)):
+            state = frontier.popleft()
+            explored[side].add(state)
+            for action, neighbor in neighbors(state):
+                if neighbor in distances[other]:
+                    length = distances[side][state] + 1 + distances[other][neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, state, neighbor, action)
+                if neighbor not in parents[side]:
+                    parents[side][neighbor] = (state, action)
+                    distances[side][neighbor] = distances[side][state] + 1
+                    frontier.append(neighbor)
+
+        # Both maps were disjoint before this layer, so pointing the
+        # meeting state back at the best state of this layer is safe
+        if best is not None:
+            _, state, meet, action = best
+            parents[side][meet] = (state, action)
+            return join_paths(meet, parents[0], parents[1]), explored[0], explored[1]
+
+    return None, explored[0], explored[1]
+
+
+def bidirectional_astar(start, goal, neighbors, heuristic):
+    """
+    Bidirectional A* with heuristic(a, b) an admissible, consistent
+    estimate of the distance between a and b. Searches from both ends
+    until the best path found so far costs no more than the larger of
+    the two smallest open f-values, at which point no cheaper path can
+    remain.
+
+    Returns (solution, explored_forward, explored_backward), where
+    solution is None if there is no path.
+    """
+    targets = (goal, start)
+    g_scores = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    heaps = ([(heuristic(start, goal), start)], [(heuristic(goal, start), goal)])
+    explored = (set(), set())
+
+    best_cost = 0 if start == goal else float("inf")
+    meet = start if start == goal else None
+
+    while heaps[0] and heaps[1]:
+
+        # Drop heap entries for states that were already expanded
+        for side in (0, 1):
+            heap = heaps[side]
+            while heap and heap[0][1] in explored[side]:
+                heapq.heappop(heap)
+        if not heaps[0] or not heaps[1]:
+            break
+
+        # Stopping rule
+        if best_cost <= max(heaps[0][0][0], heaps[1][0][0]):
+            break
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        other = 1 - side
+        _, state = heapq.heappop(heaps[side])
+        explored[side].add(state)
+
+        for action, neighbor in neighbors(state):
+            if neighbor in explored[side]:
+                continue
+            tentative = g_scores[side][state] + 1
+            if neighbor not in g_scores[side] or tentative < g_scores[side][neighbor]:
+                g_scores[side][neighbor] = tentative
+                parents[side][neighbor] = (state, action)
+                heapq.heappush(heaps[side], (tentative + heuristic(neighbor, targets[side]), neighbor))
+                if neighbor in g_scores[other] and tentative + g_scores[other][neighbor] < best_cost:
+                    best_cost = tentative + g_scores[other][neighbor]
+                    meet = neighbor
+
+    if meet is None:
+        return None, explored[0], explored[1]
+    return join_paths(meet, parents[0], parents[1]), explored[0], explored[1]
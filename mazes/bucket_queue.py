@@ -0,0 +1,100 @@
+import heapq
+
+
+class BucketQueue():
+    """
+    Priority queue for small non-negative integer priorities (Dial's
+    algorithm): one bucket per priority value and a cursor at the lowest
+    bucket that may be non-empty, so add and pop are O(1) amortized
+    instead of O(log n).
+
+    Items are identified by a key. Adding a key that is already queued
+    replaces it (decrease-key); the old entry stays in its bucket and is
+    skipped as stale when it comes up, which stale_pops counts.
+    """
+
+    def __init__(self):
+        self.buckets = []
+        self.cursor = 0
+        self.live = {}
+        self.peak = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+
+    def add(self, key, priority, item=None):
+        if priority < 0:
+            raise Exception("bucket queue priorities must be non-negative")
+        while len(self.buckets) <= priority:
+            self.buckets.append([])
+        entry = (priority, key, item)
+        self.buckets[priority].append(entry)
+        self.live[key] = entry
+        self.pushes += 1
+        if len(self.live) > self.peak:
+            self.peak = len(self.live)
+        if priority < self.cursor:
+            self.cursor = priority
+
+    def get(self, key):
+        """Returns the (priority, key, item) entry queued for key, or None."""
+        return self.live.get(key)
+
+    def __contains__(self, key):
+        return key in self.live
+
+    def __len__(self):
+        return len(self.live)
+
+    def empty(self):
+        return len(self.live) == 0
+
+    def pop(self):
+        """Removes and returns the lowest-priority (priority, key, item)."""
+        if self.empty():
+            raise Exception("empty frontier")
+        buckets = self.buckets
+        while True:
+            bucket = buckets[self.cursor]
+            while bucket:
+                entry = bucket.pop()
+                if self.live.get(entry[1]) is entry:
+                    del self.live[entry[1]]
+                    self.pops += 1
+                    return entry
+                self.stale_pops += 1
+            self.cursor += 1
+
+
+class HeapQueue(BucketQueue):
+    """
+    Same interface and lazy-deletion bookkeeping as BucketQueue, backed
+    by heapq for priorities that are not small integers (for example
+    Euclidean distances).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.heap = []
+        self.counter = 0
+
+    def add(self, key, priority, item=None):
+        # The counter breaks priority ties without comparing keys or items
+        entry = (priority, key, item)
+        heapq.heappush(self.heap, (priority, self.counter, entry))
+        self.counter += 1
+        self.live[key] = entry
+        self.pushes += 1
+        if len(self.live) > self.peak:
+            self.peak = len(self.live)
+
+    def pop(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        while True:
+            entry = heapq.heappop(self.heap)[2]
+            if self.live.get(entry[1]) is entry:
+                del self.live[entry[1]]
+                self.pops += 1
+                return entry
+            self.stale_pops += 1
@@ -0,0 +1,96 @@
+import argparse
+import sys
+
+# --mode name: (module holding the Maze class, mode passed to Maze.solve).
+# The A* modes are the default family; the breadth-first mazes.maze modes
+# that share a name with one of them get a "bfs-" prefix
+MODES = {
+    "astar": ("astar_maze", "astar"),
+    "bidirectional": ("astar_maze", "bidirectional"),
+    "contracted": ("astar_maze", "contracted"),
+    "ida": ("astar_maze", "ida"),
+    "anytime": ("astar_maze", "anytime"),
+    "bfs": ("maze", "bfs"),
+    "bfs-bidirectional": ("maze", "bidirectional"),
+    "bfs-contracted": ("maze", "contracted"),
+    "incremental": ("maze", "incremental"),
+}
+
+# Subcommands handed to another module's main(), imported only when used
+TOOLS = {
+    "serve": "solve_service",
+    "batch": "batch_solve",
+    "bench": "benchmark",
+    "startup": "startup_benchmark",
+    "report": "report",
+}
+
+
+def run_tool(name, argv):
+    """Runs a TOOLS module as if it had been started as `python -m mazes.<module> argv...`."""
+    import importlib
+
+    sys.argv = [f"{sys.argv[0]} {name}"] + argv
+    importlib.import_module(f".{TOOLS[name]}", __package__).main()
+
+
+def solve(args):
+    import importlib
+
+    from .search_stats import SearchStats
+
+    module, mode = MODES[args.mode]
+    stats = SearchStats() if args.time else None
+    m = importlib.import_module(f".{module}", __package__).Maze(args.maze, compact=args.compact, stats=stats)
+    if args.budget_ms is not None:
+        m.latency_budget_ms = args.budget_ms
+    if args.memory_kb is not None:
+        m.memory_budget_kb = args.memory_kb
+
+    if not args.quiet:
+        print("Maze:")
+        m.print()
+        print("Solving...")
+    try:
+        m.solve(mode)
+    except Exception as e:
+        sys.exit(str(e))
+
+    if args.quiet:
+        print(f"cost {len(m.solution[0])} explored {m.num_explored}")
+    else:
+        print("States Explored:", m.num_explored)
+        print("Solution:")
+        m.print()
+
+    # Only rendering pulls in NumPy and PIL
+    if args.image is not None:
+        m.output_image(args.image, show_explored=args.explored)
+
+    if stats is not None:
+        for name, seconds in stats["phases"].items():
+            print(f"{name:>12} {seconds * 1000:9.2f} ms", file=sys.stderr)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in TOOLS:
+        return run_tool(argv[0], argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description="Solve a maze file. Other tools run as subcommands: " + ", ".join(TOOLS) + "."
+    )
+    parser.add_argument("maze", help="maze file (.txt or packed .mzb)")
+    parser.add_argument("--mode", choices=MODES, default="astar")
+    parser.add_argument("--compact", action="store_true", help="search the compact grid by cell index")
+    parser.add_argument("--image", help="also save the solved maze as this image")
+    parser.add_argument("--explored", action="store_true", help="shade explored cells in --image")
+    parser.add_argument("--budget-ms", type=float, default=None, help="time budget for --mode anytime")
+    parser.add_argument("--memory-kb", type=int, default=None, help="table budget for --mode ida")
+    parser.add_argument("--quiet", action="store_true", help="print only the path cost and explored count")
+    parser.add_argument("--time", action="store_true", help="print time per phase to stderr")
+    solve(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
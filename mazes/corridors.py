@@ -0,0 +1,180 @@
+import argparse
+import glob
+import re
+import time
+
+from .bucket_queue import BucketQueue
+from .grid import Grid
+from .search import SearchSpace
+
+# Number of open directions for each 4-bit neighbor mask
+DEGREE = bytes(bin(mask).count("1") for mask in range(16)) + bytes(240)
+
+# Masks with at most one open direction (dead ends and isolated cells)
+_DEAD_END = bytes(1 if mask < 16 and DEGREE[mask] <= 1 else 0 for mask in range(256))
+
+# Masks that are not plain corridor cells (any degree but two)
+_JUNCTION = bytes(1 if mask < 16 and DEGREE[mask] != 2 else 0 for mask in range(256))
+
+
+def fill_dead_ends(grid):
+    """
+    Returns (pruned, filled): a copy of grid in which every dead end
+    except the start and goal has been walled off, repeatedly, until none
+    are left, and the number of cells filled. A dead end is never on a
+    shortest path between two other cells, so paths are unchanged.
+    """
+    walls = bytearray(grid.walls)
+    degree = bytearray(bytes(grid.masks).translate(DEGREE))
+    keep = {grid.start, grid.goal}
+    moves, masks = grid.moves, grid.masks
+
+    dead = bytes(grid.masks).translate(_DEAD_END)
+    stack = [match.start() for match in re.finditer(b"\x01", dead) if not walls[match.start()]]
+    filled = 0
+    while stack:
+        index = stack.pop()
+        if walls[index] or index in keep:
+            continue
+        walls[index] = 1
+        filled += 1
+        for _, offset in moves[masks[index]]:
+            neighbor = index + offset
+            if not walls[neighbor]:
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1:
+                    stack.append(neighbor)
+    return Grid(grid.height, grid.width, walls, grid.start, grid.goal), filled
+
+
+class CorridorGraph():
+    """
+    A grid contracted to its junctions: every open cell that is not a
+    plain two-way corridor cell (plus the start and goal) becomes a node,
+    and every corridor between two nodes an edge weighted by its length,
+    with the actions and cells along it kept so that a path over the
+    graph expands back to the full cell-by-cell path.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        moves, masks, walls = grid.moves, grid.masks, grid.walls
+
+        is_node = bytearray(bytes(masks).translate(_JUNCTION))
+        for index in (grid.start, grid.goal):
+            is_node[index] = 1
+        self.nodes = [match.start() for match in re.finditer(b"\x01", is_node) if not walls[match.start()]]
+
+        # edges[node] lists (neighbor, length, actions, cells) for every
+        # corridor leaving node; cells run from the first step to neighbor
+        self.edges = {}
+        self.num_edges = 0
+        for node in self.nodes:
+            out = []
+            for action, offset in moves[masks[node]]:
+                actions = [action]
+                previous, current = node, node + offset
+                cells = [current]
+                while not is_node[current]:
+                    for action, offset in moves[masks[current]]:
+                        if current + offset != previous:
+                            break
+                    previous, current = current, current + offset
+                    actions.append(action)
+                    cells.append(current)
+                if current != node:
+                    out.append((current, len(cells), actions, cells))
+            self.edges[node] = out
+            self.num_edges += len(out)
+        self.num_explored = 0
+
+    def astar(self, start, goal, use_heuristic=True):
+        """
+        Shortest path from start to goal (both nodes) over the weighted
+        graph, as (actions, cells) like the grid searches return, or None.
+        Manhattan distance stays admissible and consistent here, since no
+        corridor is shorter than the distance between its ends; without
+        the heuristic this is Dijkstra's algorithm.
+        """
+        distance = self.grid.manhattan if use_heuristic else (lambda a, b: 0)
+        queue = BucketQueue()
+        queue.add(start, distance(start, goal))
+        cost = {start: 0}
+        parent = {start: None}
+        self.num_explored = 0
+        while not queue.empty():
+            _, node, _ = queue.pop()
+            self.num_explored += 1
+            if node == goal:
+                return self.expand(parent, goal)
+            for edge in self.edges[node]:
+                neighbor, length = edge[0], edge[1]
+                new_cost = cost[node] + length
+                if neighbor not in cost or new_cost < cost[neighbor]:
+                    cost[neighbor] = new_cost
+                    parent[neighbor] = (node, edge)
+                    queue.add(neighbor, new_cost + distance(neighbor, goal))
+        return None
+
+    def expand(self, parent, goal):
+        edges = []
+        node = goal
+        while parent[node] is not None:
+            node, edge = parent[node]
+            edges.append(edge)
+        actions = []
+        cells = []
+        for edge in reversed(edges):
+            actions.extend(edge[2])
+            cells.extend(edge[3])
+        return actions, cells
+
+
+def contract(grid):
+    """Dead-end filling followed by corridor contraction."""
+    pruned, _ = fill_dead_ends(grid)
+    return CorridorGraph(pruned)
+
+
+def report(filenames, repeats=20):
+    print(f"{'maze':<20} {'open':>7} {'filled':>7} {'nodes':>7} {'edges':>7} {'ratio':>7} "
+          f"{'prep ms':>8} {'grid ms':>8} {'graph ms':>8} {'speedup':>8}")
+    for filename in filenames:
+        grid = Grid.from_file(filename)
+        open_cells = grid.height * grid.width - sum(grid.walls)
+
+        began = time.perf_counter()
+        pruned, filled = fill_dead_ends(grid)
+        graph = CorridorGraph(pruned)
+        prep = time.perf_counter() - began
+
+        space = SearchSpace(grid)
+        began = time.perf_counter()
+        for _ in range(repeats):
+            found = space.astar(grid.start, grid.goal)
+        grid_time = (time.perf_counter() - began) / repeats
+
+        began = time.perf_counter()
+        for _ in range(repeats):
+            solution = graph.astar(grid.start, grid.goal)
+        graph_time = (time.perf_counter() - began) / repeats
+
+        if found != (solution is not None) or (found and len(solution[1]) != space.cost[grid.goal]):
+            raise Exception(f"{filename}: contracted path differs from the grid search")
+        print(f"{filename:<20} {open_cells:>7} {filled:>7} {len(graph.nodes):>7} {graph.num_edges // 2:>7} "
+              f"{open_cells / max(1, len(graph.nodes)):>7.1f} {prep * 1000:>8.2f} {grid_time * 1000:>8.3f} "
+              f"{graph_time * 1000:>8.3f} {grid_time / graph_time:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report dead-end filling and corridor contraction on maze files."
+    )
+    parser.add_argument("mazes", nargs="*", help="maze files (default: the bundled maze*.txt)")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    report(args.mazes or sorted(glob.glob("maze*.txt")), args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import os
+
+from . import maze
+from . import terminal
+from .frontier import Node, PriorityFrontier
+from .search import SearchSpace
+from .search_stats import expansion_hook, phase
+
+# كلاس المتاهة لقراءة وتحليل الملف
+# القراءة و neighbors و as_grid من maze.Maze، وهنا A* و Dijkstra وحلولهم لكل خوارزمية
+class Maze(maze.Maze):
+    # solve(mode) من maze.Maze: "astar" (الافتراضي) أو "dijkstra" (نفس البحث بدون heuristic)
+    MODES = ("astar", "dijkstra")
+
+    def __init__(self, filename, compact=False, stats=None):
+        # stats (اختياري): SearchStats من search_stats نعبي فيه العدادات وأوقات المراحل
+        super().__init__(filename, compact, stats)
+        self.solution_astar = None
+        self.solution_dijkstra = None
+
+    def print(self, solution=None, window=None, file=None, stream=False):
+        # نطبع المتاهة كنص واحد بكتابة وحدة، أو صف صف مع stream=True
+        # window=(top, left, height, width) لعرض جزء من متاهة كبيرة
+        terminal.write(self.walls, self.start, self.goal, solution, window, file, stream)
+
+    def heuristic(self, state):
+        if self.grid is not None:
+            return self.grid.manhattan(state, self.grid.goal)
+        return abs(state[0] - self.goal[0]) + abs(state[1] - self.goal[1])
+
+    # maze.Maze.solve يتحقق من الـ mode ويوقت البحث ويسجل العدادات، وهنا البحث نفسه
+    def search(self, mode):
+        self.num_explored = 0
+        self.num_stale_pops = 0
+
+        # إذا الهدف مو متصل بالبداية أصلاً، نوقف قبل لا نبحث
+        if not self.is_solvable():
+            self.explored = set()
+            raise Exception("no solution")
+
+        if self.grid is not None:
+            solution = self.solve_compact(mode)
+        else:
+            solution = self.solve_nodes(mode)
+        self.solution = solution
+        if mode == 'astar':
+            self.solution_astar = solution
+        else:
+            self.solution_dijkstra = solution
+
+    def solve_nodes(self, mode):
+        use_heuristic = mode == 'astar'
+        start = Node(state=self.start, parent=None, action=None, cost=0, heuristic=self.heuristic(self.start) if use_heuristic else 0)
+        frontier = PriorityFrontier()
+        frontier.add(start)
+        self.queue = frontier
+        on_expand = expansion_hook(self.stats)
+        self.explored = set()
+        while not frontier.empty():
+            node = frontier.remove()
+            self.num_explored += 1
+            self.num_stale_pops = frontier.stale_pops
+            if on_expand is not None:
+                on_expand(node.state, len(frontier))
+            if node.state == self.goal:
+                with phase(self.stats, "reconstruct"):
+                    actions, cells = [], []
+                    while node.parent is not None:
+                        actions.append(node.action)
+                        cells.append(node.state)
+                        node = node.parent
+                    actions.reverse()
+                    cells.reverse()
+                return actions, cells
+            self.explored.add(node.state)
+            for action, state in self.neighbors(node.state):
+                new_cost = node.cost + 1
+                heuristic_value = self.heuristic(state) if use_heuristic else 0
+                if state not in self.explored and not frontier.has_better(state, new_cost):
+                    child = Node(state=state, parent=node, action=action, cost=new_cost, heuristic=heuristic_value)
+                    frontier.add(child)
+        raise Exception("no solution")
+
+    # نفس البحث لكن على مصفوفات parent/action/cost مسطحة بدل كائنات Node
+    def solve_compact(self, mode):
+        if self.space is None:
+            self.space = SearchSpace(self.grid)
+        self.queue = self.space
+        on_expand = expansion_hook(self.stats)
+        if on_expand is not None:
+            hook, cell = on_expand, self.grid.cell
+            on_expand = lambda index, frontier_size: hook(cell(index), frontier_size)
+        found = self.space.astar(self.grid.start, self.grid.goal, use_heuristic=mode == 'astar', on_expand=on_expand)
+        self.num_explored = self.space.num_explored
+        self.num_stale_pops = self.space.stale_pops
+        self.explored = {self.grid.cell(index) for index in self.space.explored_cells}
+        if not found:
+            raise Exception("no solution")
+        with phase(self.stats, "reconstruct"):
+            actions, cells = self.space.path(self.grid.goal)
+            return actions, [self.grid.cell(index) for index in cells]
+
+# تشغيل الكود على جميع المتاهات
+def main():
+    maze_files = ["maze_30x30.txt", "maze_35x35.txt", "maze_40x40.txt"]
+
+    for maze_file in maze_files:
+        if os.path.exists(maze_file):
+            print(f"\n🔹 Processing: {maze_file}")
+            m = Maze(maze_file)
+            print("📌 Maze Layout:")
+            m.print()
+            for mode, label, icon in (("astar", "A*", "🔍"), ("dijkstra", "Dijkstra", "⚡")):
+                print(f"{icon} Solving with {label}...")
+                try:
+                    m.solve(mode)
+                except Exception as e:
+                    print(f"❌ {maze_file}: {e}")
+                    break
+                print(f"📊 States Explored ({label}):", m.num_explored)
+                m.print(m.solution[1])
+        else:
+            print(f"❌ Error: File {maze_file} not found.")
+
+
+if __name__ == "__main__":
+    main()
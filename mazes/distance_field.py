@@ -0,0 +1,158 @@
+import struct
+import sys
+import zlib
+from array import array
+
+UNREACHABLE = -1
+
+# File layout: magic, height, width, goal index, CRC32 of the wall
+# bytes, then one little-endian int32 distance per cell
+MAGIC = b"MZDF"
+HEADER = struct.Struct("<4sIIqI")
+
+
+class FieldFileError(Exception):
+    """A distance field file that is malformed or was saved for another maze or goal."""
+
+
+class DistanceField():
+    """
+    Shortest-path distance from every cell to one goal, stored as a flat
+    int32 array indexed like the Grid it was computed on (UNREACHABLE for
+    walls and cells cut off from the goal). Once built, the path from any
+    start is found by stepping to a neighbor one closer to the goal,
+    in O(path length).
+    """
+
+    def __init__(self, grid, goal, distances):
+        self.grid = grid
+        self.goal = goal
+        self.distances = distances
+
+    @classmethod
+    def compute(cls, grid, goal=None, vectorized=False):
+        """
+        Runs one reverse breadth-first search from goal (the grid's goal
+        by default). With vectorized=True the wavefront is expanded with
+        NumPy array shifts instead, one whole front per step, which is
+        faster on open grids and slower on long winding corridors.
+        """
+        if goal is None:
+            goal = grid.goal
+        if vectorized:
+            return cls(grid, goal, _wavefront_numpy(grid, goal))
+
+        size = grid.height * grid.width
+        distances = array("i", [UNREACHABLE]) * size
+        offsets = [tuple(offset for _, offset in moves) for moves in grid.moves]
+        masks = grid.masks
+
+        # Preallocated queue: every cell enters it at most once
+        queue = array("i", [0]) * size
+        queue[0] = goal
+        distances[goal] = 0
+        head, tail = 0, 1
+        while head < tail:
+            current = queue[head]
+            head += 1
+            next_distance = distances[current] + 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if distances[neighbor] == UNREACHABLE:
+                    distances[neighbor] = next_distance
+                    queue[tail] = neighbor
+                    tail += 1
+        return cls(grid, goal, distances)
+
+    def distance(self, index):
+        return self.distances[index]
+
+    def path_from(self, start):
+        """
+        Returns (actions, cells) from start to the goal by descending the
+        field, or None if the goal can't be reached from start.
+        """
+        distances = self.distances
+        if distances[start] == UNREACHABLE:
+            return None
+
+        actions = []
+        cells = []
+        current = start
+        while current != self.goal:
+            target = distances[current] - 1
+            for action, offset in self.grid.moves[self.grid.masks[current]]:
+                if distances[current + offset] == target:
+                    actions.append(action)
+                    current += offset
+                    cells.append(current)
+                    break
+            else:
+                raise Exception("distance field does not match the grid")
+        return actions, cells
+
+    def save(self, filename):
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.grid.height, self.grid.width, self.goal, _checksum(self.grid)))
+            distances = self.distances
+            if sys.byteorder == "big":
+                distances = array("i", distances)
+                distances.byteswap()
+            f.write(distances.tobytes())
+
+    @classmethod
+    def load(cls, filename, grid, goal=None):
+        """
+        Loads a field saved by save(); it must match the grid's walls and
+        goal (the grid's goal by default). Raises FieldFileError if not.
+        """
+        if goal is None:
+            goal = grid.goal
+        with open(filename, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise FieldFileError(f"{filename} is not a distance field file")
+            magic, height, width, saved_goal, checksum = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise FieldFileError(f"{filename} is not a distance field file")
+            if (height, width) != (grid.height, grid.width) or checksum != _checksum(grid):
+                raise FieldFileError(f"{filename} was computed for a different maze")
+            if saved_goal != goal:
+                raise FieldFileError(f"{filename} was computed for a different goal")
+            distances = array("i")
+            distances.frombytes(f.read())
+        if len(distances) != height * width:
+            raise FieldFileError(f"{filename} is truncated")
+        if sys.byteorder == "big":
+            distances.byteswap()
+        return cls(grid, goal, distances)
+
+
+def _checksum(grid):
+    return zlib.crc32(grid.walls)
+
+
+def _wavefront_numpy(grid, goal):
+    import numpy as np
+
+    is_open = np.frombuffer(bytes(grid.walls), dtype=np.uint8).reshape(grid.height, grid.width) == 0
+    distances = np.full((grid.height, grid.width), UNREACHABLE, dtype=np.int32)
+    front = np.zeros_like(is_open)
+    front[divmod(goal, grid.width)] = True
+    unvisited = is_open.copy()
+
+    distance = 0
+    while front.any():
+        distances[front] = distance
+        unvisited &= ~front
+
+        # Every cell next to the current front that is open and unvisited
+        grown = np.zeros_like(front)
+        grown[1:, :] |= front[:-1, :]
+        grown[:-1, :] |= front[1:, :]
+        grown[:, 1:] |= front[:, :-1]
+        grown[:, :-1] |= front[:, 1:]
+        front = grown & unvisited
+        distance += 1
+
+    return array("i", distances.astype(np.int32).tobytes())
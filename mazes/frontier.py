@@ -0,0 +1,131 @@
+from collections import deque
+
+from .bucket_queue import BucketQueue
+
+
+class Node():
+    # __slots__ instead of a per-node __dict__; cost and heuristic are
+    # only used by the priority frontier
+    __slots__ = ("state", "parent", "action", "cost", "heuristic")
+
+    def __init__(self, state, parent, action, cost=0, heuristic=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.cost = cost
+        self.heuristic = heuristic
+
+    def total_cost(self):
+        return self.cost + self.heuristic
+
+    def __lt__(self, other):
+        return self.total_cost() < other.total_cost()
+
+
+class StackFrontier():
+    def __init__(self):
+        self.frontier = []
+
+        # Companion set of the states currently in the frontier, so
+        # membership checks don't have to scan every node
+        self.states = set()
+
+        # Counters in the same names as BucketQueue's, for search_stats
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.peak = 0
+
+    def add(self, node):
+        self.frontier.append(node)
+        self.states.add(node.state)
+        self.pushes += 1
+        if len(self.frontier) > self.peak:
+            self.peak = len(self.frontier)
+
+    def contains_state(self, state):
+        return state in self.states
+
+    def empty(self):
+        return len(self.frontier) == 0
+
+    def __len__(self):
+        return len(self.frontier)
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        else:
+            node = self.frontier.pop()
+            self.states.discard(node.state)
+            self.pops += 1
+            return node
+
+
+class QueueFrontier(StackFrontier):
+    def __init__(self):
+        super().__init__()
+        self.frontier = deque()
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        else:
+            node = self.frontier.popleft()
+            self.states.discard(node.state)
+            self.pops += 1
+            return node
+
+
+class PriorityFrontier():
+    """
+    Frontier for A* and Dijkstra's algorithm: removes the node with the
+    lowest total_cost(). Costs are small integers, so it is a
+    BucketQueue keyed by state holding at most one live node per state.
+    Adding a node whose state is already queued at the same or a lower
+    cost is a no-op; a cheaper one replaces it (decrease-key).
+    """
+
+    def __init__(self):
+        self.frontier = BucketQueue()
+
+    def add(self, node):
+        if self.has_better(node.state, node.cost):
+            return
+        self.frontier.add(node.state, node.total_cost(), node)
+
+    def contains_state(self, state):
+        return state in self.frontier
+
+    def has_better(self, state, cost):
+        """Whether state is queued with a cost no higher than cost."""
+        entry = self.frontier.get(state)
+        return entry is not None and entry[2].cost <= cost
+
+    def empty(self):
+        return self.frontier.empty()
+
+    def __len__(self):
+        return len(self.frontier)
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        return self.frontier.pop()[2]
+
+    # Counters in the same names as the other frontiers, for search_stats
+    @property
+    def pushes(self):
+        return self.frontier.pushes
+
+    @property
+    def pops(self):
+        return self.frontier.pops
+
+    @property
+    def stale_pops(self):
+        return self.frontier.stale_pops
+
+    @property
+    def peak(self):
+        return self.frontier.peak
@@ -0,0 +1,97 @@
+import argparse
+import os
+import tempfile
+import time
+
+from . import maze
+from .frontier import QueueFrontier
+
+
+# The list-backed frontier maze.py used before frontier.py, kept here
+# so the two can be timed side by side
+class LegacyQueueFrontier():
+    def __init__(self):
+        self.frontier = []
+
+    def add(self, node):
+        self.frontier.append(node)
+
+    def contains_state(self, state):
+        return any(node.state == state for node in self.frontier)
+
+    def empty(self):
+        return len(self.frontier) == 0
+
+    def __len__(self):
+        return len(self.frontier)
+
+    def remove(self):
+        if self.empty():
+            raise Exception("empty frontier")
+        else:
+            node = self.frontier[0]
+            self.frontier = self.frontier[1:]
+            return node
+
+
+def peak_tracking(frontier_class):
+    """Returns a subclass of frontier_class that records its peak size."""
+
+    class Tracked(frontier_class):
+        peak = 0
+
+        def add(self, node):
+            super().add(node)
+            if len(self) > Tracked.peak:
+                Tracked.peak = len(self)
+
+    return Tracked
+
+
+def write_open_maze(directory, size):
+    """Writes a wall-free size x size maze with A and B in opposite corners."""
+    rows = [[" "] * size for _ in range(size)]
+    rows[0][0] = "A"
+    rows[size - 1][size - 1] = "B"
+    filename = os.path.join(directory, f"open_{size}.txt")
+    with open(filename, "w") as f:
+        f.write("\n".join("".join(row) for row in rows))
+    return filename
+
+
+def time_solve(filename, frontier_class):
+    tracked = peak_tracking(frontier_class)
+    maze.QueueFrontier = tracked
+    try:
+        m = maze.Maze(filename)
+        start = time.perf_counter()
+        m.solve()
+        elapsed = time.perf_counter() - start
+    finally:
+        maze.QueueFrontier = QueueFrontier
+    return m.num_explored, tracked.peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time Maze.solve on open-floor mazes of growing frontier width."
+    )
+    parser.add_argument("sizes", nargs="*", type=int, default=[25, 50, 100, 200, 400])
+    parser.add_argument("--legacy-limit", type=int, default=200,
+                        help="largest size to run with the legacy list frontier")
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'explored':>10} {'peak frontier':>14} {'deque (s)':>10} {'legacy (s)':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            filename = write_open_maze(directory, size)
+            explored, peak, elapsed = time_solve(filename, QueueFrontier)
+            if size <= args.legacy_limit:
+                legacy = f"{time_solve(filename, LegacyQueueFrontier)[2]:>11.3f}"
+            else:
+                legacy = f"{'-':>11}"
+            print(f"{size:>6} {explored:>10} {peak:>14} {elapsed:>10.3f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+
+
+class _WallTable(dict):
+    """str.translate table: open cells map to 0, anything else to 1."""
+
+    def __missing__(self, key):
+        return 1
+
+
+OPEN_CHARS = _WallTable({ord(" "): 0, ord("A"): 0, ord("B"): 0})
+
+# The same mapping as a bytes.translate table, for ASCII lines read from disk
+OPEN_BYTES = bytes(0 if chr(byte) in " AB" else 1 for byte in range(256))
+
+# Read buffer for streaming text mazes, and how many cells compute_masks
+# handles per band of rows
+BUFFER_SIZE = 1 << 20
+BAND_CELLS = 1 << 20
+
+# Start and goal characters for lines kept as bytes or decoded to str
+_MARKS = {bytes: (b"A", b"B"), str: ("A", "B")}
+
+
+class Grid():
+    """
+    Compact maze grid: one byte per cell in a flat row-major bytearray
+    (1 = wall), plus a 4-bit mask per cell of the directions that lead
+    to an open neighbor. Cells are addressed by integer index
+    row * width + col.
+    """
+
+    def __init__(self, height, width, walls, start=None, goal=None, source=None):
+        if walls is None and source is None:
+            raise Exception("grid needs a wall buffer or a packed source")
+        if walls is not None and len(walls) != height * width:
+            raise Exception("wall buffer does not match grid dimensions")
+        self.height = height
+        self.width = width
+        self.start = start
+        self.goal = goal
+
+        # A packed_maze.PackedMaze whose mapped bits back this grid until
+        # walls or masks are first used (see __getattr__)
+        self.source = source
+
+        # Offsets to add to an index to move one step in each direction
+        self.offsets = {"up": -width, "down": width, "left": -1, "right": 1}
+
+        # For every possible mask, the (action, offset) moves it allows
+        self.moves = []
+        for mask in range(16):
+            self.moves.append(tuple(
+                (action, offset) for action, offset, bit in (
+                    ("up", -width, UP),
+                    ("down", width, DOWN),
+                    ("left", -1, LEFT),
+                    ("right", 1, RIGHT)
+                ) if mask & bit
+            ))
+
+        if walls is not None:
+            self.walls = walls
+            self.compute_masks()
+
+    def __getattr__(self, name):
+        # Only called for attributes not set yet: a grid over a packed
+        # file unpacks its walls and computes its masks on first use, and
+        # from then on they are plain attributes
+        if name in ("walls", "masks") and self.__dict__.get("source") is not None:
+            self.walls = self.source.unpack()
+            self.compute_masks()
+            return self.__dict__[name]
+        raise AttributeError(f"'Grid' object has no attribute '{name}'")
+
+    @property
+    def unpacked(self):
+        """False while a packed grid is still read from its mapped file."""
+        return "walls" in self.__dict__
+
+    @classmethod
+    def from_file(cls, filename, packed=None):
+        """
+        Parses a text maze in two streaming passes over the file, so only
+        one read buffer and the grid itself are ever in memory. The first
+        pass finds the dimensions and the start and goal, validating as
+        it goes; the second translates each line straight into its row of
+        a preallocated wall buffer, padding short lines with open cells.
+
+        Packed binary mazes are opened with packed_maze.open_grid instead,
+        mapped rather than read. packed says whether filename is one, if
+        the caller has already checked; otherwise its header is read.
+        """
+        from . import packed_maze
+        if packed is None:
+            packed = packed_maze.is_packed(filename)
+        if packed:
+            return packed_maze.open_grid(filename)
+
+        height = width = 0
+        start = goal = None
+        with open(filename, "rb", buffering=BUFFER_SIZE) as f:
+            for line in f:
+                line = _line_text(line)
+                a, b = _MARKS[type(line)]
+                if a in line:
+                    if start is not None or line.count(a) > 1:
+                        raise Exception("maze must have exactly one start point")
+                    start = (height, line.index(a))
+                if b in line:
+                    if goal is not None or line.count(b) > 1:
+                        raise Exception("maze must have exactly one goal")
+                    goal = (height, line.index(b))
+                height += 1
+                width = max(width, len(line))
+        if start is None:
+            raise Exception("maze must have exactly one start point")
+        if goal is None:
+            raise Exception("maze must have exactly one goal")
+
+        walls = bytearray(height * width)
+        with open(filename, "rb", buffering=BUFFER_SIZE) as f:
+            for i, line in enumerate(f):
+                line = _line_text(line)
+                if isinstance(line, str):
+                    cells = line.translate(OPEN_CHARS).encode("latin-1")
+                else:
+                    cells = line.translate(OPEN_BYTES)
+                walls[i * width:i * width + len(cells)] = cells
+        return cls(height, width, walls, start[0] * width + start[1], goal[0] * width + goal[1])
+
+    @classmethod
+    def from_text(cls, contents):
+        if contents.count("A") != 1:
+            raise Exception("maze must have exactly one start point")
+        if contents.count("B") != 1:
+            raise Exception("maze must have exactly one goal")
+
+        lines = contents.splitlines()
+        height = len(lines)
+        width = max(len(line) for line in lines)
+
+        # Short lines are padded with open cells, as in Maze.__init__
+        walls = bytearray(height * width)
+        start = goal = None
+        for i, line in enumerate(lines):
+            walls[i * width:i * width + len(line)] = line.translate(OPEN_CHARS).encode("latin-1")
+            if start is None and "A" in line:
+                start = i * width + line.index("A")
+            if goal is None and "B" in line:
+                goal = i * width + line.index("B")
+        return cls(height, width, walls, start, goal)
+
+    @classmethod
+    def from_walls(cls, walls, start=None, goal=None):
+        """Builds a Grid from a list of rows of truthy/falsy wall flags."""
+        height = len(walls)
+        width = len(walls[0])
+        grid = cls(height, width, bytearray(1 if cell else 0 for row in walls for cell in row))
+        if start is not None:
+            grid.start = grid.index(start)
+        if goal is not None:
+            grid.goal = grid.index(goal)
+        return grid
+
+    def compute_masks(self):
+        """
+        Recomputes the open-direction mask of every cell, in bands of
+        about BAND_CELLS cells so the temporaries stay small on huge grids.
+        """
+        width = self.width
+        self.masks = bytearray(self.height * width)
+        if width == 0:
+            return
+        band = max(1, BAND_CELLS // width)
+        for top in range(0, self.height, band):
+            self._compute_band(top, min(self.height, top + band))
+
+    def _compute_band(self, top, bottom):
+        width = self.width
+
+        # Include the rows just above and below so the band's edge rows
+        # see their neighbors
+        first = max(0, top - 1)
+        last = min(self.height, bottom + 1)
+        rows = last - first
+
+        # Work on whole rows at once by treating the 0/1 open bytes as one
+        # big integer; shifting by 8 bits moves one cell, by 8 * width
+        # bits one row
+        walls = bytes(self.walls[first * width:last * width])
+        is_open = int.from_bytes(walls.translate(bytes([1, 0]) + bytes(254)), "little")
+        not_first = int.from_bytes((b"\x00" + b"\x01" * (width - 1)) * rows, "little")
+        not_last = int.from_bytes((b"\x01" * (width - 1) + b"\x00") * rows, "little")
+
+        up = is_open & (is_open << (8 * width))
+        down = is_open & (is_open >> (8 * width))
+        left = is_open & (is_open << 8) & not_first
+        right = is_open & (is_open >> 8) & not_last
+
+        masks = (up | (down << 1) | (left << 2) | (right << 3)).to_bytes(rows * width, "little")
+        skip = (top - first) * width
+        self.masks[top * width:bottom * width] = masks[skip:skip + (bottom - top) * width]
+
+    def index(self, cell):
+        return cell[0] * self.width + cell[1]
+
+    def cell(self, index):
+        return divmod(index, self.width)
+
+    def is_wall(self, index):
+        if not self.unpacked:
+            return self.source.is_wall(*divmod(index, self.width))
+        return self.walls[index] != 0
+
+    def set_wall(self, index, blocked=True):
+        """Blocks or clears one cell, updating its and its neighbors' masks."""
+        self.walls[index] = 1 if blocked else 0
+        row, col = divmod(index, self.width)
+        for r, c in ((row, col), (row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < self.height and 0 <= c < self.width:
+                self.masks[r * self.width + c] = self._mask(r, c)
+
+    def _mask(self, row, col):
+        index = row * self.width + col
+        if self.walls[index]:
+            return 0
+        mask = 0
+        if row > 0 and not self.walls[index - self.width]:
+            mask |= UP
+        if row < self.height - 1 and not self.walls[index + self.width]:
+            mask |= DOWN
+        if col > 0 and not self.walls[index - 1]:
+            mask |= LEFT
+        if col < self.width - 1 and not self.walls[index + 1]:
+            mask |= RIGHT
+        return mask
+
+    def rows(self):
+        """
+        Returns zero-copy per-row views usable as walls[row][col]; for a
+        packed grid not yet unpacked, rows read from the mapped file.
+        """
+        if not self.unpacked:
+            return self.source.rows()
+        view = memoryview(self.walls)
+        return [view[i * self.width:(i + 1) * self.width] for i in range(self.height)]
+
+    def neighbors(self, index):
+        return [(action, index + offset) for action, offset in self.moves[self.masks[index]]]
+
+    def manhattan(self, a, b):
+        row1, col1 = divmod(a, self.width)
+        row2, col2 = divmod(b, self.width)
+        return abs(row1 - row2) + abs(col1 - col2)
+
+
+def _line_text(line):
+    """
+    A line read from a maze file without its line ending: the bytes
+    themselves when ASCII, otherwise decoded, so every character is one cell.
+    """
+    line = line.rstrip(b"\r\n")
+    return line if line.isascii() else line.decode()
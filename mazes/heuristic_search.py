@@ -0,0 +1,311 @@
+import heapq
+import random
+import time
+
+from .bucket_queue import BucketQueue, HeapQueue
+from .grid import Grid
+from .reachability import is_reachable
+from .search_stats import SearchStats, expansion_hook, phase, record
+
+# دالة لإنشاء متاهة بحجم معين مع نسبة مئوية للعوائق، وضمان وجود مسار مفتوح
+# rng: مولد أرقام عشوائية (مثلاً random.Random(seed)) عشان نقدر نعيد نفس المتاهات
+# المتاهة تنبني مرة وحدة بـ NumPy مع مسار محفور مضمون، بدون إعادة المحاولة
+def generate_maze(size, obstacle_prob=0.3, rng=random):
+    from .maze_generator import random_maze
+    return random_maze(size, size, obstacle_prob, seed=rng.getrandbits(64)).tolist()
+
+# التحقق مما إذا كانت المتاهة قابلة للحل
+# بدل BFS خلية خلية، نعبي صفوف كاملة مرة وحدة على bitboard
+def is_solvable(maze, size):
+    grid = Grid.from_walls(maze, (0, 0), (size - 1, size - 1))
+    return is_reachable(grid, grid.start, grid.goal)
+
+# دالة حساب مسافة مانهاتن بين نقطتين
+
+def manhattan_distance(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+# دالة حساب المسافة الإقليدية بين نقطتين
+def euclidean_distance(a, b):
+    return ((a[0] - b[0])**2 + (a[1] - b[1])**2) ** 0.5
+
+# خوارزمية البحث A*
+# stats (اختياري): قاموس نرجع فيه عدد الإضافات للـ queue، أكبر حجم وصل له، وعدد العناصر القديمة اللي انشالت
+# أو SearchStats من search_stats: يضيف وقت كل مرحلة و hook لكل عقدة نوسعها (trace)
+def a_star_search(maze, heuristic, stats=None):
+    rows, cols = len(maze), len(maze[0])
+    start, goal = (0, 0), (rows - 1, cols - 1)
+
+    # مع مسافة مانهاتن كل قيم f أعداد صحيحة صغيرة، فنستخدم bucket queue بدل heapq
+    open_set = BucketQueue() if isinstance(heuristic(start, goal), int) else HeapQueue()
+    open_set.add(start, heuristic(start, goal))
+    came_from = {}
+    g_score = {start: 0}
+    f_score = {start: heuristic(start, goal)}
+    nodes_expanded = 0
+    on_expand = expansion_hook(stats)
+    start_time = time.time()
+
+    def result(path_cost):
+        elapsed = time.time() - start_time
+        record(stats, nodes_expanded, open_set)
+        if isinstance(stats, SearchStats):
+            stats.add_phase('solve', elapsed)
+        return nodes_expanded, path_cost, elapsed
+
+    while not open_set.empty():
+        _, current, _ = open_set.pop()
+        nodes_expanded += 1
+        if on_expand is not None:
+            on_expand(current, len(open_set))
+        
+        if current == goal:
+            return result(g_score[current])
+        
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and maze[neighbor[0]][neighbor[1]] == 0:
+                tentative_g_score = g_score[current] + 1
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
+                    open_set.add(neighbor, f_score[neighbor])  # إذا موجودة بتكلفة أعلى، القديمة تصير stale
+    
+    return result(float('inf'))
+
+# خوارزمية البحث Greedy Best-First Search
+def greedy_best_first_search(maze, heuristic, stats=None):
+    rows, cols = len(maze), len(maze[0])
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    open_set = []
+    heapq.heappush(open_set, (heuristic(start, goal), start))
+    came_from = {}
+    visited = set([start])
+    nodes_expanded = 0
+    pushes, peak_frontier = 1, 1
+    on_expand = expansion_hook(stats)
+    start_time = time.time()
+
+    def result(path_cost):
+        elapsed = time.time() - start_time
+        if stats is not None:
+            stats['nodes_expanded'] = nodes_expanded
+            stats['pushes'] = pushes
+            stats['pops'] = nodes_expanded
+            stats['peak_frontier'] = peak_frontier
+            stats['stale_pops'] = 0
+        if isinstance(stats, SearchStats):
+            stats.add_phase('solve', elapsed)
+        return nodes_expanded, path_cost, elapsed
+    
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        nodes_expanded += 1
+        if on_expand is not None:
+            on_expand(current, len(open_set))
+        
+        if current == goal:
+            # نحسب طول المسار بالرجوع من الهدف (مرحلة reconstruct)
+            with phase(stats, 'reconstruct'):
+                path_cost = 0
+                while current in came_from:
+                    path_cost += 1
+                    current = came_from[current]
+            return result(path_cost)
+        
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and maze[neighbor[0]][neighbor[1]] == 0 and neighbor not in visited:
+                visited.add(neighbor)
+                came_from[neighbor] = current
+                heapq.heappush(open_set, (heuristic(neighbor, goal), neighbor))
+                pushes += 1
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+    
+    return result(float('inf'))
+
+# خوارزمية Jump Point Search للشبكات رباعية الاتجاه بتكلفة موحدة
+# بدل ما نوسع كل خلية، نقفز بخط مستقيم لين نوصل نقطة قفز (jump point) ونضيفها للـ heap
+def jump_point_search(maze, heuristic, stats=None):
+    rows, cols = len(maze), len(maze[0])
+    start, goal = (0, 0), (rows - 1, cols - 1)
+
+    def walkable(r, c):
+        return 0 <= r < rows and 0 <= c < cols and maze[r][c] == 0
+
+    # قفز أفقي: نوقف عند الهدف أو عند جار إجباري فوق أو تحت
+    def jump_horizontal(r, c, dc):
+        while True:
+            c += dc
+            if not walkable(r, c):
+                return None
+            if (r, c) == goal:
+                return (r, c)
+            if (walkable(r - 1, c) and not walkable(r - 1, c - dc)) or (walkable(r + 1, c) and not walkable(r + 1, c - dc)):
+                return (r, c)
+
+    # قفز عمودي: نوقف عند الهدف أو جار إجباري، أو إذا القفز الأفقي من الخلية يلقى نقطة قفز
+    def jump_vertical(r, c, dr):
+        while True:
+            r += dr
+            if not walkable(r, c):
+                return None
+            if (r, c) == goal:
+                return (r, c)
+            if (walkable(r, c - 1) and not walkable(r - dr, c - 1)) or (walkable(r, c + 1) and not walkable(r - dr, c + 1)):
+                return (r, c)
+            if jump_horizontal(r, c, 1) is not None or jump_horizontal(r, c, -1) is not None:
+                return (r, c)
+
+    def jump(r, c, dr, dc):
+        return jump_horizontal(r, c, dc) if dc != 0 else jump_vertical(r, c, dr)
+
+    open_set = []
+    heapq.heappush(open_set, (heuristic(start, goal), 0, start))
+    came_from = {}
+    g_score = {start: 0}
+    nodes_expanded = 0
+    pushes, peak_frontier, stale_pops = 1, 1, 0
+    start_time = time.time()
+
+    def result(path_cost):
+        if stats is not None:
+            stats['pushes'] = pushes
+            stats['peak_frontier'] = peak_frontier
+            stats['stale_pops'] = stale_pops
+        return nodes_expanded, path_cost, time.time() - start_time
+
+    while open_set:
+        _, g, current = heapq.heappop(open_set)
+        if g > g_score[current]:
+            stale_pops += 1
+            continue  # نسخة قديمة في الـ heap لقينا لها مسار أقصر
+        nodes_expanded += 1
+
+        if current == goal:
+            return result(g)
+
+        # تقليم الاتجاهات: نكمل بنفس الاتجاه أو نلف يمين/يسار، وما نرجع للخلف
+        r, c = current
+        if current in came_from:
+            pr, pc = came_from[current]
+            dr, dc = (r > pr) - (r < pr), (c > pc) - (c < pc)
+            if dc != 0:
+                directions = [(-1, 0), (1, 0), (0, dc)]
+            else:
+                directions = [(0, -1), (0, 1), (dr, 0)]
+        else:
+            directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+        for dr, dc in directions:
+            jump_point = jump(r, c, dr, dc)
+            if jump_point is None:
+                continue
+            tentative_g_score = g + abs(jump_point[0] - r) + abs(jump_point[1] - c)
+            if jump_point not in g_score or tentative_g_score < g_score[jump_point]:
+                came_from[jump_point] = current
+                g_score[jump_point] = tentative_g_score
+                heapq.heappush(open_set, (tentative_g_score + heuristic(jump_point, goal), tentative_g_score, jump_point))
+                pushes += 1
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+
+    return result(float('inf'))
+
+# HPA*: نقسم المتاهة clusters ونبحث أول على graph المداخل بين الـ clusters،
+# وبعدين نفصّل المسار داخل كل cluster. المسار ممكن يطلع أطول شوي من الأمثل
+# التحضير غالي، فنحفظ الـ abstraction لآخر كم متاهة بالذاكرة، وعلى الديسك في ملف باسم hash محتوى المتاهة
+_hpa_cache = []
+
+def hpa_abstraction(maze, cluster_size=32, cache_dir=None):
+    from .hpa import Abstraction
+    for cached_maze, cached_size, abstraction in _hpa_cache:
+        if cached_maze is maze and cached_size == cluster_size:
+            return abstraction
+    rows, cols = len(maze), len(maze[0])
+    grid = Grid.from_walls(maze, (0, 0), (rows - 1, cols - 1))
+    # من الملف إذا نفس المتاهة انبنت قبل (حتى من process ثاني)، وإلا نبنيها ونحفظها
+    abstraction = Abstraction.cached(grid, cluster_size, cache_dir)
+    _hpa_cache.append((maze, cluster_size, abstraction))
+    del _hpa_cache[:-8]
+    return abstraction
+
+def hpa_star_search(maze, heuristic, stats=None):
+    abstraction = hpa_abstraction(maze)
+    grid = abstraction.grid
+    start_time = time.time()
+
+    # البحث على الـ graph بأرقام الخلايا، فنحوّلها لـ (row, col) قبل الـ heuristic
+    estimate = lambda a, b: heuristic(grid.cell(a), grid.cell(b))
+    solution = abstraction.find_path(grid.start, grid.goal, estimate)
+    nodes_expanded = abstraction.num_explored + abstraction.num_refined
+    if stats is not None:
+        stats['abstract_expanded'] = abstraction.num_explored
+        stats['refined'] = abstraction.num_refined
+    path_cost = len(solution[0]) if solution is not None else float('inf')
+    return nodes_expanded, path_cost, time.time() - start_time
+
+# IDA*: بحث بالعمق مع حد f يكبر كل دورة، والذاكرة محدودة بـ budget_kb لجدول الـ transpositions
+# لما الجدول يمتلي ننسى خلايا ونرجع نوسعها، و stats['re_expansions'] يقول كم مرة صار هذا
+def ida_star_search(maze, heuristic, stats=None, budget_kb=None):
+    from .ida_star import DEFAULT_BUDGET_KB, IDAStar, table_size
+    rows, cols = len(maze), len(maze[0])
+    grid = Grid.from_walls(maze, (0, 0), (rows - 1, cols - 1))
+    solver = IDAStar(grid, table_size(DEFAULT_BUDGET_KB if budget_kb is None else budget_kb))
+    start_time = time.time()
+
+    # مانهاتن نحسبها مباشرة على أرقام الخلايا، غيرها نحوّل لـ (row, col) أول
+    if heuristic is manhattan_distance:
+        estimate = grid.manhattan
+    else:
+        estimate = lambda a, b: heuristic(grid.cell(a), grid.cell(b))
+    on_expand = expansion_hook(stats)
+    if on_expand is not None:
+        hook = on_expand
+        on_expand = lambda index, depth: hook(grid.cell(index), depth)
+
+    solution = solver.search(grid.start, grid.goal, estimate, on_expand)
+    elapsed = time.time() - start_time
+    record(stats, solver.num_explored)
+    if stats is not None:
+        stats['re_expansions'] = solver.re_expansions
+        stats['iterations'] = solver.iterations
+        stats['table_overflows'] = solver.table_overflows
+    if isinstance(stats, SearchStats):
+        stats.add_phase('solve', elapsed)
+    path_cost = len(solution[0]) if solution is not None else float('inf')
+    return solver.num_explored, path_cost, elapsed
+
+# ARA*: weighted A* بـ epsilon كبير يعطي مسار بسرعة، وبعدين نصغر epsilon ونصلح نفس البحث لين يخلص الوقت
+# budget_ms: حد الوقت بالملي ثانية (None: نكمل لين المسار يصير أمثل)
+# stats['bound']: أقصى نسبة ممكنة بين طول المسار والمسار الأمثل، مثبتة من البحث نفسه
+def ara_star_search(maze, heuristic, stats=None, budget_ms=None, epsilon=None):
+    from .ara_star import DEFAULT_EPSILON, ARAStar
+    rows, cols = len(maze), len(maze[0])
+    grid = Grid.from_walls(maze, (0, 0), (rows - 1, cols - 1))
+    solver = ARAStar(grid, DEFAULT_EPSILON if epsilon is None else epsilon)
+    start_time = time.time()
+
+    # مانهاتن نحسبها مباشرة على أرقام الخلايا، غيرها نحوّل لـ (row, col) أول
+    if heuristic is manhattan_distance:
+        estimate = grid.manhattan
+    else:
+        estimate = lambda a, b: heuristic(grid.cell(a), grid.cell(b))
+    on_expand = expansion_hook(stats)
+    if on_expand is not None:
+        hook = on_expand
+        on_expand = lambda index, size: hook(grid.cell(index), size)
+
+    solution = solver.search(grid.start, grid.goal, budget_ms, estimate, on_expand)
+    elapsed = time.time() - start_time
+    record(stats, solver.num_explored, solver)
+    if stats is not None:
+        stats['bound'] = solver.bound
+        stats['epsilon'] = solver.solutions[-1][0] if solver.solutions else solver.epsilon
+        stats['iterations'] = solver.iterations
+    if isinstance(stats, SearchStats):
+        stats.add_phase('solve', elapsed)
+    path_cost = len(solution[0]) if solution is not None else float('inf')
+    return solver.num_explored, path_cost, elapsed
@@ -0,0 +1,389 @@
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from collections import deque
+
+from .bucket_queue import BucketQueue, HeapQueue
+from .grid import DOWN, LEFT, RIGHT, UP
+from .search import SearchSpace
+
+# Border runs of open cell pairs at least this long get an entrance at
+# each end instead of a single one in the middle
+LONG_ENTRANCE = 6
+
+# File layout: magic, height, width, cluster size, CRC32 of the wall
+# bytes, edge count, then (a, b, cost) int64 triples, one per edge
+MAGIC = b"MZHP"
+HEADER = struct.Struct("<4sIIIIq")
+EDGE = struct.Struct("<qqq")
+
+# Where Abstraction.cached keeps built abstractions, one file per maze
+# contents and cluster size
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "maze_hpa")
+
+
+class AbstractionFileError(Exception):
+    """An abstraction file that is malformed or was saved for another maze or cluster size."""
+
+
+class Abstraction():
+    """
+    Hierarchical path-finding (HPA*) abstraction of a Grid.
+
+    The grid is cut into cluster_size x cluster_size clusters. Where two
+    clusters share a border, each run of open cell pairs across it gets
+    one or two entrances: pairs of cells joined by a cost-1 edge. Inside
+    every cluster the distance between each pair of its entrance cells
+    is precomputed with a BFS that stays in the cluster. A query then
+    searches this small graph and only refines the chosen abstract
+    edges into cells, one cluster at a time, so it touches a fraction
+    of the grid at the price of paths that may be slightly longer than
+    optimal.
+    """
+
+    def __init__(self, grid, cluster_size, edges):
+        self.grid = grid
+        self.cluster_size = cluster_size
+
+        # edges[cell] maps each neighboring entrance cell to the edge cost
+        self.edges = edges
+        self.entrances = {}
+        for cell in edges:
+            self.entrances.setdefault(self.cluster(cell), []).append(cell)
+        self.num_explored = 0
+        self.num_refined = 0
+
+    @classmethod
+    def build(cls, grid, cluster_size=32):
+        edges = {}
+
+        def link(a, b, cost):
+            if cost < edges.setdefault(a, {}).get(b, cost + 1):
+                edges[a][b] = cost
+                edges.setdefault(b, {})[a] = cost
+
+        height, width, walls = grid.height, grid.width, grid.walls
+
+        # Entrances across horizontal borders, then vertical ones
+        for border in range(cluster_size, height, cluster_size):
+            for left in range(0, width, cluster_size):
+                pairs = [((border - 1) * width + col, border * width + col)
+                         for col in range(left, min(width, left + cluster_size))]
+                for a, b in _entrances(pairs, walls):
+                    link(a, b, 1)
+        for border in range(cluster_size, width, cluster_size):
+            for top in range(0, height, cluster_size):
+                pairs = [(row * width + border - 1, row * width + border)
+                         for row in range(top, min(height, top + cluster_size))]
+                for a, b in _entrances(pairs, walls):
+                    link(a, b, 1)
+
+        abstraction = cls(grid, cluster_size, edges)
+
+        # Intra-cluster edges: a BFS from every entrance, kept in its cluster
+        for cluster, cells in abstraction.entrances.items():
+            distances = _cluster_distances(grid, abstraction.bounds(cluster), cells)
+            for i, cell in enumerate(cells):
+                for j in range(i + 1, len(cells)):
+                    if distances[i][j] >= 0:
+                        link(cell, cells[j], distances[i][j])
+        return abstraction
+
+    def cluster(self, cell):
+        row, col = divmod(cell, self.grid.width)
+        return row // self.cluster_size, col // self.cluster_size
+
+    def bounds(self, cluster):
+        top, left = cluster[0] * self.cluster_size, cluster[1] * self.cluster_size
+        return top, left, min(self.grid.height, top + self.cluster_size), min(self.grid.width, left + self.cluster_size)
+
+    def local_search(self, source, target=None):
+        """
+        BFS from source that never leaves its cluster, stopping at target
+        if given. Returns (distances, parents) as dicts keyed by cell.
+        """
+        top, left, bottom, right = self.bounds(self.cluster(source))
+        width, moves, masks = self.grid.width, self.grid.moves, self.grid.masks
+        distances = {source: 0}
+        parents = {source: None}
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            self.num_refined += 1
+            if cell == target:
+                break
+            for action, offset in moves[masks[cell]]:
+                neighbor = cell + offset
+                if neighbor in distances:
+                    continue
+                row, col = divmod(neighbor, width)
+                if top <= row < bottom and left <= col < right:
+                    distances[neighbor] = distances[cell] + 1
+                    parents[neighbor] = (cell, action)
+                    queue.append(neighbor)
+        return distances, parents
+
+    def find_path(self, start, goal, estimate=None):
+        """
+        Returns (actions, cells) from start to goal like the grid
+        searches, or None. estimate(a, b) guides the abstract search
+        (Manhattan distance by default). num_explored counts abstract
+        nodes expanded, num_refined cells visited by local searches.
+        """
+        grid = self.grid
+        if estimate is None:
+            estimate = grid.manhattan
+        self.num_explored = 0
+        self.num_refined = 0
+
+        # Hook start and goal into the graph with temporary edges to the
+        # entrances of their clusters (and to each other if they share one)
+        extra = {}
+        for endpoint in (start, goal):
+            distances, _ = self.local_search(endpoint)
+            targets = list(self.entrances.get(self.cluster(endpoint), ()))
+            if endpoint == start and self.cluster(goal) == self.cluster(start):
+                targets.append(goal)
+            for cell in targets:
+                if cell in distances and cell != endpoint:
+                    extra.setdefault(endpoint, {})[cell] = distances[cell]
+                    extra.setdefault(cell, {})[endpoint] = distances[cell]
+
+        first = estimate(start, goal)
+        queue = BucketQueue() if isinstance(first, int) else HeapQueue()
+        queue.add(start, first)
+        cost = {start: 0}
+        parent = {start: None}
+        while not queue.empty():
+            _, node, _ = queue.pop()
+            self.num_explored += 1
+            if node == goal:
+                break
+            for edges in (self.edges.get(node), extra.get(node)):
+                for neighbor, length in (edges or {}).items():
+                    new_cost = cost[node] + length
+                    if neighbor not in cost or new_cost < cost[neighbor]:
+                        cost[neighbor] = new_cost
+                        parent[neighbor] = node
+                        queue.add(neighbor, new_cost + estimate(neighbor, goal))
+        else:
+            return None
+
+        waypoints = [goal]
+        while parent[waypoints[-1]] is not None:
+            waypoints.append(parent[waypoints[-1]])
+        waypoints.reverse()
+        return self.refine(waypoints)
+
+    def refine(self, waypoints):
+        """Expands consecutive abstract nodes into the cells between them."""
+        offsets = {offset: action for action, offset in self.grid.offsets.items()}
+        actions = []
+        cells = []
+        for a, b in zip(waypoints, waypoints[1:]):
+            if self.cluster(a) != self.cluster(b):
+                # An entrance edge: one step across the border
+                actions.append(offsets[b - a])
+                cells.append(b)
+                continue
+            _, parents = self.local_search(a, b)
+            steps = []
+            cell = b
+            while cell != a:
+                cell, action = parents[cell]
+                steps.append(action)
+            for action in reversed(steps):
+                cell += self.grid.offsets[action]
+                actions.append(action)
+                cells.append(cell)
+        return actions, cells
+
+    def save(self, filename):
+        triples = array("q")
+        count = 0
+        for a, neighbors in self.edges.items():
+            for b, length in neighbors.items():
+                if a < b:
+                    triples.extend((a, b, length))
+                    count += 1
+        if sys.byteorder == "big":
+            triples.byteswap()
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.grid.height, self.grid.width, self.cluster_size,
+                                _checksum(self.grid), count))
+            f.write(triples.tobytes())
+
+    @classmethod
+    def load(cls, filename, grid, cluster_size=None):
+        """
+        Loads an abstraction saved by save(); it must match the grid's
+        walls, and cluster_size if given. Raises AbstractionFileError if
+        not.
+        """
+        with open(filename, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise AbstractionFileError(f"{filename} is not an HPA* abstraction file")
+            magic, height, width, saved_size, checksum, count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise AbstractionFileError(f"{filename} is not an HPA* abstraction file")
+            if (height, width) != (grid.height, grid.width) or checksum != _checksum(grid):
+                raise AbstractionFileError(f"{filename} was built for a different maze")
+            if cluster_size is not None and saved_size != cluster_size:
+                raise AbstractionFileError(f"{filename} was built with {saved_size} cell clusters")
+            data = f.read()
+        if count < 0 or len(data) != count * EDGE.size:
+            raise AbstractionFileError(f"{filename} is truncated")
+        triples = array("q")
+        triples.frombytes(data)
+        if sys.byteorder == "big":
+            triples.byteswap()
+
+        edges = {}
+        for i in range(0, len(triples), 3):
+            a, b, length = triples[i], triples[i + 1], triples[i + 2]
+            edges.setdefault(a, {})[b] = length
+            edges.setdefault(b, {})[a] = length
+        return cls(grid, saved_size, edges)
+
+    @classmethod
+    def cached(cls, grid, cluster_size=32, directory=None):
+        """
+        The abstraction of grid, loaded from a file in directory
+        (CACHE_DIR by default) named after the maze's contents and
+        cluster_size, or built and saved there if there is no usable
+        file yet. The file is written under a temporary name and renamed,
+        so processes building the same maze at once never read half of it.
+        """
+        from .path_cache import maze_key
+
+        directory = CACHE_DIR if directory is None else directory
+        filename = os.path.join(directory, f"{maze_key(grid)}-{cluster_size}.hpa")
+        try:
+            return cls.load(filename, grid, cluster_size)
+        except (FileNotFoundError, AbstractionFileError):
+            pass
+
+        abstraction = cls.build(grid, cluster_size)
+        os.makedirs(directory, exist_ok=True)
+        partial = f"{filename}.{os.getpid()}.tmp"
+        abstraction.save(partial)
+        os.replace(partial, filename)
+        return abstraction
+
+
+def _entrances(pairs, walls):
+    """
+    Picks the entrance pairs among the (a, b) cell pairs along one
+    cluster border: the middle of each run of open pairs, or both ends
+    of a long run.
+    """
+    chosen = []
+    run = []
+    for a, b in pairs + [(None, None)]:
+        if a is not None and not walls[a] and not walls[b]:
+            run.append((a, b))
+            continue
+        if len(run) >= LONG_ENTRANCE:
+            chosen.extend((run[0], run[-1]))
+        elif run:
+            chosen.append(run[(len(run) - 1) // 2])
+        run = []
+    return chosen
+
+
+def _cluster_distances(grid, bounds, cells):
+    """
+    Distances between every pair of cells within one cluster (-1 when
+    the cluster cuts them off from each other), as a matrix. Neighbor
+    lists in cluster-local indices are built once and shared by the BFS
+    from each cell.
+    """
+    top, left, bottom, right = bounds
+    width, masks = grid.width, grid.masks
+    span = right - left
+    local_offsets = [
+        tuple(offset for bit, offset in ((UP, -span), (DOWN, span), (LEFT, -1), (RIGHT, 1)) if mask & bit)
+        for mask in range(16)
+    ]
+    edge_columns = {left: LEFT, right - 1: RIGHT}
+    if left == right - 1:
+        edge_columns[left] = LEFT | RIGHT
+
+    neighbors = []
+    for row in range(top, bottom):
+        clear = (UP if row == top else 0) | (DOWN if row == bottom - 1 else 0)
+        base = (row - top) * span - left
+        for col in range(left, right):
+            mask = masks[row * width + col] & ~(clear | edge_columns.get(col, 0))
+            local = base + col
+            neighbors.append([local + offset for offset in local_offsets[mask]])
+
+    targets = [(cell // width - top) * span + cell % width - left for cell in cells]
+    matrix = []
+    for source in targets:
+        distance = [-1] * len(neighbors)
+        distance[source] = 0
+        queue = [source]
+        for cell in queue:
+            step = distance[cell] + 1
+            for neighbor in neighbors[cell]:
+                if distance[neighbor] < 0:
+                    distance[neighbor] = step
+                    queue.append(neighbor)
+        matrix.append([distance[target] for target in targets])
+    return matrix
+
+
+def _checksum(grid):
+    return zlib.crc32(grid.walls)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare HPA* with flat A* on random mazes: preprocessing, query time and path suboptimality."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[500, 1000, 2000])
+    parser.add_argument("--obstacles", type=float, default=0.25)
+    parser.add_argument("--cluster-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from .maze_generator import random_maze, to_grid
+
+    print(f"{'size':>6} {'build s':>8} {'load s':>7} {'A* ms':>9} {'expanded':>9} {'HPA* ms':>9} {'abstract':>9} "
+          f"{'refined':>9} {'speedup':>8} {'A* cost':>8} {'HPA* cost':>9} {'subopt':>7}")
+    for size in args.sizes:
+        grid = to_grid(random_maze(size, size, args.obstacles, seed=args.seed))
+
+        # The first cached() call builds and saves, the second loads
+        with tempfile.TemporaryDirectory() as directory:
+            began = time.perf_counter()
+            Abstraction.cached(grid, args.cluster_size, directory)
+            build = time.perf_counter() - began
+            began = time.perf_counter()
+            abstraction = Abstraction.cached(grid, args.cluster_size, directory)
+            load = time.perf_counter() - began
+
+        space = SearchSpace(grid)
+        began = time.perf_counter()
+        space.astar(grid.start, grid.goal)
+        flat = time.perf_counter() - began
+
+        began = time.perf_counter()
+        actions, _ = abstraction.find_path(grid.start, grid.goal)
+        hierarchical = time.perf_counter() - began
+
+        optimal = space.cost[grid.goal]
+        print(f"{size:>6} {build:>8.2f} {load:>7.2f} {flat * 1000:>9.1f} {space.num_explored:>9} {hierarchical * 1000:>9.1f} "
+              f"{abstraction.num_explored:>9} {abstraction.num_refined:>9} {flat / hierarchical:>7.1f}x "
+              f"{optimal:>8} {len(actions):>9} {len(actions) / optimal:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import argparse
+import time
+import tracemalloc
+from array import array
+
+from .search import SearchSpace
+
+# Bytes per transposition table slot: cell, g and iteration stamp, plus
+# the cell and g last evicted from the slot, each an int32 in a
+# preallocated array
+ENTRY_BYTES = 20
+
+DEFAULT_BUDGET_KB = 64 * 1024
+
+
+def table_size(budget_kb):
+    return max(1, budget_kb * 1024 // ENTRY_BYTES)
+
+
+class IDAStar():
+    """
+    Iterative-deepening A* on a Grid with a bounded transposition table.
+
+    Each iteration is a depth-first search that cuts off paths whose
+    f = g + h exceeds the bound; the next bound is the smallest f that
+    was cut off, so the first path found is optimal for an admissible
+    heuristic. The DFS keeps only the current path on its stack. A
+    transposition table of at most max_entries cells remembers the best
+    g each cell was reached with in this iteration and prunes worse
+    arrivals. The table is a fixed array of slots indexed by cell modulo
+    its size, and a new cell always replaces whatever held its slot
+    (table_overflows counts those replacements); with a table as large
+    as the grid there is no replacement at all.
+
+    re_expansions counts the expansions the cap caused: a cell reached
+    again, no more cheaply than before, after it was evicted from its
+    slot, which a large enough table would have pruned. Each slot keeps
+    the cell it last evicted for this, so the count is exact while no
+    slot evicts two cells in one iteration and a lower bound after.
+    Expanding a cell again because it was reached more cheaply is
+    ordinary IDA* work and is not counted.
+
+    Memory is the table, allocated once at its full size, and the
+    current path (its cells, as a set for cycle checks, and their child
+    iterators), instead of the g, f and parent dicts and the open list
+    of A*. Nothing else is kept per cell.
+    """
+
+    def __init__(self, grid, max_entries=None):
+        self.grid = grid
+        if max_entries is None:
+            max_entries = table_size(DEFAULT_BUDGET_KB)
+        self.max_entries = min(max_entries, grid.height * grid.width)
+        self.keys = array("i", [-1]) * self.max_entries
+        self.costs = array("i", [0]) * self.max_entries
+        self.stamps = array("i", [0]) * self.max_entries
+        self.evicted_keys = array("i", [-1]) * self.max_entries
+        self.evicted_costs = array("i", [0]) * self.max_entries
+        self.neighbors = [tuple(offset for _, offset in moves) for moves in grid.moves]
+        self.num_explored = 0
+        self.re_expansions = 0
+        self.iterations = 0
+        self.table_overflows = 0
+
+    def search(self, start, goal, estimate=None, on_expand=None):
+        """
+        Returns (actions, cells) from start to goal like the grid
+        searches, or None. estimate(index, goal) replaces Manhattan
+        distance; on_expand(index, depth) is called per expansion.
+        """
+        grid = self.grid
+        if estimate is None:
+            estimate = grid.manhattan
+        masks, neighbors = grid.masks, self.neighbors
+        self.num_explored = 0
+        self.re_expansions = 0
+        self.iterations = 0
+        self.table_overflows = 0
+        keys, costs, stamps, slots = self.keys, self.costs, self.stamps, self.max_entries
+        evicted_keys, evicted_costs = self.evicted_keys, self.evicted_costs
+
+        def ordered(cell):
+            # Children most likely to lead to the goal first, so the last
+            # iteration finds it early
+            return iter(sorted((cell + offset for offset in neighbors[masks[cell]]),
+                               key=lambda child: estimate(child, goal)))
+
+        bound = estimate(start, goal)
+        while True:
+            # Slots stamped by an earlier iteration count as empty
+            self.iterations += 1
+            stamp = self.iterations
+            slot = start % slots
+            keys[slot], costs[slot], stamps[slot] = start, 0, stamp
+            evicted_keys[slot] = -1
+            self.num_explored += 1
+            if on_expand is not None:
+                on_expand(start, 0)
+            if start == goal:
+                return [], []
+
+            stack = [(start, 0, ordered(start))]
+            on_path = {start}
+            cutoff = None
+            while stack:
+                cell, g, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    on_path.discard(cell)
+                    stack.pop()
+                    continue
+                if child in on_path:
+                    continue
+                child_g = g + 1
+                f = child_g + estimate(child, goal)
+                if f > bound:
+                    if cutoff is None or f < cutoff:
+                        cutoff = f
+                    continue
+
+                slot = child % slots
+                if stamps[slot] == stamp:
+                    if keys[slot] == child:
+                        if costs[slot] <= child_g:
+                            continue
+                    else:
+                        # The table has no room for child; it would have
+                        # pruned this arrival if child had not been evicted
+                        if evicted_keys[slot] == child and evicted_costs[slot] <= child_g:
+                            self.re_expansions += 1
+                        evicted_keys[slot], evicted_costs[slot] = keys[slot], costs[slot]
+                        self.table_overflows += 1
+                else:
+                    evicted_keys[slot] = -1
+                keys[slot], costs[slot], stamps[slot] = child, child_g, stamp
+
+                on_path.add(child)
+                self.num_explored += 1
+                if on_expand is not None:
+                    on_expand(child, len(stack))
+                if child == goal:
+                    return self._path([entry[0] for entry in stack] + [child])
+                stack.append((child, child_g, ordered(child)))
+
+            if cutoff is None:
+                return None
+            bound = cutoff
+
+    def _path(self, cells):
+        actions = {offset: action for action, offset in self.grid.offsets.items()}
+        return [actions[b - a] for a, b in zip(cells, cells[1:])], cells[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare IDA* under a memory budget with A* on random mazes: peak memory and re-expansions."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 200, 400])
+    parser.add_argument("--obstacles", type=float, default=0.2)
+    parser.add_argument("--budgets", nargs="+", type=int, default=[4096, 256, 16],
+                        help="transposition table budgets in KB")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from .maze_generator import random_maze, to_grid
+
+    print(f"{'size':>6} {'solver':>14} {'cost':>6} {'expanded':>9} {'re-exp':>8} {'iters':>6} "
+          f"{'overflows':>10} {'peak KB':>9} {'ms':>9}")
+    for size in args.sizes:
+        grid = to_grid(random_maze(size, size, args.obstacles, seed=args.seed))
+
+        space = SearchSpace(grid)
+        tracemalloc.start()
+        began = time.perf_counter()
+        found = space.astar(grid.start, grid.goal)
+        elapsed = time.perf_counter() - began
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        cost = space.cost[grid.goal] if found else None
+        print(f"{size:>6} {'A*':>14} {str(cost):>6} {space.num_explored:>9} {0:>8} {1:>6} "
+              f"{'-':>10} {peak / 1024:>9.0f} {elapsed * 1000:>9.1f}")
+
+        for budget in args.budgets:
+            tracemalloc.start()
+            solver = IDAStar(grid, table_size(budget))
+            began = time.perf_counter()
+            solution = solver.search(grid.start, grid.goal)
+            elapsed = time.perf_counter() - began
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            cost = len(solution[0]) if solution is not None else None
+            print(f"{size:>6} {f'IDA* {budget}KB':>14} {str(cost):>6} {solver.num_explored:>9} "
+                  f"{solver.re_expansions:>8} {solver.iterations:>6} {solver.table_overflows:>10} "
+                  f"{peak / 1024:>9.0f} {elapsed * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
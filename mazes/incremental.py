@@ -0,0 +1,136 @@
+import heapq
+from array import array
+
+from .bidirectional import OPPOSITE
+
+INFINITY = 2 ** 31 - 1
+
+
+class LPAStar():
+    """
+    Lifelong Planning A* between a fixed start and goal on a Grid whose
+    walls change between searches.
+
+    Every cell keeps g (cost found by the last search) and rhs (one-step
+    lookahead cost from its neighbors' g). After walls change, only the
+    cells whose rhs no longer matches g are put back on the open list,
+    so replanning repairs the affected part of the previous search
+    instead of starting over.
+    """
+
+    def __init__(self, grid, start=None, goal=None):
+        self.grid = grid
+        self.start = grid.start if start is None else start
+        self.goal = grid.goal if goal is None else goal
+        size = grid.height * grid.width
+        self.g = array("i", [INFINITY]) * size
+        self.rhs = array("i", [INFINITY]) * size
+        self.offsets = [tuple(offset for _, offset in moves) for moves in grid.moves]
+        self.goal_row, self.goal_col = divmod(self.goal, grid.width)
+
+        # Open list with lazy deletion: a heap entry is current only while
+        # it matches the key recorded for its cell in self.queued
+        self.heap = []
+        self.queued = {}
+        self.num_explored = 0
+
+        self.rhs[self.start] = 0
+        self._queue(self.start)
+
+    def heuristic(self, index):
+        row, col = divmod(index, self.grid.width)
+        return abs(row - self.goal_row) + abs(col - self.goal_col)
+
+    def key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        if best == INFINITY:
+            return (INFINITY, INFINITY)
+        return (best + self.heuristic(index), best)
+
+    def _queue(self, index):
+        key = self.key(index)
+        self.queued[index] = key
+        heapq.heappush(self.heap, (key[0], key[1], index))
+
+    def _top_key(self):
+        heap = self.heap
+        while heap:
+            k1, k2, index = heap[0]
+            if self.queued.get(index) == (k1, k2):
+                return (k1, k2)
+            heapq.heappop(heap)
+        return (INFINITY, INFINITY)
+
+    def update_cell(self, index):
+        if index != self.start:
+            best = INFINITY
+            if not self.grid.walls[index]:
+                g = self.g
+                for offset in self.offsets[self.grid.masks[index]]:
+                    if g[index + offset] < best:
+                        best = g[index + offset]
+                if best != INFINITY:
+                    best += 1
+            self.rhs[index] = best
+        self.queued.pop(index, None)
+        if self.g[index] != self.rhs[index]:
+            self._queue(index)
+
+    def wall_changed(self, index):
+        """Call after grid.set_wall(index, ...) to repair the search."""
+        self.update_cell(index)
+        width = self.grid.width
+        row, col = divmod(index, width)
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < self.grid.height and 0 <= c < width:
+                self.update_cell(r * width + c)
+
+    def compute(self):
+        """
+        Brings the search up to date; returns True if the goal is
+        reachable. num_explored counts the cells expanded by this call.
+        """
+        self.num_explored = 0
+        g, rhs, goal = self.g, self.rhs, self.goal
+        masks, offsets = self.grid.masks, self.offsets
+        while self._top_key() < self.key(goal) or rhs[goal] != g[goal]:
+            if not self.heap:
+                break
+            k1, k2, index = heapq.heappop(self.heap)
+            del self.queued[index]
+            self.num_explored += 1
+            if g[index] > rhs[index]:
+                # Overconsistent: the cell got cheaper, settle it
+                g[index] = rhs[index]
+                for offset in offsets[masks[index]]:
+                    self.update_cell(index + offset)
+            else:
+                # Underconsistent: the cell got dearer, re-derive it and
+                # everything that may have depended on it
+                g[index] = INFINITY
+                self.update_cell(index)
+                for offset in offsets[masks[index]]:
+                    self.update_cell(index + offset)
+        return g[goal] != INFINITY
+
+    def path(self):
+        """Returns (actions, cells) from start to goal by following g back."""
+        if self.g[self.goal] == INFINITY:
+            return None
+        g = self.g
+        actions = []
+        cells = []
+        current = self.goal
+        while current != self.start:
+            cells.append(current)
+            best = None
+            for action, offset in self.grid.moves[self.grid.masks[current]]:
+                previous = current + offset
+                if best is None or g[previous] < g[best[1]]:
+                    best = (action, previous)
+            action, previous = best
+            actions.append(OPPOSITE[action])
+            current = previous
+        actions.reverse()
+        cells.reverse()
+        return actions, cells
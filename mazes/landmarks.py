@@ -0,0 +1,63 @@
+from .distance_field import DistanceField, UNREACHABLE
+
+
+class Landmarks():
+    """
+    ALT (A*, Landmarks, Triangle inequality) heuristic for one Grid.
+
+    Preprocessing stores a BFS distance array from each of k landmark
+    cells. For any landmark L, |d(L, a) - d(L, b)| never exceeds the true
+    distance between a and b, so the largest such bound (and Manhattan
+    distance, whichever is bigger) is an admissible, consistent A*
+    heuristic. In corridor mazes it is far tighter than Manhattan alone.
+    """
+
+    def __init__(self, grid, cells, distances):
+        self.grid = grid
+        self.cells = cells
+        self.distances = distances
+
+    @classmethod
+    def build(cls, grid, k=4, first=None):
+        """
+        Picks k landmarks by farthest-point selection: the first is the
+        cell farthest from first (the grid's start by default), and each
+        next one is the cell farthest from all landmarks chosen so far.
+        """
+        if first is None:
+            first = grid.start if grid.start is not None else grid.walls.find(0)
+        if first < 0:
+            raise Exception("grid has no open cells")
+
+        seed = DistanceField.compute(grid, first).distances
+        nearest = list(seed)
+        cells = []
+        distances = []
+        for _ in range(k):
+            landmark = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[landmark] <= 0 and cells:
+                break
+            field = DistanceField.compute(grid, landmark).distances
+            cells.append(landmark)
+            distances.append(field)
+            nearest = [
+                min(current, new) if new != UNREACHABLE else current
+                for current, new in zip(nearest, field)
+            ]
+        return cls(grid, cells, distances)
+
+    def estimate(self, a, b):
+        """Lower bound on the distance between cell indices a and b."""
+        best = self.grid.manhattan(a, b)
+        for field in self.distances:
+            da, db = field[a], field[b]
+            if da != UNREACHABLE and db != UNREACHABLE:
+                bound = da - db if da > db else db - da
+                if bound > best:
+                    best = bound
+        return best
+
+    def heuristic(self, a, b):
+        """estimate() for (row, col) cells, usable as an A* heuristic."""
+        width = self.grid.width
+        return self.estimate(a[0] * width + a[1], b[0] * width + b[1])
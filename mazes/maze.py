@@ -0,0 +1,485 @@
+import os
+import sys
+
+from . import corridors, terminal
+from .bidirectional import bidirectional_bfs
+from .distance_field import DistanceField, FieldFileError
+from .frontier import Node, QueueFrontier
+from .grid import Grid
+from .incremental import LPAStar
+from .packed_maze import is_packed
+from .reachability import Components, is_reachable
+from .search import SearchSpace
+from .search_stats import expansion_hook, phase, record
+
+
+class Maze():
+    # Solve modes, the first being the default; subclasses that add
+    # search algorithms (astar_maze.Maze) extend this
+    MODES = ("bfs", "bidirectional", "incremental", "contracted")
+
+    def __init__(self, filename, compact=False, stats=None):
+        self.filename = filename
+
+        # Optional search_stats.SearchStats, filled by parsing, solving
+        # and rendering this maze
+        self.stats = stats
+        self.field = None
+        self.space = None
+        self.walls_grid = None
+        self.planner = None
+        self.solvable = None
+        self.components = None
+        self.graph = None
+
+        # Counters of the last search, which solve() records in stats
+        # even when the search fails
+        self.num_explored = 0
+        self.queue = None
+
+        # Optionally parse into a compact Grid; the solver then works on
+        # integer cell indices instead of (row, col) tuples. Packed binary
+        # maze files always load this way, mapped rather than read, so
+        # only their header is parsed here
+        packed = is_packed(filename)
+        compact = compact or packed
+        with phase(stats, "parse"):
+            self.grid = Grid.from_file(filename, packed) if compact else None
+        if self.grid is not None:
+            self.height = self.grid.height
+            self.width = self.grid.width
+            self.start = self.grid.cell(self.grid.start)
+            self.goal = self.grid.cell(self.grid.goal)
+            self.walls = self.grid.rows()
+            self.solution = None
+            return
+
+        # Stream the file into a compact grid, then expand that into the
+        # rows of booleans the tuple-based solvers use; the grid is kept
+        # for as_grid()
+        with phase(stats, "parse"):
+            grid = Grid.from_file(filename, packed=False)
+            self.walls = [list(map(bool, row)) for row in grid.rows()]
+        self.height = grid.height
+        self.width = grid.width
+        self.start = grid.cell(grid.start)
+        self.goal = grid.cell(grid.goal)
+        self.walls_grid = grid
+
+        self.solution = None
+
+
+    def print(self, window=None, file=None, stream=False):
+        """
+        Prints the maze, with the solution if there is one. The frame is
+        written in one call (or one per row with stream=True) to file,
+        default stdout; window=(top, left, height, width) shows only
+        that part of the maze.
+        """
+        solution = self.solution[1] if self.solution is not None else None
+        with phase(self.stats, "render"):
+            terminal.write(self.walls, self.start, self.goal, solution, window, file, stream, spaced=True)
+
+
+    def neighbors(self, state):
+        row, col = state
+        candidates = [
+            ("up", (row - 1, col)),
+            ("down", (row + 1, col)),
+            ("left", (row, col - 1)),
+            ("right", (row, col + 1))
+        ]
+
+        result = []
+        for action, (r, c) in candidates:
+            if 0 <= r < self.height and 0 <= c < self.width and not self.walls[r][c]:
+                result.append((action, (r, c)))
+        return result
+
+
+    def solve(self, mode=None, stats=None):
+        """
+        Finds a solution to maze, if one exists. mode is "bfs" (default),
+        "bidirectional" (BFS from start and goal meeting in the middle),
+        "incremental" (LPA*, which reuses the previous search after
+        set_wall() edits) or "contracted" (Dijkstra over the corridor
+        graph from contract()).
+
+        stats, a search_stats.SearchStats, replaces the one given to the
+        constructor; it receives the search counters, the time spent
+        solving and reconstructing the path, and expansion events.
+        """
+
+        if mode is None:
+            mode = self.MODES[0]
+        if mode not in self.MODES:
+            raise Exception(f"unknown solve mode: {mode}")
+        if stats is not None:
+            self.stats = stats
+
+        # The frontier the search used, if any, for its counters
+        self.queue = None
+        try:
+            with phase(self.stats, "solve"):
+                return self.search(mode)
+        finally:
+            record(self.stats, self.num_explored, self.queue)
+
+
+    def search(self, mode):
+        # LPA* reports an unreachable goal itself, and a pre-check would
+        # cost a flood after every set_wall(), undoing its repair
+        if mode == "incremental":
+            return self.solve_incremental()
+
+        # Rule out unreachable goals before searching at all
+        if not self.is_solvable():
+            self.num_explored = 0
+            self.explored = set()
+            raise Exception("no solution")
+
+        if mode == "bidirectional":
+            return self.solve_bidirectional()
+        if mode == "contracted":
+            return self.solve_contracted()
+
+        # Keep track of number of states explored
+        self.num_explored = 0
+
+        # On a compact grid, search over flat per-cell arrays instead
+        if self.grid is not None:
+            return self.solve_compact()
+
+        # Initialize frontier to just the starting position
+        start = Node(state=self.start, parent=None, action=None)
+        frontier = QueueFrontier()
+        frontier.add(start)
+        self.queue = frontier
+        on_expand = expansion_hook(self.stats)
+
+        # Initialize an empty explored set
+        self.explored = set()
+
+        # Keep looping until solution found
+        while True:
+
+            # If nothing left in frontier, then no path
+            if frontier.empty():
+                raise Exception("no solution")
+
+            # Choose a node from the frontier
+            node = frontier.remove()
+            self.num_explored += 1
+            if on_expand is not None:
+                on_expand(node.state, len(frontier))
+
+            # If node is the goal, then we have a solution
+            if node.state == self.goal:
+                with phase(self.stats, "reconstruct"):
+                    actions = []
+                    cells = []
+                    while node.parent is not None:
+                        actions.append(node.action)
+                        cells.append(node.state)
+                        node = node.parent
+                    actions.reverse()
+                    cells.reverse()
+                self.solution = (actions, cells)
+                return
+
+            # Mark node as explored
+            self.explored.add(node.state)
+
+            # Add neighbors to frontier
+            for action, state in self.neighbors(node.state):
+                if not frontier.contains_state(state) and state not in self.explored:
+                    child = Node(state=state, parent=node, action=action)
+                    frontier.add(child)
+
+
+    def solve_bidirectional(self):
+        """Breadth-first search from both ends; counts each side's expansions."""
+        if self.grid is not None:
+            start, goal, neighbors = self.grid.start, self.grid.goal, self.grid.neighbors
+        else:
+            start, goal, neighbors = self.start, self.goal, self.neighbors
+
+        solution, forward, backward = bidirectional_bfs(start, goal, neighbors)
+        self.num_explored_forward = len(forward)
+        self.num_explored_backward = len(backward)
+        self.num_explored = self.num_explored_forward + self.num_explored_backward
+        self.explored = forward | backward
+        if self.grid is not None:
+            self.explored = {self.grid.cell(index) for index in self.explored}
+        if solution is None:
+            raise Exception("no solution")
+
+        actions, cells = solution
+        if self.grid is not None:
+            cells = [self.grid.cell(index) for index in cells]
+        self.solution = (actions, cells)
+
+
+    def solve_compact(self):
+        """Breadth-first search over the compact grid's flat arrays."""
+        if self.space is None:
+            self.space = SearchSpace(self.grid)
+        self.queue = self.space
+
+        # The hook gets (row, col) states like the tuple search reports
+        on_expand = expansion_hook(self.stats)
+        if on_expand is not None:
+            hook, cell = on_expand, self.grid.cell
+            on_expand = lambda index, frontier_size: hook(cell(index), frontier_size)
+
+        found = self.space.bfs(self.grid.start, self.grid.goal, on_expand)
+        self.num_explored = self.space.num_explored
+        self.explored = {self.grid.cell(index) for index in self.space.explored_cells}
+        if not found:
+            raise Exception("no solution")
+
+        # Walk the parent array back from the goal
+        with phase(self.stats, "reconstruct"):
+            actions, cells = self.space.path(self.grid.goal)
+            self.solution = (actions, [self.grid.cell(index) for index in cells])
+
+
+    def solve_incremental(self):
+        """
+        Lifelong Planning A*: the first call searches from scratch, later
+        ones only repair the part of the search affected by set_wall().
+        """
+        grid = self.as_grid()
+        if self.planner is None:
+            self.planner = LPAStar(grid)
+        found = self.planner.compute()
+        self.num_explored = self.planner.num_explored
+
+        # LPA* keeps its state across calls, so there is no per-call
+        # explored set to report
+        self.explored = set()
+        if not found:
+            raise Exception("no solution")
+
+        with phase(self.stats, "reconstruct"):
+            actions, cells = self.planner.path()
+            self.solution = (actions, [grid.cell(index) for index in cells])
+
+
+    def contract(self):
+        """
+        Fills the maze's dead ends and contracts its corridors into a
+        weighted junction graph (see corridors.py), once per maze.
+        """
+        if self.graph is None:
+            self.graph = corridors.contract(self.as_grid())
+        return self.graph
+
+
+    def solve_contracted(self):
+        """Dijkstra's algorithm over the corridor graph, expanded back to cells."""
+        graph = self.contract()
+        solution = graph.astar(graph.grid.start, graph.grid.goal, use_heuristic=False)
+        self.num_explored = graph.num_explored
+
+        # Only junctions are expanded, so there is no explored set of cells
+        self.explored = set()
+        if solution is None:
+            raise Exception("no solution")
+
+        actions, cells = solution
+        self.solution = (actions, [graph.grid.cell(index) for index in cells])
+
+
+    def is_solvable(self):
+        """
+        Whether the goal is reachable at all, by a bitboard flood from
+        the start that stops as soon as it reaches the goal. The answer
+        is kept until a wall changes.
+        """
+        if self.solvable is None:
+            grid = self.as_grid()
+            if self.components is not None:
+                self.solvable = self.components.connected(grid.start, grid.goal)
+            else:
+                self.solvable = is_reachable(grid, grid.start, grid.goal)
+        return self.solvable
+
+
+    def component_labels(self, precompute=False):
+        """
+        Connected-component labels of the open cells (see
+        reachability.Components), kept until a wall changes. Each
+        component is labeled by one flood the first time one of its
+        cells is asked about, or all at once with precompute=True; after
+        that, whether two cells are connected is a label comparison.
+        """
+        if self.components is None:
+            self.components = Components(self.as_grid())
+        if precompute:
+            self.components.label_all()
+        return self.components
+
+
+    def connected(self, a, b):
+        """Whether (row, col) cells a and b are open and joined by some path."""
+        grid = self.as_grid()
+        return self.component_labels().connected(grid.index(a), grid.index(b))
+
+
+    def as_grid(self):
+        """Returns the compact Grid, building one from walls on first use."""
+        if self.grid is not None:
+            return self.grid
+        if self.walls_grid is None:
+            self.walls_grid = Grid.from_walls(self.walls, self.start, self.goal)
+        return self.walls_grid
+
+
+    def set_wall(self, cell, blocked=True):
+        """
+        Blocks or clears one cell in place. A running incremental solver
+        is told about the change; the cached distance field, solvability
+        answer, component labels and corridor graph are dropped.
+        """
+        row, col = cell
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise Exception("cell is outside the maze")
+        if cell == self.start or cell == self.goal:
+            raise Exception("cannot put a wall on the start or goal")
+
+        # Compact walls are views into the Grid, which set_wall updates
+        if self.grid is None:
+            self.walls[row][col] = bool(blocked)
+        if self.grid is not None or self.walls_grid is not None:
+            grid = self.as_grid()
+            index = grid.index(cell)
+            grid.set_wall(index, blocked)
+
+            # Rows read from a packed file's mapping are replaced by views
+            # of the walls set_wall just unpacked
+            if self.grid is not None and not isinstance(self.walls, list):
+                self.walls = self.grid.rows()
+            if self.planner is not None:
+                self.planner.wall_changed(index)
+        self.field = None
+        self.solvable = None
+        self.components = None
+        self.graph = None
+
+
+    def toggle_wall(self, cell):
+        self.set_wall(cell, not self.walls[cell[0]][cell[1]])
+
+
+    def distance_field(self, cache_file=None):
+        """
+        Computes, once per maze, the distance from every cell to the goal
+        with a single reverse BFS. If cache_file is given, the field is
+        loaded from it when it exists and matches this maze and goal, and
+        recomputed and saved over it otherwise.
+        """
+        if self.field is not None:
+            return self.field
+
+        grid = self.as_grid()
+        if cache_file is not None and os.path.exists(cache_file):
+            try:
+                self.field = DistanceField.load(cache_file, grid)
+                return self.field
+            except FieldFileError:
+                pass
+
+        self.field = DistanceField.compute(grid)
+        if cache_file is not None:
+            self.field.save(cache_file)
+        return self.field
+
+
+    def solve_from(self, start):
+        """
+        Returns (actions, cells) for the shortest path from start to the
+        goal, read off the distance field in O(path length).
+        """
+        row, col = start
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise Exception("start is outside the maze")
+
+        # A start cut off from the goal needs no distance field
+        if not self.connected(start, self.goal):
+            raise Exception("no solution")
+        field = self.distance_field()
+        solution = field.path_from(field.grid.index(start))
+        if solution is None:
+            raise Exception("no solution")
+        actions, cells = solution
+        return actions, [field.grid.cell(index) for index in cells]
+
+
+    def solve_many(self, pairs, workers=1):
+        """
+        Yields the shortest path for each (start, goal) pair of (row, col)
+        cells, in input order: (actions, cells), or None if there is no
+        path. The compact grid and the search arrays are built once and
+        reused by every query, and queries sharing a start or a goal
+        share one search (see multi_query.py). Pairs in different
+        components (see component_labels) are answered without a
+        search. workers > 1 splits the searches across a process pool.
+        """
+        from .multi_query import solve_pairs
+
+        grid = self.as_grid()
+        queries = []
+        for start, goal in pairs:
+            for row, col in (start, goal):
+                if not (0 <= row < self.height and 0 <= col < self.width):
+                    raise Exception("cell is outside the maze")
+            queries.append((grid.index(start), grid.index(goal)))
+
+        if self.space is None or self.space.grid is not grid:
+            self.space = SearchSpace(grid)
+        components = self.component_labels()
+        for solution in solve_pairs(grid, queries, self.space, workers, components=components):
+            if solution is not None:
+                actions, cells = solution
+                solution = (actions, [grid.cell(index) for index in cells])
+            yield solution
+
+
+    def output_image(self, filename, show_solution=True, show_explored=False,
+                     cell_size=50, scale=1, tile=None):
+        """
+        Saves the maze as an image of cell_size pixel cells. scale pools
+        scale x scale cells into one for huge mazes, and tile writes the
+        image as tile x tile cell pieces (see render.save).
+        """
+        from . import render
+
+        solution = explored = None
+        if self.solution is not None:
+            if show_solution:
+                solution = self.solution[1]
+            if show_explored:
+                explored = self.explored
+        with phase(self.stats, "render"):
+            codes = render.cell_codes(self.as_grid(), self.start, self.goal, solution, explored)
+            return render.save(codes, filename, cell_size, scale=scale, tile=tile)
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python maze.py maze.txt")
+
+    m = Maze(sys.argv[1])
+    print("Maze:")
+    m.print()
+    print("Solving...")
+    m.solve()
+    print("States Explored:", m.num_explored)
+    print("Solution:")
+    m.print()
+    m.output_image("maze.png", show_explored=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import argparse
+import random
+import time
+
+import numpy as np
+
+from .grid import Grid
+
+
+def _rng(seed):
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+
+def random_maze(height, width, obstacle_prob=0.3, seed=None, waypoints=4):
+    """
+    Returns a (height, width) uint8 array (1 = wall) with each cell a wall
+    with probability obstacle_prob, that is always solvable from the top
+    left to the bottom right corner.
+
+    Instead of testing solvability and retrying, a path is carved through
+    the random fill in the same pass: L-shaped corridors between a few
+    random waypoints, so the guaranteed route is not simply the straight
+    Manhattan staircase and the fill still decides the shortest path.
+    """
+    rng = _rng(seed)
+
+    # 16-bit draws keep the density within 1/65536 of obstacle_prob
+    threshold = round(obstacle_prob * 65536)
+    walls = (rng.integers(0, 65536, size=(height, width), dtype=np.uint16) < threshold).view(np.uint8)
+
+    rows = rng.integers(0, height, size=waypoints)
+    cols = rng.integers(0, width, size=waypoints)
+    points = [(0, 0)] + list(zip(rows.tolist(), cols.tolist())) + [(height - 1, width - 1)]
+    turns = rng.integers(0, 2, size=len(points) - 1).tolist()
+    for ((r0, c0), (r1, c1)), vertical_first in zip(zip(points, points[1:]), turns):
+        if vertical_first:
+            walls[min(r0, r1):max(r0, r1) + 1, c0] = 0
+            walls[r1, min(c0, c1):max(c0, c1) + 1] = 0
+        else:
+            walls[r0, min(c0, c1):max(c0, c1) + 1] = 0
+            walls[min(r0, r1):max(r0, r1) + 1, c1] = 0
+    return walls
+
+
+def _rooms(height, width):
+    if height % 2 == 0 or width % 2 == 0:
+        raise Exception("perfect mazes need odd dimensions")
+    return (height + 1) // 2, (width + 1) // 2
+
+
+def backtracker_maze(height, width, seed=None):
+    """
+    Perfect maze (exactly one path between any two open cells) by the
+    recursive backtracker, run with an explicit stack. Rooms sit on even
+    rows and columns, so both corners are open; dimensions must be odd.
+    Long winding corridors, few branches. The walk itself is sequential,
+    so this is the slowest generator here.
+    """
+    rooms_high, rooms_wide = _rooms(height, width)
+    rng = random.Random(int(_rng(seed).integers(2 ** 63)))
+    visited = bytearray(rooms_high * rooms_wide)
+    walls = np.ones((height, width), dtype=np.uint8)
+    walls[::2, ::2] = 0
+
+    # Room index steps for up, down, left, right
+    moves = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    stack = [(0, 0)]
+    visited[0] = 1
+    while stack:
+        row, col = stack[-1]
+        options = []
+        for dr, dc in moves:
+            r, c = row + dr, col + dc
+            if 0 <= r < rooms_high and 0 <= c < rooms_wide and not visited[r * rooms_wide + c]:
+                options.append((r, c))
+        if not options:
+            stack.pop()
+            continue
+        r, c = rng.choice(options)
+        visited[r * rooms_wide + c] = 1
+        walls[row + r, col + c] = 0
+        stack.append((r, c))
+    return walls
+
+
+def kruskal_maze(height, width, seed=None):
+    """
+    Perfect maze by randomized Kruskal: every wall between two rooms is
+    taken in a random order and removed if it joins two separate
+    regions. Shorter dead ends than the backtracker. The edge order and
+    the final carving are vectorized; only the union-find is a loop.
+    """
+    rooms_high, rooms_wide = _rooms(height, width)
+    rng = _rng(seed)
+    count = rooms_high * rooms_wide
+
+    # Edges as room index pairs: each room to its right, then to its lower neighbor
+    index = np.arange(count, dtype=np.int64).reshape(rooms_high, rooms_wide)
+    first = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    second = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+    order = rng.permutation(len(first))
+    first, second = first[order], second[order]
+
+    parent = list(range(count))
+    kept = bytearray(len(first))
+    joined = 0
+    for edge, (a, b) in enumerate(zip(first.tolist(), second.tolist())):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[a] = b
+            kept[edge] = 1
+            joined += 1
+            if joined == count - 1:
+                break
+
+    # The wall between two rooms is at the midpoint of their cells
+    kept = np.frombuffer(bytes(kept), dtype=np.uint8).astype(bool)
+    a, b = first[kept], second[kept]
+    walls = np.ones((height, width), dtype=np.uint8)
+    walls[::2, ::2] = 0
+    walls[(a // rooms_wide) + (b // rooms_wide), (a % rooms_wide) + (b % rooms_wide)] = 0
+    return walls
+
+
+GENERATORS = {
+    "random": random_maze,
+    "backtracker": backtracker_maze,
+    "kruskal": kruskal_maze,
+}
+
+
+def to_grid(walls):
+    """Wraps a generated array as a Grid from the top left to the bottom right corner."""
+    height, width = walls.shape
+    return Grid(height, width, bytearray(walls.tobytes()), 0, height * width - 1)
+
+
+def to_text(walls):
+    """Renders a generated array in the maze text format (#, space, A, B)."""
+    chars = np.where(walls != 0, ord("#"), ord(" ")).astype(np.uint8)
+    chars[0, 0] = ord("A")
+    chars[-1, -1] = ord("B")
+    lines = np.full((chars.shape[0], 1), ord("\n"), dtype=np.uint8)
+    return np.hstack([chars, lines]).tobytes().decode("ascii")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a solvable maze text file.")
+    parser.add_argument("output")
+    parser.add_argument("--algorithm", choices=GENERATORS, default="random")
+    parser.add_argument("--height", type=int, default=41)
+    parser.add_argument("--width", type=int, default=41)
+    parser.add_argument("--obstacles", type=float, default=0.3, help="wall probability for --algorithm random")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.algorithm == "random":
+        walls = random_maze(args.height, args.width, args.obstacles, args.seed)
+    else:
+        walls = GENERATORS[args.algorithm](args.height, args.width, args.seed)
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, "w") as f:
+        f.write(to_text(walls))
+    print(f"{args.algorithm} {args.height}x{args.width} generated in {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .grid import Grid
+from .search import SearchSpace
+
+# Queries sharing an endpoint with fewer others than this get their own
+# A* search instead of a shared breadth-first one. On random 300x300
+# mazes one breadth-first search to k random cells costs about as much
+# as k separate A* searches at k = 12
+MIN_GROUP = 12
+
+
+def group_queries(pairs, min_group=MIN_GROUP, components=None):
+    """
+    Groups (start, goal) index pairs into the searches that answer them,
+    in order of each group's first query. A group is one of
+
+        ("goal", goal, [(i, start), ...])   one search from the shared goal
+        ("start", start, [(i, goal), ...])  one search from the shared start
+        ("pair", start, [(i, goal)])        a single A* query
+        ("none", None, [(i, goal), ...])    queries with no path
+
+    where i is the query's position in pairs. Each query joins whichever
+    of its endpoints is shared by more queries. With components, a
+    reachability.Components over the grid, a query whose start and goal
+    are in different components goes to the "none" group without a
+    search, so no search floods a whole component looking for it.
+    """
+    if components is not None:
+        connected = [components.connected(start, goal) for start, goal in pairs]
+        reachable = [pair for pair, joined in zip(pairs, connected) if joined]
+    else:
+        connected = None
+        reachable = pairs
+    starts = Counter(start for start, _ in reachable)
+    goals = Counter(goal for _, goal in reachable)
+    groups = {}
+    for i, (start, goal) in enumerate(pairs):
+        if connected is not None and not connected[i]:
+            key, other = ("none", None), goal
+        elif goals[goal] >= max(starts[start], min_group):
+            key, other = ("goal", goal), start
+        elif starts[start] >= min_group:
+            key, other = ("start", start), goal
+        else:
+            key, other = ("pair", start, i), goal
+        groups.setdefault(key, []).append((i, other))
+    return [(key[0], key[1], queries) for key, queries in groups.items()]
+
+
+def solve_groups(space, groups):
+    """
+    Answers grouped queries on one SearchSpace, whose arrays are reused
+    by every search. Yields (i, solution) per query, where solution is
+    (actions, cells) of cell indices or None if there is no path.
+    """
+    for kind, source, queries in groups:
+        if kind == "none":
+            for i, _ in queries:
+                yield i, None
+            continue
+        if kind == "pair":
+            (i, goal), = queries
+            found = space.astar(source, goal)
+            yield i, space.path(goal) if found else None
+            continue
+
+        missed = space.bfs_many(source, [other for _, other in queries])
+        walk = space.path_back if kind == "goal" else space.path
+        for i, other in queries:
+            yield i, None if other in missed else walk(other)
+
+
+def in_order(results, total):
+    """Re-orders (i, value) results to yield values for i = 0, 1, ... as soon as each is ready."""
+    pending = {}
+    next_index = 0
+    for i, value in results:
+        pending[i] = value
+        while next_index in pending:
+            yield pending.pop(next_index)
+            next_index += 1
+    if next_index != total:
+        raise Exception("missing query results")
+
+
+# Worker processes rebuild the grid once, from the initializer, and
+# keep one SearchSpace for every chunk they are sent
+_space = None
+
+
+def _init_worker(height, width, walls):
+    global _space
+    _space = SearchSpace(Grid(height, width, bytearray(walls)))
+
+
+def _solve_chunk(groups):
+    return list(solve_groups(_space, groups))
+
+
+def _chunks(groups, chunk_size):
+    """Splits groups into lists covering about chunk_size queries each."""
+    chunk, size = [], 0
+    for group in groups:
+        chunk.append(group)
+        size += len(group[2])
+        if size >= chunk_size:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def solve_pairs(grid, pairs, space=None, workers=1, chunk_size=256, min_group=MIN_GROUP, components=None):
+    """
+    Yields the solution for each (start, goal) pair of cell indices, in
+    input order: (actions, cells) or None if there is no path. Queries
+    sharing an endpoint share one search, and with components pairs in
+    different components are answered None without one (see
+    group_queries).
+
+    space, a SearchSpace over grid, is reused if given. With workers > 1
+    the groups are split into chunks of about chunk_size queries across
+    a process pool; each worker builds the grid once.
+    """
+    pairs = list(pairs)
+    groups = group_queries(pairs, min_group, components)
+    if workers == 1:
+        if space is None:
+            space = SearchSpace(grid)
+        yield from in_order(solve_groups(space, groups), len(pairs))
+        return
+
+    initargs = (grid.height, grid.width, bytes(grid.walls))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        chunks = executor.map(_solve_chunk, _chunks(groups, chunk_size))
+        yield from in_order((result for chunk in chunks for result in chunk), len(pairs))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time solve_pairs against one A* search per query on a random maze."
+    )
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--obstacles", type=float, default=0.25)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--endpoints", type=int, default=20,
+                        help="distinct goals the queries are drawn from")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from .maze_generator import random_maze, to_grid
+
+    grid = to_grid(random_maze(args.size, args.size, args.obstacles, seed=args.seed))
+    rng = random.Random(args.seed)
+    open_cells = [index for index in range(grid.height * grid.width) if not grid.walls[index]]
+    goals = rng.sample(open_cells, args.endpoints)
+    pairs = [(rng.choice(open_cells), rng.choice(goals)) for _ in range(args.queries)]
+
+    space = SearchSpace(grid)
+    began = time.perf_counter()
+    expected = []
+    for start, goal in pairs:
+        expected.append(space.cost[goal] if space.astar(start, goal) else None)
+    elapsed = time.perf_counter() - began
+    print(f"{'per-query A*':>16} {elapsed:8.2f}s {len(pairs) / elapsed:10.0f} queries/s")
+
+    for workers in args.workers:
+        began = time.perf_counter()
+        costs = [len(solution[0]) if solution is not None else None
+                 for solution in solve_pairs(grid, pairs, workers=workers)]
+        elapsed = time.perf_counter() - began
+        if costs != expected:
+            raise Exception("solve_pairs costs differ from A*")
+        print(f"{f'solve_pairs x{workers}':>16} {elapsed:8.2f}s {len(pairs) / elapsed:10.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import mmap
+import os
+import struct
+
+from .grid import Grid
+
+# File layout: magic, height, width, start index, goal index, padding to
+# 32 bytes, then the walls one bit per cell (1 = wall), each row padded
+# to whole bytes, bit col % 8 of byte col // 8 within a row
+MAGIC = b"MZBP"
+HEADER = struct.Struct("<4sIIqq4x")
+
+# Expands the "0"/"1" digits of a row's bit string into 0/1 wall bytes
+_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class PackedFileError(Exception):
+    """A packed maze file that is empty, truncated or has a bad header."""
+
+
+def is_packed(filename):
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def row_bytes(width):
+    return (width + 7) // 8
+
+
+def pack_row(walls):
+    """One row of 0/1 wall bytes to its packed bytes."""
+    digits = bytes(walls).translate(b"0" + b"1" * 255)[::-1] or b"0"
+    return int(digits, 2).to_bytes(row_bytes(len(walls)), "little")
+
+
+def unpack_row(data, width):
+    """Packed row bytes back to width 0/1 wall bytes."""
+    digits = f"{int.from_bytes(data, 'little'):0{width}b}"[::-1][:width]
+    return digits.encode("ascii").translate(_DIGITS)
+
+
+def save(filename, grid):
+    """Writes a Grid (with start and goal set) in the packed format."""
+    if grid.start is None or grid.goal is None:
+        raise Exception("grid needs a start and a goal")
+    width = grid.width
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, grid.height, width, grid.start, grid.goal))
+        walls = memoryview(grid.walls)
+        for i in range(grid.height):
+            f.write(pack_row(walls[i * width:(i + 1) * width]))
+
+
+class PackedMaze():
+    """
+    A packed maze file opened with mmap. Nothing is read up front
+    beyond the header: walls are looked up straight from the mapped
+    pages, which the OS shares between every process mapping the same
+    file. grid() wraps the mapping in a Grid that unpacks only when a
+    search needs its arrays; to_grid() unpacks into a Grid right away.
+    """
+
+    def __init__(self, filename):
+        self.bits = None
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise PackedFileError(f"{filename} is too short for a packed maze header")
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.height, self.width, self.start, self.goal = HEADER.unpack_from(self.map)
+            if magic != MAGIC:
+                raise PackedFileError(f"{filename} is not a packed maze file")
+            self.row_bytes = row_bytes(self.width)
+            cells = self.height * self.width
+            if len(self.map) < HEADER.size + self.height * self.row_bytes:
+                raise PackedFileError(f"{filename} is truncated")
+            if not (0 <= self.start < cells and 0 <= self.goal < cells):
+                raise PackedFileError(f"{filename} has its start or goal outside the maze")
+        except BaseException:
+            self.close()
+            raise
+
+        # Zero-copy view of the packed rows
+        self.bits = memoryview(self.map)[HEADER.size:HEADER.size + self.height * self.row_bytes]
+
+    def close(self):
+        if self.bits is not None:
+            self.bits.release()
+            self.bits = None
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_wall(self, row, col):
+        return self.bits[row * self.row_bytes + (col >> 3)] >> (col & 7) & 1 == 1
+
+    def row(self, i):
+        """Row i as width 0/1 wall bytes."""
+        start = i * self.row_bytes
+        return unpack_row(self.bits[start:start + self.row_bytes], self.width)
+
+    def rows(self):
+        """Rows read from the mapping one at a time, usable as walls[row][col]."""
+        return PackedRows(self)
+
+    def unpack(self):
+        """All the walls as one 0/1 bytearray, row-major like Grid.walls."""
+        walls = bytearray(self.height * self.width)
+        width = self.width
+        for i in range(self.height):
+            walls[i * width:(i + 1) * width] = self.row(i)
+        return walls
+
+    def grid(self):
+        """
+        A Grid backed by this mapping, which keeps it open. Its walls are
+        unpacked and its masks computed the first time a solver uses
+        them; until then is_wall() and rows() read the mapped bits.
+        """
+        return Grid(self.height, self.width, None, self.start, self.goal, source=self)
+
+    def to_grid(self):
+        return Grid(self.height, self.width, self.unpack(), self.start, self.goal)
+
+
+class PackedRows():
+    """The rows of a PackedMaze as a sequence; each row is unpacked when indexed."""
+
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __len__(self):
+        return self.maze.height
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.maze.height:
+            raise IndexError("row outside the maze")
+        return self.maze.row(i)
+
+    def __iter__(self):
+        return (self.maze.row(i) for i in range(self.maze.height))
+
+
+def open_grid(filename):
+    """Opens a packed maze file as a Grid backed by its mapping (see PackedMaze.grid)."""
+    return PackedMaze(filename).grid()
+
+
+def load(filename):
+    """Reads a packed maze file into a Grid and closes it."""
+    with PackedMaze(filename) as maze:
+        return maze.to_grid()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert text maze files to the packed binary format.")
+    parser.add_argument("mazes", nargs="+", help="text maze files, written next to themselves as .mzb")
+    args = parser.parse_args()
+
+    for filename in args.mazes:
+        output = os.path.splitext(filename)[0] + ".mzb"
+        save(output, Grid.from_file(filename))
+        print(f"{filename} -> {output} ({os.path.getsize(filename)} -> {os.path.getsize(output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import hashlib
+from collections import OrderedDict
+
+
+def maze_key(grid):
+    """Content hash of a Grid's dimensions and walls."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{grid.height}x{grid.width}".encode())
+    digest.update(grid.walls)
+    return digest.hexdigest()
+
+
+class PathCache():
+    """
+    LRU cache of solved (start, goal) queries keyed by maze hash, so the
+    same cell pair on the same walls is only searched once however many
+    Maze objects are built for it. Entries are evicted least recently
+    used first whenever the total number of cached path cells exceeds
+    max_cells, so long paths take up proportionally more of the budget.
+    """
+
+    def __init__(self, max_cells=1_000_000):
+        self.max_cells = max_cells
+        self.entries = OrderedDict()
+        self.cells = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, start, goal):
+        """Returns the cached solution (None for 'no path'), or raises KeyError."""
+        entry = (key, start, goal)
+        if entry not in self.entries:
+            self.misses += 1
+            raise KeyError(entry)
+        self.hits += 1
+        self.entries.move_to_end(entry)
+        return self.entries[entry]
+
+    def put(self, key, start, goal, solution):
+        entry = (key, start, goal)
+        if entry in self.entries:
+            self.cells -= _size(self.entries.pop(entry))
+        size = _size(solution)
+        if size > self.max_cells:
+            return
+        self.entries[entry] = solution
+        self.cells += size
+        while self.cells > self.max_cells:
+            _, evicted = self.entries.popitem(last=False)
+            self.cells -= _size(evicted)
+
+
+def _size(solution):
+    # Unsolvable pairs are cached too and count as one cell
+    return 1 if solution is None else len(solution[1]) + 1
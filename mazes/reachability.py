@@ -0,0 +1,157 @@
+from array import array
+
+# Reverses the bit order within a byte
+_REVERSED_BITS = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+UNLABELED = -1
+
+
+class Bitboard():
+    """
+    The open cells of a Grid as one big integer, one bit per cell.
+
+    Each row takes width + 1 bits: the extra guard bit at the end of
+    every row is always 0, so shifts and carries never run from one
+    row into the next. Cell (row, col) is bit row * stride + col.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.width = grid.width
+        self.stride = grid.width + 1
+        self.nbytes = (grid.height * self.stride + 7) // 8
+
+        # Walls bytes to "0"/"1" characters per row, plus the guard, read
+        # as a binary number (reversed, since int() wants the top bit first)
+        open_chars = bytes(grid.walls).translate(b"1" + b"0" * 255).decode("ascii")
+        rows = [open_chars[i:i + self.width] + "0" for i in range(0, len(open_chars), self.width)]
+        self.open = int("".join(rows)[::-1] or "0", 2)
+        self.open_bytes = self.open.to_bytes(self.nbytes, "little")
+        self.iterations = 0
+
+    def bit(self, index):
+        row, col = divmod(index, self.width)
+        return row * self.stride + col
+
+    def cell_index(self, bit):
+        row, col = divmod(bit, self.stride)
+        return row * self.width + col
+
+    @staticmethod
+    def reverse(bits, nbytes):
+        """Mirrors an nbytes-long bitboard, so its last bit becomes the first."""
+        # Reading the bytes back in the other byte order reverses their order
+        data = bits.to_bytes(nbytes, "little").translate(_REVERSED_BITS)
+        return int.from_bytes(data, "big")
+
+    def flood(self, index, target=None):
+        """
+        Returns the bitboard of every open cell reachable from index,
+        stopping early once target (a cell index) is reached.
+
+        Each round fills every open horizontal run that holds a frontier
+        cell in one step: adding the seeds to the open bits carries them
+        through the run towards the row's end, and doing the same on the
+        mirrored board fills towards the row's start. The filled runs then
+        grow one row up and down by shifting a whole stride.
+
+        A round only works on the band of rows around the frontier, cut
+        out of the byte buffers, so winding corridors that keep the
+        frontier small do not pay for the whole board every round.
+        """
+        start = self.bit(index)
+        if not self.open >> start & 1:
+            return 0
+        goal = None if target is None else self.bit(target)
+
+        open_bytes, stride = self.open_bytes, self.stride
+        reached = bytearray(self.nbytes)
+        reached[start >> 3] = 1 << (start & 7)
+
+        # The frontier as an integer whose bit 0 is bit 0 of byte first
+        first = start >> 3
+        frontier = 1 << (start & 7)
+        self.iterations = 0
+        while frontier:
+            self.iterations += 1
+
+            # Band from a row above the frontier's lowest bit to a row
+            # below its highest, re-based to start on a whole byte
+            low = first * 8 + (frontier & -frontier).bit_length() - 1
+            high = first * 8 + frontier.bit_length() - 1
+            begin = max(0, (low - stride) >> 3)
+            end = min(self.nbytes, ((high + stride) >> 3) + 1)
+            if begin < first:
+                frontier <<= (first - begin) * 8
+            else:
+                frontier >>= (begin - first) * 8
+            first = begin
+            size = end - begin
+
+            open_bits = int.from_bytes(open_bytes[begin:end], "little")
+            right = (((open_bits + frontier) ^ open_bits) | frontier) & open_bits
+            open_reversed = self.reverse(open_bits, size)
+            seeds = self.reverse(frontier, size)
+            left = (((open_reversed + seeds) ^ open_reversed) | seeds) & open_reversed
+            runs = right | self.reverse(left, size)
+            grown = (runs | (runs << stride) | (runs >> stride)) & open_bits
+
+            before = int.from_bytes(reached[begin:end], "little")
+            frontier = grown & ~before
+            reached[begin:end] = (before | grown).to_bytes(size, "little")
+            if goal is not None and reached[goal >> 3] >> (goal & 7) & 1:
+                break
+        return int.from_bytes(reached, "little")
+
+    def cells(self, bits):
+        """Yields the cell indices set in a bitboard, in increasing order."""
+        digits = f"{bits:b}"[::-1]
+        bit = digits.find("1")
+        while bit != -1:
+            yield self.cell_index(bit)
+            bit = digits.find("1", bit + 1)
+
+
+def is_reachable(grid, start, goal):
+    """True if goal can be reached from start (both cell indices)."""
+    board = Bitboard(grid)
+    return bool(board.flood(start, goal) >> board.bit(goal) & 1)
+
+
+class Components():
+    """
+    Connected-component labels of a Grid's open cells, found by bitboard
+    floods. A component is labeled the first time one of its cells is
+    asked about, so a solver pre-check costs one flood; after that any
+    question about cells in known components is a label comparison.
+    label_all() labels every component up front.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.board = Bitboard(grid)
+        self.labels = array("i", [UNLABELED]) * (grid.height * grid.width)
+        self.sizes = []
+
+    def label(self, index):
+        """Returns the component label of index, or UNLABELED for a wall."""
+        if self.labels[index] == UNLABELED and not self.grid.walls[index]:
+            label = len(self.sizes)
+            count = 0
+            for cell in self.board.cells(self.board.flood(index)):
+                self.labels[cell] = label
+                count += 1
+            self.sizes.append(count)
+        return self.labels[index]
+
+    def connected(self, a, b):
+        label = self.label(a)
+        return label != UNLABELED and label == self.label(b)
+
+    def label_all(self):
+        """Labels every open cell; returns the number of components."""
+        walls, labels = self.grid.walls, self.labels
+        for index in range(len(labels)):
+            if labels[index] == UNLABELED and not walls[index]:
+                self.label(index)
+        return len(self.sizes)
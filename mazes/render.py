@@ -0,0 +1,101 @@
+import os
+from itertools import chain
+
+import numpy as np
+
+# Cell codes, in increasing priority: when cells are pooled for a
+# downscaled image, the highest code in each block wins, so the path,
+# start and goal stay visible
+EMPTY, EXPLORED, WALL, SOLUTION, START, GOAL = range(6)
+
+# RGBA, like the canvas output_image used to draw on
+PALETTE = np.array([
+    (237, 240, 252, 255),  # empty
+    (212, 97, 85, 255),  # explored
+    (40, 40, 40, 255),  # wall
+    (220, 235, 113, 255),  # solution
+    (255, 0, 0, 255),  # start
+    (0, 171, 28, 255),  # goal
+], dtype=np.uint8)
+
+
+def _cells(cells):
+    """(row, col) pairs to a pair of index arrays."""
+    cells = np.fromiter(chain.from_iterable(cells), dtype=np.intp).reshape(-1, 2)
+    return cells[:, 0], cells[:, 1]
+
+
+def cell_codes(grid, start, goal, solution=None, explored=None):
+    """
+    Returns a (height, width) uint8 array of cell codes for a Grid.
+    solution and explored are iterables of (row, col) cells, marked with
+    one vectorized assignment each instead of a membership test per cell.
+    """
+    walls = np.frombuffer(bytes(grid.walls), dtype=np.uint8).reshape(grid.height, grid.width)
+    codes = np.where(walls != 0, WALL, EMPTY).astype(np.uint8)
+    if explored:
+        rows, cols = _cells(explored)
+        codes[rows, cols] = np.maximum(codes[rows, cols], EXPLORED)
+    if solution:
+        rows, cols = _cells(solution)
+        codes[rows, cols] = SOLUTION
+    codes[start] = START
+    codes[goal] = GOAL
+    return codes
+
+
+def downscale(codes, factor):
+    """Shrinks codes by an integer factor, keeping each block's highest code."""
+    if factor <= 1:
+        return codes
+    height, width = codes.shape
+    padded = np.zeros((-(-height // factor) * factor, -(-width // factor) * factor), dtype=np.uint8)
+    padded[:height, :width] = codes
+    blocks = padded.reshape(padded.shape[0] // factor, factor, padded.shape[1] // factor, factor)
+    return blocks.max(axis=(1, 3))
+
+
+def to_image(codes, cell_size=50, cell_border=2):
+    """
+    Paints codes as an RGBA PIL image with cell_size pixel blocks, upsampling
+    the colour grid with broadcasting rather than drawing each cell.
+    As with the old per-cell rectangles, each block keeps a black border
+    of cell_border pixels at its top and left and one pixel less at its
+    bottom and right.
+    """
+    from PIL import Image
+
+    colors = PALETTE[codes]
+    height, width = codes.shape
+    pixels = np.broadcast_to(
+        colors[:, None, :, None, :], (height, cell_size, width, cell_size, 4)
+    ).copy()
+    if cell_size > 2 * cell_border:
+        outside = np.ones(cell_size, dtype=bool)
+        outside[cell_border:cell_size - cell_border + 1] = False
+        pixels[:, outside, :, :, :3] = 0
+        pixels[:, :, :, outside, :3] = 0
+    return Image.fromarray(pixels.reshape(height * cell_size, width * cell_size, 4), "RGBA")
+
+
+def save(codes, filename, cell_size=50, cell_border=2, scale=1, tile=None):
+    """
+    Writes codes as an image. scale > 1 first pools scale x scale cells
+    into one. With tile set, the maze is cut into tile x tile cell pieces
+    saved as name_r<row>_c<col>.ext, so no single image has to hold the
+    whole maze; returns the list of files written.
+    """
+    codes = downscale(codes, scale)
+    if tile is None:
+        to_image(codes, cell_size, cell_border).save(filename)
+        return [filename]
+
+    name, ext = os.path.splitext(filename)
+    written = []
+    for top in range(0, codes.shape[0], tile):
+        for left in range(0, codes.shape[1], tile):
+            piece = codes[top:top + tile, left:left + tile]
+            tile_name = f"{name}_r{top // tile}_c{left // tile}{ext}"
+            to_image(piece, cell_size, cell_border).save(tile_name)
+            written.append(tile_name)
+    return written
@@ -0,0 +1,80 @@
+import argparse
+import random
+import statistics
+import time
+
+from .grid import Grid
+from .incremental import LPAStar
+from .search import SearchSpace
+
+
+def random_grid(size, obstacle_prob, rng):
+    """Random size x size grid with open corners as start and goal."""
+    walls = bytearray(1 if rng.random() < obstacle_prob else 0 for _ in range(size * size))
+    walls[0] = walls[-1] = 0
+    return Grid(size, size, walls, start=0, goal=size * size - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare LPA* replanning latency with a full A* re-solve after single-cell wall edits."
+    )
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--obstacles", type=float, default=0.25)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    grid = random_grid(args.size, args.obstacles, rng)
+    planner = LPAStar(grid)
+    space = SearchSpace(grid)
+
+    start = time.perf_counter()
+    if not planner.compute():
+        raise Exception("no solution; try another seed or fewer obstacles")
+    print(f"{args.size}x{args.size}: initial LPA* {time.perf_counter() - start:.3f}s, "
+          f"{planner.num_explored} cells expanded")
+
+    replans = []
+    resolves = []
+    print(f"{'edit':>4} {'cell':>14} {'replan (ms)':>12} {'expanded':>9} {'re-solve (ms)':>14} {'expanded':>9} {'cost':>6}")
+    blocked = []
+    for edit in range(args.edits):
+
+        # Alternate between blocking a cell on the current path, which
+        # forces a repair, and reopening one blocked earlier
+        if edit % 2 == 0 or not blocked:
+            _, cells = planner.path()
+            index = rng.choice(cells[:-1])
+            grid.set_wall(index, True)
+            blocked.append(index)
+        else:
+            index = blocked.pop(rng.randrange(len(blocked)))
+            grid.set_wall(index, False)
+
+        began = time.perf_counter()
+        planner.wall_changed(index)
+        found = planner.compute()
+        replan = time.perf_counter() - began
+
+        began = time.perf_counter()
+        space.astar(grid.start, grid.goal)
+        resolve = time.perf_counter() - began
+
+        cost = planner.g[grid.goal] if found else "-"
+        if found and cost != space.cost[grid.goal]:
+            raise Exception("LPA* and A* disagree on the path cost")
+        replans.append(replan)
+        resolves.append(resolve)
+        print(f"{edit:>4} {str(grid.cell(index)):>14} {replan * 1000:>12.2f} {planner.num_explored:>9} "
+              f"{resolve * 1000:>14.2f} {space.num_explored:>9} {cost:>6}")
+        if not found:
+            break
+
+    print(f"median replan {statistics.median(replans) * 1000:.2f} ms, "
+          f"median re-solve {statistics.median(resolves) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import random
+
+from .grid import Grid
+from .heuristic_search import (
+    a_star_search,
+    ara_star_search,
+    euclidean_distance,
+    generate_maze,
+    greedy_best_first_search,
+    hpa_abstraction,
+    hpa_star_search,
+    ida_star_search,
+    jump_point_search,
+    manhattan_distance,
+)
+from .landmarks import Landmarks
+
+# عرض سريع بالرسومات؛ للقياس الدقيق والمقارنة بين الـ commits استخدم benchmark.py
+
+# ARA* بحد وقت: يرجع أحسن مسار لقاه خلال ARA_BUDGET_MS، وعمود Suboptimality يبين قد إيش طوله
+ARA_BUDGET_MS = 5
+
+def main():
+    # pandas و matplotlib و seaborn ثقيلة، فما نستوردها إلا لما نرسم فعلاً
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    # نثبت الـ seed عشان نفس المتاهات تتولد كل مرة
+    rng = random.Random(0)
+
+    mazes = {size: generate_maze(size, rng=rng) for size in (30, 35, 40, 100, 200, 400)}
+    heuristics = {'Manhattan': manhattan_distance, 'Euclidean': euclidean_distance}
+    algorithms = {'A*': a_star_search, 'Greedy BFS': greedy_best_first_search, 'JPS': jump_point_search, 'HPA*': hpa_star_search, 'IDA*': ida_star_search}
+    algorithms['ARA*'] = lambda maze, heuristic: ara_star_search(maze, heuristic, budget_ms=ARA_BUDGET_MS)
+
+    # ALT يحتاج تحضير لكل متاهة: نختار landmarks ونحسب مسافات BFS منها مرة وحدة
+    landmarks = {size: Landmarks.build(Grid.from_walls(maze, (0, 0), (size - 1, size - 1))) for size, maze in mazes.items()}
+
+    # وكذلك HPA*: نبني الـ clusters والمسافات داخلها قبل القياس
+    for maze in mazes.values():
+        hpa_abstraction(maze)
+
+    results = []
+    for size, maze in mazes.items():
+        maze_heuristics = dict(heuristics, ALT=landmarks[size].heuristic)
+        for heuristic_name, heuristic in maze_heuristics.items():
+            for algo_name, algo in algorithms.items():
+                nodes_expanded, path_cost, exec_time = algo(maze, heuristic)
+                results.append([size, algo_name, heuristic_name, nodes_expanded, path_cost, exec_time])
+
+    results_df = pd.DataFrame(results, columns=['Maze Size', 'Algorithm', 'Heuristic', 'Nodes Expanded', 'Path Cost', 'Execution Time'])
+
+    # نسبة طول المسار لمسار A* الأمثل بنفس المتاهة والـ heuristic (HPA* و ARA* ممكن يطلعوا أكبر من 1)
+    optimal = results_df[results_df['Algorithm'] == 'A*'].set_index(['Maze Size', 'Heuristic'])['Path Cost']
+    results_df['Suboptimality'] = results_df['Path Cost'] / optimal.reindex(pd.MultiIndex.from_frame(results_df[['Maze Size', 'Heuristic']])).values
+
+    # تحسين عرض النتائج بصريًا
+    plt.figure(figsize=(12, 6))
+    sns.barplot(x='Maze Size', y='Nodes Expanded', hue='Algorithm', data=results_df, palette='coolwarm')
+    plt.title('Nodes Expanded Comparison per Algorithm and Maze Size')
+    plt.ylabel('Nodes Expanded')
+    plt.xlabel('Maze Size')
+    plt.legend(title='Algorithm')
+    plt.show()
+
+    plt.figure(figsize=(12, 6))
+    sns.lineplot(x='Maze Size', y='Execution Time', hue='Algorithm', data=results_df, marker='o', palette='coolwarm')
+    plt.title('Execution Time per Algorithm and Maze Size')
+    plt.ylabel('Execution Time (s)')
+    plt.xlabel('Maze Size')
+    plt.legend(title='Algorithm')
+    plt.show()
+
+    # طباعة النتائج
+    print(results_df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+from array import array
+
+ACTIONS = ("up", "down", "left", "right")
+
+
+class SearchSpace():
+    """
+    Search core over a Grid that keeps all per-cell search state in flat
+    arrays indexed by cell id, preallocated once per grid:
+
+        parent  index of the cell we came from (-1 for the start)
+        action  index into ACTIONS of the move that reached the cell
+        cost    g-cost of the best known path to the cell
+        seen    generation in which the cell was last reached
+        closed  generation in which the cell was last expanded
+
+    Entries are only valid when their generation matches the current
+    search, so starting a new search never has to clear the arrays.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        size = grid.height * grid.width
+        self.parent = array("i", [-1]) * size
+        self.action = bytearray(size)
+        self.cost = array("i", [0]) * size
+        self.seen = array("i", [0]) * size
+        self.closed = array("i", [0]) * size
+        self.queue = array("i", [0]) * size
+        self.generation = 0
+        self.num_explored = 0
+        self.explored_cells = array("i")
+        self.stale_pops = 0
+        self.pushes = 0
+        self.pops = 0
+        self.peak = 0
+
+        # (action code, offset) moves allowed by each open-direction mask
+        codes = {action: code for code, action in enumerate(ACTIONS)}
+        self.moves = [
+            tuple((codes[action], offset) for action, offset in moves)
+            for moves in grid.moves
+        ]
+
+    def _begin(self, start):
+        self.generation += 1
+        self.seen[start] = self.generation
+        self.parent[start] = -1
+        self.cost[start] = 0
+        return self.generation
+
+    def bfs(self, start, goal, on_expand=None):
+        """
+        Breadth-first search; returns True if goal was reached.
+        on_expand(index, frontier_size), if given, is called for every
+        cell expanded (see search_stats.SearchStats).
+        """
+        generation = self._begin(start)
+        masks, moves = self.grid.masks, self.moves
+        parent, action, cost, seen = self.parent, self.action, self.cost, self.seen
+
+        # The queue is a preallocated array: every cell enters it at most
+        # once, and queue[:head] is the expansion order
+        queue = self.queue
+        queue[0] = start
+        head, tail = 0, 1
+        peak = 1
+        while head < tail:
+            if tail - head > peak:
+                peak = tail - head
+            current = queue[head]
+            head += 1
+            if on_expand is not None:
+                on_expand(current, tail - head)
+            if current == goal:
+                self._count_bfs(head, tail, peak)
+                self.explored_cells = queue[:head - 1]
+                return True
+            next_cost = cost[current] + 1
+            for code, offset in moves[masks[current]]:
+                neighbor = current + offset
+                if seen[neighbor] != generation:
+                    seen[neighbor] = generation
+                    parent[neighbor] = current
+                    action[neighbor] = code
+                    cost[neighbor] = next_cost
+                    queue[tail] = neighbor
+                    tail += 1
+        self._count_bfs(head, tail, peak)
+        self.explored_cells = queue[:head]
+        return False
+
+    def bfs_many(self, source, targets):
+        """
+        Breadth-first search from source that stops once every cell in
+        targets has been reached, so one search answers many queries
+        sharing an endpoint. Returns the set of targets it could not
+        reach. Afterwards path(target) is the path from source, and
+        path_back(target) the path from target back to source.
+        """
+        generation = self._begin(source)
+        masks, moves = self.grid.masks, self.moves
+        parent, action, cost, seen = self.parent, self.action, self.cost, self.seen
+        remaining = set(targets)
+        remaining.discard(source)
+
+        queue = self.queue
+        queue[0] = source
+        head, tail = 0, 1
+        peak = 1
+        while head < tail and remaining:
+            if tail - head > peak:
+                peak = tail - head
+            current = queue[head]
+            head += 1
+            next_cost = cost[current] + 1
+            for code, offset in moves[masks[current]]:
+                neighbor = current + offset
+                if seen[neighbor] != generation:
+                    seen[neighbor] = generation
+                    parent[neighbor] = current
+                    action[neighbor] = code
+                    cost[neighbor] = next_cost
+                    queue[tail] = neighbor
+                    tail += 1
+                    remaining.discard(neighbor)
+        self._count_bfs(head, tail, peak)
+        self.explored_cells = queue[:head]
+        return remaining
+
+    def _count_bfs(self, head, tail, peak):
+        self.num_explored = head
+        self.pops = head
+        self.pushes = tail
+        self.stale_pops = 0
+        self.peak = peak
+
+    def astar(self, start, goal, use_heuristic=True, estimate=None, on_expand=None):
+        """
+        A* search with a Manhattan heuristic, or Dijkstra's algorithm if
+        use_heuristic is False; returns True if goal was reached.
+        estimate(index, goal) replaces Manhattan distance if given (for
+        example Landmarks.estimate); it must be consistent. on_expand is
+        called as in bfs().
+
+        Costs are small integers, so the open list is a bucket queue (as
+        in bucket_queue.py) with one list of cells per f-value. With a
+        consistent heuristic f never decreases, so the cursor only moves
+        forward. A cell whose cost was improved after it was queued is
+        left in its old bucket and skipped as stale when popped.
+        """
+        generation = self._begin(start)
+        masks, moves = self.grid.masks, self.moves
+        parent, action, cost, seen, closed = self.parent, self.action, self.cost, self.seen, self.closed
+        width = self.grid.width
+        goal_row, goal_col = divmod(goal, width)
+
+        def heuristic(index):
+            if not use_heuristic:
+                return 0
+            if estimate is not None:
+                return estimate(index, goal)
+            row, col = divmod(index, width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        # Each bucket entry records the cost it was queued with
+        buckets = [[] for _ in range(heuristic(start) + 1)]
+        buckets[-1].append((start, 0))
+        cursor = len(buckets) - 1
+        pending = 1
+        explored = array("i")
+        stale_pops = 0
+        pushes = 1
+        peak = 1
+        while pending:
+            bucket = buckets[cursor]
+            if not bucket:
+                cursor += 1
+                continue
+            if pending > peak:
+                peak = pending
+            current, queued_cost = bucket.pop()
+            pending -= 1
+
+            # Entries superseded by a cheaper push are skipped
+            if closed[current] == generation or queued_cost != cost[current]:
+                stale_pops += 1
+                continue
+            closed[current] = generation
+            if on_expand is not None:
+                on_expand(current, pending)
+            if current == goal:
+                explored_count = len(explored) + 1
+                break
+            explored.append(current)
+            next_cost = queued_cost + 1
+            for code, offset in moves[masks[current]]:
+                neighbor = current + offset
+                if closed[neighbor] == generation:
+                    continue
+                if seen[neighbor] != generation or next_cost < cost[neighbor]:
+                    seen[neighbor] = generation
+                    parent[neighbor] = current
+                    action[neighbor] = code
+                    cost[neighbor] = next_cost
+                    f = next_cost + heuristic(neighbor)
+                    while len(buckets) <= f:
+                        buckets.append([])
+                    buckets[f].append((neighbor, next_cost))
+                    pending += 1
+                    pushes += 1
+        else:
+            explored_count = len(explored)
+            current = -1
+
+        self.num_explored = explored_count
+        self.explored_cells = explored
+        self.stale_pops = stale_pops
+        self.pushes = pushes
+        # Like BucketQueue.pops, only entries that were expanded (or were
+        # the goal) count as pops; stale entries are in stale_pops alone
+        self.pops = pushes - pending - stale_pops
+        self.peak = peak
+        return current == goal
+
+    def path(self, goal):
+        """Walks the parent array back from goal; returns (actions, cells)."""
+        actions = []
+        cells = []
+        index = goal
+        while self.parent[index] != -1:
+            actions.append(ACTIONS[self.action[index]])
+            cells.append(index)
+            index = self.parent[index]
+        actions.reverse()
+        cells.reverse()
+        return actions, cells
+
+    def path_back(self, index):
+        """
+        Walks the parent array from index back to the search's start;
+        returns (actions, cells) for that path, the reverse of path().
+        """
+        actions = []
+        cells = []
+        while self.parent[index] != -1:
+            # Codes pair up as (up, down) and (left, right), so code ^ 1
+            # is the opposite move
+            actions.append(ACTIONS[self.action[index] ^ 1])
+            index = self.parent[index]
+            cells.append(index)
+        return actions, cells
@@ -0,0 +1,125 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+COUNTERS = ("nodes_expanded", "pushes", "pops", "stale_pops", "peak_frontier")
+
+
+class SearchStats(dict):
+    """
+    Counters, phase timings and an optional expansion trace for a solve.
+
+    It is a dict, so solvers that fill a plain stats dict (as the
+    heuristic_search functions do) fill this one the same way. The keys
+    are COUNTERS, "peak_memory_kb" and "phases", seconds spent per phase
+    name ("parse", "solve", "reconstruct", "render"). Phases may nest:
+    "solve" includes the "reconstruct" inside it.
+
+    Expansions are only reported while tracing, that is when on_expand
+    is given or sample_every is set; otherwise solvers skip the hook
+    with one None check per expansion. on_expand(state, frontier_size)
+    is called for every expanded state, and with sample_every=n every
+    nth expansion is kept as an event for to_json(), up to max_events.
+    track_memory records each phase's peak traced memory with
+    tracemalloc in "phase_peak_kb" (a phase's peak includes the phases
+    nested in it), and the highest of them in "peak_memory_kb". It
+    slows the phases down.
+    """
+
+    def __init__(self, on_expand=None, sample_every=0, max_events=100000, track_memory=False):
+        super().__init__(dict.fromkeys(COUNTERS, 0), peak_memory_kb=0, phases={}, phase_peak_kb={})
+        self.on_expand = on_expand
+        self.sample_every = sample_every
+        self.max_events = max_events
+        self.track_memory = track_memory
+        self.events = []
+        self.expansions = 0
+
+        # Peak bytes seen so far by each open phase, outermost first
+        self.open_peaks = []
+        self.began = time.perf_counter()
+
+    @property
+    def tracing(self):
+        return self.on_expand is not None or self.sample_every > 0
+
+    def expand(self, state, frontier_size):
+        self.expansions += 1
+        if self.on_expand is not None:
+            self.on_expand(state, frontier_size)
+        if self.sample_every and self.expansions % self.sample_every == 0 and len(self.events) < self.max_events:
+            self.events.append({
+                "expansion": self.expansions,
+                "ms": (time.perf_counter() - self.began) * 1000,
+                "state": state,
+                "frontier": frontier_size,
+            })
+
+    def add_phase(self, name, seconds):
+        phases = self["phases"]
+        phases[name] = phases.get(name, 0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        started = False
+        if self.track_memory:
+            if tracemalloc.is_tracing():
+                # A nested phase resets the peak, so the enclosing phase
+                # keeps what it has seen so far and gets the inner peak back
+                # when the nested phase ends
+                if self.open_peaks:
+                    self.open_peaks[-1] = max(self.open_peaks[-1], tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started = True
+            self.open_peaks.append(0)
+        began = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_phase(name, time.perf_counter() - began)
+            if self.track_memory:
+                peak = max(self.open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self.open_peaks:
+                    self.open_peaks[-1] = max(self.open_peaks[-1], peak)
+                peaks = self["phase_peak_kb"]
+                peaks[name] = max(peaks.get(name, 0), peak / 1024)
+                self["peak_memory_kb"] = max(self["peak_memory_kb"], peak / 1024)
+                if started:
+                    tracemalloc.stop()
+
+    def to_json(self):
+        return {"stats": dict(self), "events": self.events}
+
+    def write_trace(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+def phase(stats, name):
+    """stats.phase(name) for a SearchStats, otherwise a context that does nothing."""
+    return stats.phase(name) if isinstance(stats, SearchStats) else nullcontext()
+
+
+def expansion_hook(stats):
+    """The callback a solver should call per expansion, or None when not tracing."""
+    return stats.expand if isinstance(stats, SearchStats) and stats.tracing else None
+
+
+def record(stats, nodes_expanded, queue=None):
+    """
+    Stores nodes_expanded in a stats dict (if any), along with the
+    pushes, pops, stale_pops and peak counts of queue: any of the
+    frontiers, BucketQueue, HeapQueue or SearchSpace. Every queue counts
+    a skipped stale entry in stale_pops only, never in pops.
+    """
+    if stats is None:
+        return
+    stats["nodes_expanded"] = nodes_expanded
+    if queue is not None:
+        stats["pushes"] = queue.pushes
+        stats["pops"] = queue.pops
+        stats["stale_pops"] = queue.stale_pops
+        stats["peak_frontier"] = queue.peak
@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+
+from .batch_solve import maze_files
+from .solve_service import DEFAULT_SOCKET, MODES
+
+
+class SolveClient():
+    """One connection to a solve_service server; requests on it are answered in order."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, socket_path=DEFAULT_SOCKET, host="127.0.0.1", port=None):
+        if port is not None:
+            reader, writer = await asyncio.open_connection(host, port)
+        else:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+        return cls(reader, writer)
+
+    async def request(self, message):
+        """Sends a request dict, or a list of them as one batch, and returns the response."""
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        return json.loads(line)
+
+    async def solve(self, filename, mode="bfs", start=None, path=False):
+        message = {"file": filename, "mode": mode}
+        if start is not None:
+            message["start"] = list(start)
+        if path:
+            message["path"] = True
+        return await self.request(message)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+async def load_test(filenames, total, concurrency, batch, mode, socket_path, port, seed):
+    """
+    Sends total requests for randomly chosen files from concurrency
+    connections at once, batch requests per message. Returns the
+    per-message latencies in seconds, the wall time and the responses.
+    """
+    rng = random.Random(seed)
+    remaining = [total]
+    latencies = []
+    responses = []
+
+    async def worker():
+        client = await SolveClient.connect(socket_path, port=port)
+        try:
+            while remaining[0] > 0:
+                count = min(batch, remaining[0])
+                remaining[0] -= count
+                messages = [{"file": rng.choice(filenames), "mode": mode} for _ in range(count)]
+                began = time.perf_counter()
+                response = await client.request(messages if batch > 1 else messages[0])
+                latencies.append(time.perf_counter() - began)
+                responses.extend(response if batch > 1 else [response])
+        finally:
+            await client.close()
+
+    began = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - began, responses
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test a running solve_service server and report throughput and latency."
+    )
+    parser.add_argument("paths", nargs="+", help="maze files, directories or glob patterns")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--requests", type=int, default=2000, help="total solve requests")
+    parser.add_argument("--concurrency", type=int, default=16, help="connections sending at once")
+    parser.add_argument("--batch", type=int, default=1, help="requests per message")
+    parser.add_argument("--mode", choices=MODES, default="bfs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    filenames = maze_files(args.paths)
+    if not filenames:
+        sys.exit("no maze files found")
+
+    latencies, elapsed, responses = asyncio.run(load_test(
+        filenames, args.requests, args.concurrency, args.batch, args.mode, args.socket, args.port, args.seed
+    ))
+    errors = sum(not response["ok"] for response in responses)
+    cached = sum(response.get("cached", False) for response in responses)
+    latencies_ms = [latency * 1000 for latency in latencies]
+    print(f"requests   {len(responses)} ({errors} errors, {cached} from a warm cache)")
+    print(f"throughput {len(responses) / elapsed:.0f} solves/s over {elapsed:.2f}s")
+    print(f"latency    p50 {statistics.median(latencies_ms):.2f} ms, "
+          f"p99 {percentile(latencies_ms, 99):.2f} ms, max {max(latencies_ms):.2f} ms per message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import argparse
+import asyncio
+import json
+import os
+import stat
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .maze import Maze
+
+MODES = ("bfs", "bidirectional", "contracted")
+
+DEFAULT_SOCKET = "/tmp/maze_solver.sock"
+
+
+class MazeCache():
+    """
+    LRU cache of parsed compact Maze objects keyed by (path, mtime), so
+    a file is parsed once and the indexes a Maze builds lazily (its
+    SearchSpace arrays, solvability answer, distance field and corridor
+    graph) stay warm for every later request. Editing the file changes
+    its mtime, which drops the stale entry on the next request for it.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, filename):
+        """Returns (maze, cached) for filename, parsing it on a miss."""
+        path = os.path.abspath(filename)
+        key = (path, os.stat(path).st_mtime_ns)
+        maze = self.entries.get(key)
+        if maze is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return maze, True
+
+        self.misses += 1
+        for stale in [entry for entry in self.entries if entry[0] == path]:
+            del self.entries[stale]
+        maze = Maze(path, compact=True)
+        self.entries[key] = maze
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return maze, False
+
+
+# One cache per worker process, created by the pool initializer
+_cache = None
+
+
+def _init_worker(max_entries):
+    global _cache
+    _cache = MazeCache(max_entries)
+
+
+def solve_request(request, cache=None):
+    """
+    Answers one request dict:
+
+        file   maze file to solve (required)
+        mode   one of MODES (default "bfs")
+        start  [row, col] to solve from instead of the maze's start,
+               read off the cached distance field to the goal
+        path   if true, include the solution cells in the response
+        id     echoed back unchanged
+
+    Returns a response dict with ok, cost, explored, cached and ms, or
+    ok false and an error message.
+    """
+    cache = _cache if cache is None else cache
+    began = time.perf_counter()
+    try:
+        maze, cached = cache.get(request["file"])
+        if "start" in request:
+            actions, cells = maze.solve_from(tuple(request["start"]))
+            explored = 0
+        else:
+            mode = request.get("mode", "bfs")
+            if mode not in MODES:
+                raise Exception(f"unknown solve mode: {mode}")
+            maze.solve(mode)
+            actions, cells = maze.solution
+            explored = maze.num_explored
+        response = {"ok": True, "cost": len(actions), "explored": explored, "cached": cached}
+        if request.get("path"):
+            response["path"] = [list(cell) for cell in cells]
+    except Exception as e:
+        response = {"ok": False, "error": str(e)}
+    response["ms"] = (time.perf_counter() - began) * 1000
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def solve_requests(requests):
+    """Runs in a worker: answers a batch of requests in order."""
+    return [solve_request(request) for request in requests]
+
+
+class SolveService():
+    """
+    Asyncio server answering maze solve requests, one JSON value per
+    line, over a Unix socket or a localhost TCP port. A line holding a
+    JSON list is a client-side batch and gets a list of responses.
+
+    Solves run in worker processes, each a single-process pool with its
+    own MazeCache; a pool whose worker dies is replaced by a fresh one.
+    Requests are routed to a worker by a hash of the file path, so a
+    maze is parsed by only one worker and later requests for it always
+    find it warm. Each worker has a queue: while it is busy,
+    requests arriving for it from any connection pile up and are sent
+    over together as one batch of at most batch_size, so IPC is paid per
+    batch rather than per request.
+    """
+
+    def __init__(self, workers=None, cache_entries=64, batch_size=64):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_entries = cache_entries
+        self.batch_size = batch_size
+        self.executors = []
+        self.queues = []
+        self.dispatchers = []
+        self.served = 0
+        self.batches = 0
+        self.restarts = 0
+
+    def _executor(self):
+        return ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(self.cache_entries,))
+
+    def start(self):
+        self.executors = [self._executor() for _ in range(self.workers)]
+        self.queues = [asyncio.Queue() for _ in range(self.workers)]
+        self.dispatchers = [asyncio.create_task(self._dispatch(shard)) for shard in range(self.workers)]
+
+    def close(self):
+        for dispatcher in self.dispatchers:
+            dispatcher.cancel()
+        for executor in self.executors:
+            executor.shutdown(cancel_futures=True)
+
+    def _shard(self, request):
+        filename = request.get("file") if isinstance(request, dict) else None
+        if not isinstance(filename, str):
+            return 0
+        return zlib.crc32(os.path.abspath(filename).encode()) % self.workers
+
+    async def _dispatch(self, shard):
+        loop = asyncio.get_running_loop()
+        queue = self.queues[shard]
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            requests = [request for request, _ in batch]
+            try:
+                responses = await loop.run_in_executor(self.executors[shard], solve_requests, requests)
+            except BrokenProcessPool as e:
+                # The worker died (killed, out of memory, crashed in C code);
+                # this batch fails, and a fresh worker with an empty cache
+                # takes over the shard
+                responses = [{"ok": False, "error": f"worker failed: {e}"}] * len(batch)
+                self.executors[shard].shutdown(wait=False)
+                self.executors[shard] = self._executor()
+                self.restarts += 1
+            except Exception as e:
+                responses = [{"ok": False, "error": f"worker failed: {e}"}] * len(batch)
+            self.batches += 1
+            self.served += len(batch)
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    async def solve(self, request):
+        if not isinstance(request, dict) or "file" not in request:
+            return {"ok": False, "error": "request must be an object with a file"}
+        future = asyncio.get_running_loop().create_future()
+        self.queues[self._shard(request)].put_nowait((request, future))
+        return await future
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError as e:
+                    response = {"ok": False, "error": f"bad JSON: {e}"}
+                else:
+                    if isinstance(message, list):
+                        response = list(await asyncio.gather(*(self.solve(request) for request in message)))
+                    else:
+                        response = await self.solve(message)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path=None, host="127.0.0.1", port=None):
+        """Serves until cancelled; port, if given, is used instead of socket_path."""
+        self.start()
+        try:
+            if port is not None:
+                server = await asyncio.start_server(self.handle, host, port)
+            else:
+                # Only a stale socket from an earlier run is removed,
+                # never some other file given by mistake
+                try:
+                    mode = os.stat(socket_path).st_mode
+                except FileNotFoundError:
+                    pass
+                else:
+                    if not stat.S_ISSOCK(mode):
+                        raise Exception(f"{socket_path} exists and is not a socket")
+                    os.unlink(socket_path)
+                server = await asyncio.start_unix_server(self.handle, socket_path)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve maze solve requests from worker processes with warm maze caches."
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--port", type=int, default=None, help="serve on this localhost TCP port instead")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--cache-entries", type=int, default=64, help="parsed mazes kept per worker")
+    parser.add_argument("--batch-size", type=int, default=64, help="most requests sent to a worker at once")
+    args = parser.parse_args()
+
+    service = SolveService(args.workers, args.cache_entries, args.batch_size)
+    where = f"127.0.0.1:{args.port}" if args.port is not None else args.socket
+    print(f"serving on {where} with {service.workers} workers", flush=True)
+    try:
+        asyncio.run(service.serve(args.socket, port=args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .benchmark import environment, percentile
+
+# solve.py and the sample mazes sit in the repository root, above the package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cases(maze_file, image_file):
+    """(name, argv) for each cold-start case, each run in a fresh interpreter."""
+    solve = [sys.executable, os.path.join(ROOT, "solve.py"), maze_file]
+    return [
+        # The floor: interpreter startup alone
+        ("python", [sys.executable, "-c", "pass"]),
+        ("import", [sys.executable, "-c", "import mazes.astar_maze, mazes.maze"]),
+        ("solve", solve + ["--quiet"]),
+        ("solve+image", solve + ["--quiet", "--image", image_file]),
+    ]
+
+
+def time_to_first_solve(argv, runs):
+    """Wall-clock seconds for each of runs fresh executions of argv."""
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        subprocess.run(argv, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - began)
+    return samples
+
+
+def heaviest_imports(argv, count):
+    """
+    Runs argv once under -X importtime and returns the count top-level
+    imports with the largest cumulative time, as (module, ms) pairs.
+    """
+    result = subprocess.run(argv[:1] + ["-X", "importtime"] + argv[1:], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented further under the module that imported them
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports.append((name.strip(), int(cumulative) / 1000))
+    imports.sort(key=lambda entry: -entry[1])
+    return imports[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure time-to-first-solve of the solve.py CLI in fresh interpreters."
+    )
+    parser.add_argument("--maze", default="maze2.txt")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--imports", type=int, default=8, help="heaviest top-level imports to list")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="allowed relative growth of a median before --compare reports a regression")
+    args = parser.parse_args()
+
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'case':>12} {'median ms':>10} {'p95 ms':>10}")
+        for name, argv in cases(args.maze, os.path.join(tmp, "maze.png")):
+            samples = [seconds * 1000 for seconds in time_to_first_solve(argv, args.runs)]
+            record = {"case": name, "median_ms": statistics.median(samples), "p95_ms": percentile(samples, 0.95)}
+            records.append(record)
+            print(f"{name:>12} {record['median_ms']:>10.1f} {record['p95_ms']:>10.1f}", flush=True)
+
+        print()
+        print("Heaviest imports of solve:")
+        for module, ms in heaviest_imports(dict(cases(args.maze, ""))["solve"], args.imports):
+            print(f"  {module:<24} {ms:8.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"environment": environment(), "records": records}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        previous = {record["case"]: record for record in baseline["records"]}
+        regressions = 0
+        print()
+        print(f"Compared with {baseline['environment'].get('commit') or 'baseline'} "
+              f"(threshold {args.threshold:.0%}):")
+        for record in records:
+            old = previous.get(record["case"])
+            if old is not None and record["median_ms"] > old["median_ms"] * (1 + args.threshold):
+                regressions += 1
+                print(f"  REGRESSION {record['case']}: median {old['median_ms']:.1f} -> {record['median_ms']:.1f} ms")
+        if not regressions:
+            print("  no regressions")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys
+
+# str.translate table for wall bytes: 0 is open, anything else a wall
+_CELLS = {0: " "}
+_CELLS.update((byte, "█") for byte in range(1, 256))
+
+
+def rows(walls, start, goal, solution=None, window=None):
+    """
+    Yields the text of each maze row, using the same characters as
+    Maze.print: walls as blocks, A, B and * for solution cells.
+
+    walls is any sequence of rows that bytes() accepts (lists of bools,
+    lists of 0/1, memoryview rows of a Grid). Each row is converted in
+    one translate call and only the few cells on the path, start or goal
+    are patched. window=(top, left, height, width) crops to a viewport.
+    """
+    height = len(walls)
+    width = len(walls[0]) if height else 0
+    top, left, shown_height, shown_width = window or (0, 0, height, width)
+    top, left = max(0, top), max(0, left)
+    bottom, right = min(height, top + shown_height), min(width, left + shown_width)
+
+    # Characters to overlay, per row; later entries take precedence
+    marks = {}
+    for (i, j), char in [(cell, "*") for cell in solution or ()] + [(goal, "B"), (start, "A")]:
+        if top <= i < bottom and left <= j < right:
+            marks.setdefault(i, {})[j - left] = char
+
+    for i in range(top, bottom):
+        line = bytes(walls[i][left:right]).decode("latin-1").translate(_CELLS)
+        overlay = marks.get(i)
+        if overlay:
+            chars = list(line)
+            for j, char in overlay.items():
+                if line[j] == " ":
+                    chars[j] = char
+            line = "".join(chars)
+        yield line
+
+
+def write(walls, start, goal, solution=None, window=None, file=None, stream=False, spaced=False):
+    """
+    Writes the maze to file (default stdout). The whole frame is built
+    and written in a single call; with stream=True it is written one row
+    per call instead, so huge mazes can go to a pipe or file without
+    holding the full frame in memory. spaced adds an empty line before
+    and after.
+    """
+    file = sys.stdout if file is None else file
+    lines = rows(walls, start, goal, solution, window)
+    if stream:
+        if spaced:
+            file.write("\n")
+        for line in lines:
+            file.write(line + "\n")
+        if spaced:
+            file.write("\n")
+        return
+
+    frame = "".join(line + "\n" for line in lines)
+    file.write("\n" + frame + "\n" if spaced else frame)
@@ -0,0 +1,5 @@
+# Single command line entry point; the code lives in mazes/cli.py
+from mazes.cli import main
+
+if __name__ == "__main__":
+    main()
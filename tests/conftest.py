@@ -0,0 +1,11 @@
+import pytest
+
+from mazes.maze_generator import random_maze, to_text
+
+
+@pytest.fixture(params=range(4))
+def maze_file(request, tmp_path):
+    """A random 31x37 text maze, one per seed."""
+    path = tmp_path / f"random{request.param}.txt"
+    path.write_text(to_text(random_maze(31, 37, 0.3, seed=request.param)))
+    return str(path)
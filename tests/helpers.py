@@ -0,0 +1,36 @@
+import os
+
+from mazes.search import SearchSpace
+
+# The sample mazes in the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAZE_FILES = [os.path.join(ROOT, name) for name in
+              ("maze1.txt", "maze2.txt", "maze3.txt", "maze_30x30.txt", "maze_35x35.txt", "maze_40x40.txt")]
+
+
+def bfs_cost(grid, start=None, goal=None):
+    """Length of the shortest path by a plain breadth-first search, or None."""
+    start = grid.start if start is None else start
+    goal = grid.goal if goal is None else goal
+    space = SearchSpace(grid)
+    return space.cost[goal] if space.bfs(start, goal) else None
+
+
+def check_path(walls, cells, start, goal):
+    """cells must be a walk of open, adjacent cells from a neighbor of start to goal."""
+    previous = start
+    for row, col in cells:
+        assert not walls[row][col]
+        assert abs(row - previous[0]) + abs(col - previous[1]) == 1
+        previous = (row, col)
+    assert previous == goal
+
+
+def solved(cls, filename, mode, compact=False):
+    """Solves filename with cls in mode, checks the path and returns (maze, path length)."""
+    m = cls(filename, compact=compact)
+    m.solve(mode)
+    actions, cells = m.solution
+    assert len(actions) == len(cells)
+    check_path(m.walls, cells, m.start, m.goal)
+    return m, len(actions)
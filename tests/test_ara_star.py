@@ -0,0 +1,65 @@
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost
+from mazes import astar_maze
+from mazes.ara_star import ARAStar
+from mazes.heuristic_search import a_star_search, ara_star_search, manhattan_distance
+from mazes.maze_generator import random_maze, to_grid
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_ara_star_matches_a_star(seed):
+    walls = random_maze(60, 60, 0.3, seed=seed).tolist()
+    optimal = a_star_search(walls, manhattan_distance)[1]
+
+    stats = {}
+    assert ara_star_search(walls, manhattan_distance, stats)[1] == optimal
+    assert stats["bound"] == 1
+
+    # A budgeted run may stop early, but within its proven bound
+    stats = {}
+    cost = ara_star_search(walls, manhattan_distance, stats, budget_ms=0)[1]
+    assert optimal <= cost <= optimal * stats["bound"]
+
+
+def test_ara_star_records_returned_path_cost():
+    grid = to_grid(random_maze(80, 80, 0.25, seed=3))
+    solver = ARAStar(grid)
+    actions, _ = solver.search(grid.start, grid.goal)
+    assert solver.solutions[-1][2] == len(actions) == bfs_cost(grid)
+    for _, bound, cost, _ in solver.solutions:
+        assert bfs_cost(grid) <= cost <= bfs_cost(grid) * bound
+
+
+def test_epsilon_only_tightens():
+    grid = to_grid(random_maze(80, 80, 0.25, seed=4))
+    solver = ARAStar(grid, epsilon=5, step=1)
+    solver.search(grid.start, grid.goal)
+    epsilons = [solution[0] for solution in solver.solutions]
+    assert epsilons == sorted(epsilons, reverse=True)
+    assert epsilons[0] == 5
+    assert all(bound <= epsilon for epsilon, bound, _, _ in solver.solutions)
+
+    # A second search on the same solver starts afresh
+    first = solver.solutions[-1][2]
+    assert len(solver.search(grid.start, grid.goal)[0]) == first
+
+
+def test_epsilon_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        ARAStar(to_grid(random_maze(5, 5, 0.2, seed=0)), epsilon=0.5)
+
+
+def test_no_path():
+    walls = random_maze(20, 20, 0.2, seed=0)
+    walls[10, :] = 1
+    grid = to_grid(walls)
+    assert ARAStar(grid).search(grid.start, grid.goal) is None
+
+
+def test_anytime_mode_reports_its_bound():
+    m = astar_maze.Maze(MAZE_FILES[5])
+    m.latency_budget_ms = 0
+    m.solve("anytime")
+    optimal = bfs_cost(m.as_grid())
+    assert optimal <= len(m.solution[0]) <= optimal * m.solution_bound
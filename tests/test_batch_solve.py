@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from helpers import bfs_cost
+from mazes.batch_solve import maze_files, solve_batch
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze, to_text
+
+
+@pytest.fixture
+def maze_dir(tmp_path):
+    for seed in range(5):
+        (tmp_path / f"maze{seed}.txt").write_text(to_text(random_maze(21, 21, 0.3, seed=seed)))
+    (tmp_path / "broken.txt").write_text("###\n# #\n")
+    (tmp_path / "notes.md").write_text("not a maze")
+    return tmp_path
+
+
+def test_maze_files_expands_directories_and_globs(maze_dir):
+    files = maze_files([str(maze_dir), str(maze_dir / "maze1.txt"), str(maze_dir / "*.md")])
+    assert [os.path.basename(name) for name in files] == \
+        ["broken.txt", "maze0.txt", "maze1.txt", "maze2.txt", "maze3.txt", "maze4.txt", "notes.md"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_batch_matches_bfs(maze_dir, workers):
+    files = maze_files([str(maze_dir)])
+    rows = list(solve_batch(files, workers=workers, chunk_size=2))
+    assert len(rows) == 2 * 5 + 1
+
+    for filename, algorithm, explored, cost, seconds in rows:
+        if filename.endswith("broken.txt"):
+            assert algorithm.startswith("error:")
+            continue
+        assert algorithm in ("astar", "dijkstra")
+        assert cost == bfs_cost(Grid.from_file(filename))
+        assert explored > 0 and seconds >= 0
@@ -0,0 +1,70 @@
+import copy
+import json
+import sys
+
+import pytest
+
+from mazes import benchmark
+
+
+@pytest.fixture(scope="module")
+def records():
+    return benchmark.run([30], [0.3], 1, ["A*", "JPS"], ["Manhattan"], warmup=0, repeats=3)
+
+
+def test_corpus_is_reproducible():
+    # The same maze whatever else is in the corpus
+    alone = {(size, seed): maze for size, _, seed, maze in benchmark.corpus([40], [0.3], 2)}
+    mixed = {(size, seed): maze for size, _, seed, maze in benchmark.corpus([30, 40], [0.3], 2)}
+    assert alone[(40, 0)] == mixed[(40, 0)]
+    assert alone[(40, 1)] == mixed[(40, 1)]
+    assert alone[(40, 0)] != alone[(40, 1)]
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 21))
+    assert benchmark.percentile(values, 0.95) == 19
+    assert benchmark.percentile(values, 0.5) == 10
+    assert benchmark.percentile([7], 0.95) == 7
+
+
+def test_records(records):
+    assert [(record["algorithm"], record["heuristic"]) for record in records] == \
+        [("A*", "Manhattan"), ("JPS", "Manhattan")]
+    for record in records:
+        assert record["suboptimality"] == 1
+        assert set(record["metrics"]) == set(benchmark.METRICS)
+        assert record["metrics"]["time_ms"]["median"] <= record["metrics"]["time_ms"]["p95"]
+
+
+def test_compare_flags_regressions(records, capsys):
+    baseline = {"environment": {"commit": "abc1234"}, "records": copy.deepcopy(records)}
+    assert benchmark.compare(records, baseline, 0.10) == 0
+    assert "no regressions" in capsys.readouterr().out
+
+    # Fewer expanded nodes in the baseline: the current run has grown
+    baseline["records"][0]["metrics"]["nodes_expanded"]["median"] /= 2
+    baseline["records"][1]["path_cost"] += 2
+    assert benchmark.compare(records, baseline, 0.10) == 2
+    out = capsys.readouterr().out
+    assert "nodes_expanded" in out and "path cost" in out
+
+
+def test_main_writes_and_compares(tmp_path, monkeypatch, capsys):
+    results = tmp_path / "results.json"
+    table = tmp_path / "results.csv"
+    argv = ["bench", "--sizes", "30", "--densities", "0.3", "--algorithms", "A*",
+            "--heuristics", "Manhattan", "--warmup", "0", "--repeats", "1"]
+    monkeypatch.setattr(sys, "argv", argv + ["--json", str(results), "--csv", str(table)])
+    benchmark.main()
+    saved = json.loads(results.read_text())
+    assert len(saved["records"]) == 1
+    assert table.read_text().splitlines()[0].startswith("size,density,seed,algorithm")
+
+    saved["records"][0]["path_cost"] += 1
+    results.write_text(json.dumps(saved))
+    monkeypatch.setattr(sys, "argv", argv + ["--compare", str(results)])
+    with pytest.raises(SystemExit) as exit:
+        benchmark.main()
+    assert exit.value.code == 1
+    assert "REGRESSION" in capsys.readouterr().out
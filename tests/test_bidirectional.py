@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from helpers import bfs_cost, check_path
+from mazes.bidirectional import bidirectional_astar, bidirectional_bfs
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze
+
+SEARCHES = {
+    "bfs": lambda grid, start, goal: bidirectional_bfs(start, goal, grid.neighbors),
+    "astar": lambda grid, start, goal: bidirectional_astar(start, goal, grid.neighbors, grid.manhattan),
+}
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+@pytest.mark.parametrize("seed", range(3))
+def test_random_pairs_match_bfs(search, seed):
+    grid = Grid.from_walls(random_maze(25, 33, 0.35, seed=seed).tolist())
+    walls = [grid.walls[row * grid.width:(row + 1) * grid.width] for row in range(grid.height)]
+    cells = [index for index in range(grid.height * grid.width) if not grid.walls[index]]
+    rng = random.Random(seed)
+    for _ in range(40):
+        start, goal = rng.choice(cells), rng.choice(cells)
+        expected = bfs_cost(grid, start, goal)
+        solution, forward, backward = SEARCHES[search](grid, start, goal)
+        if expected is None:
+            assert solution is None
+            continue
+        actions, path = solution
+        assert len(actions) == len(path) == expected
+        check_path(walls, [grid.cell(index) for index in path], grid.cell(start), grid.cell(goal))
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_start_is_goal(search):
+    grid = Grid.from_walls([[0, 0], [0, 0]])
+    assert SEARCHES[search](grid, 0, 0)[0] == ([], [])
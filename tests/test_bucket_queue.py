@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from mazes.bucket_queue import BucketQueue, HeapQueue
+
+
+@pytest.mark.parametrize("cls", [BucketQueue, HeapQueue])
+@pytest.mark.parametrize("seed", range(3))
+def test_pops_lowest_live_priority(cls, seed):
+    rng = random.Random(seed)
+    queue = cls()
+    expected = {}
+    popped = 0
+    for _ in range(2000):
+        if expected and rng.random() < 0.4:
+            priority, key, item = queue.pop()
+            assert priority == expected[key] == min(expected.values())
+            assert item == (key, priority)
+            del expected[key]
+            popped += 1
+        else:
+            # Often a key that is already queued: the new entry replaces it
+            key = rng.randrange(50)
+            priority = rng.randrange(40)
+            queue.add(key, priority, (key, priority))
+            expected[key] = priority
+        assert len(queue) == len(expected)
+        assert all(key in queue for key in expected)
+    assert queue.pops == popped
+    assert queue.peak >= len(queue)
+    while not queue.empty():
+        queue.pop()
+    # A replaced entry is skipped at most once and never counted as a pop
+    assert queue.pops + queue.stale_pops <= queue.pushes
+
+
+def test_bucket_queue_rejects_negative_priorities():
+    with pytest.raises(Exception, match="non-negative"):
+        BucketQueue().add("a", -1)
+
+
+@pytest.mark.parametrize("cls", [BucketQueue, HeapQueue])
+def test_get_returns_the_live_entry(cls):
+    queue = cls()
+    queue.add("a", 5, "first")
+    queue.add("a", 2, "second")
+    assert queue.get("a") == (2, "a", "second")
+    assert queue.get("b") is None
+    assert queue.pop() == (2, "a", "second")
+    with pytest.raises(Exception, match="empty frontier"):
+        queue.pop()
+    assert queue.stale_pops == 0
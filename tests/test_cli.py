@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+from helpers import MAZE_FILES, ROOT, bfs_cost
+from mazes import cli, maze
+
+
+@pytest.mark.parametrize("mode", cli.MODES)
+def test_quiet_output(mode, maze_file, capsys):
+    cli.main([maze_file, "--mode", mode, "--quiet"])
+    cost, explored = capsys.readouterr().out.split()[1::2]
+    assert int(cost) == bfs_cost(maze.Maze(maze_file, compact=True).grid)
+    assert int(explored) > 0
+
+
+def test_unsolvable_maze_exits(tmp_path):
+    filename = tmp_path / "walled.txt"
+    filename.write_text("A#B\n")
+    with pytest.raises(SystemExit) as exit:
+        cli.main([str(filename), "--quiet"])
+    assert exit.value.code == "ما فيه حل"
+
+
+def test_time_goes_to_stderr(capsys):
+    cli.main([MAZE_FILES[0], "--quiet", "--time"])
+    out, err = capsys.readouterr()
+    assert out.startswith("cost ")
+    assert "ms" in err and "ms" not in out
+
+
+def run(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_imports_stay_light():
+    out = run("-c", "import sys, mazes, maze, AstarMaze; print(sorted({'numpy', 'PIL', 'pandas'} & set(sys.modules)))")
+    assert out.strip() == "[]"
+
+
+def test_entry_points():
+    assert run("solve.py", "maze1.txt", "--quiet").startswith("cost ")
+    assert run("-m", "mazes.cli", "maze1.txt", "--mode", "bfs", "--quiet").startswith("cost ")
+
+    import AstarMaze
+    import maze as maze_wrapper
+    from mazes import astar_maze
+
+    assert maze_wrapper.Maze is maze.Maze
+    assert AstarMaze.Maze is astar_maze.Maze
@@ -0,0 +1,49 @@
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost
+from mazes import corridors, maze
+from mazes.maze_generator import kruskal_maze, random_maze, to_grid
+
+
+@pytest.mark.parametrize("filename", MAZE_FILES)
+def test_corridor_contraction(filename):
+    grid = maze.Maze(filename, compact=True).grid
+    graph = corridors.contract(grid)
+    actions, cells = graph.astar(grid.start, grid.goal)
+    assert len(actions) == len(cells) == bfs_cost(grid)
+    assert all(not grid.walls[index] for index in cells)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_dead_end_filling_keeps_the_shortest_path(seed):
+    grid = to_grid(random_maze(41, 41, 0.35, seed=seed))
+    pruned, filled = corridors.fill_dead_ends(grid)
+    assert filled == sum(pruned.walls) - sum(grid.walls)
+    assert bfs_cost(pruned) == bfs_cost(grid)
+
+    # Only the start and goal may be left as dead ends
+    for index in range(41 * 41):
+        if not pruned.walls[index] and index not in (grid.start, grid.goal):
+            assert len(pruned.neighbors(index)) >= 2
+
+    graph = corridors.CorridorGraph(pruned)
+    for use_heuristic in (True, False):
+        actions, cells = graph.astar(grid.start, grid.goal, use_heuristic)
+        assert len(actions) == bfs_cost(grid)
+        assert cells[-1] == grid.goal
+
+
+def test_perfect_maze_fills_down_to_its_path():
+    grid = to_grid(kruskal_maze(41, 41, seed=2))
+    pruned, _ = corridors.fill_dead_ends(grid)
+    assert pruned.height * pruned.width - sum(pruned.walls) == bfs_cost(grid) + 1
+    # One corridor from start to goal
+    graph = corridors.contract(grid)
+    assert sorted(graph.nodes) == [grid.start, grid.goal]
+
+
+def test_no_path_between_nodes():
+    walls = random_maze(21, 21, 0.2, seed=0)
+    walls[10, :] = 1
+    grid = to_grid(walls)
+    assert corridors.contract(grid).astar(grid.start, grid.goal) is None
@@ -0,0 +1,77 @@
+import pytest
+
+from helpers import MAZE_FILES, check_path
+from mazes import maze
+from mazes.distance_field import UNREACHABLE, DistanceField, FieldFileError
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze
+from mazes.search import SearchSpace
+
+
+def reference_distances(grid, goal):
+    """Distance of every cell from goal by one full SearchSpace BFS."""
+    space = SearchSpace(grid)
+    space.bfs(goal, -1)
+    return [space.cost[index] if space.seen[index] == space.generation and not grid.walls[index]
+            else UNREACHABLE for index in range(grid.height * grid.width)]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_field_matches_bfs(seed, vectorized):
+    grid = Grid.from_walls(random_maze(37, 29, 0.35, seed=seed).tolist(), (0, 0), (36, 28))
+    field = DistanceField.compute(grid, vectorized=vectorized)
+    assert list(field.distances) == reference_distances(grid, grid.goal)
+
+    walls = [grid.walls[row * grid.width:(row + 1) * grid.width] for row in range(grid.height)]
+    for start in range(0, grid.height * grid.width, 7):
+        solution = field.path_from(start)
+        if field.distance(start) == UNREACHABLE:
+            assert solution is None
+            continue
+        actions, cells = solution
+        assert len(actions) == len(cells) == field.distance(start)
+        if cells:
+            check_path(walls, [grid.cell(index) for index in cells], grid.cell(start), grid.cell(grid.goal))
+
+
+def test_save_and_load(tmp_path):
+    grid = maze.Maze(MAZE_FILES[5], compact=True).grid
+    cache = str(tmp_path / "field.mzdf")
+    field = DistanceField.compute(grid)
+    field.save(cache)
+    assert DistanceField.load(cache, grid).distances == field.distances
+
+    other = maze.Maze(MAZE_FILES[4], compact=True).grid
+    with pytest.raises(FieldFileError, match="different maze"):
+        DistanceField.load(cache, other)
+
+    with open(cache, "r+b") as f:
+        f.truncate(100)
+    with pytest.raises(FieldFileError, match="truncated"):
+        DistanceField.load(cache, grid)
+
+
+def test_distance_field_rejects_another_goal(tmp_path):
+    filename = MAZE_FILES[5]
+    grid = maze.Maze(filename, compact=True).grid
+    cache = str(tmp_path / "field.mzdf")
+    other = next(index for index in range(grid.height * grid.width)
+                 if not grid.walls[index] and index != grid.goal)
+    DistanceField.compute(grid, other).save(cache)
+    with pytest.raises(FieldFileError):
+        DistanceField.load(cache, grid)
+    assert DistanceField.load(cache, grid, other).goal == other
+
+    # A Maze given the stale cache recomputes the field for its own goal
+    m = maze.Maze(filename)
+    actions, cells = m.solve_from(m.start)
+    m = maze.Maze(filename)
+    m.distance_field(cache)
+    assert m.solve_from(m.start) == (actions, cells)
+    assert cells[-1] == m.goal
+
+    with open(cache, "wb") as f:
+        f.write(b"garbage")
+    with pytest.raises(FieldFileError):
+        DistanceField.load(cache, grid)
@@ -0,0 +1,56 @@
+import pytest
+
+from mazes.frontier import Node, PriorityFrontier, QueueFrontier, StackFrontier
+
+
+def fill(frontier, states):
+    for state in states:
+        frontier.add(Node(state, None, None))
+    return frontier
+
+
+def drain(frontier):
+    states = []
+    while not frontier.empty():
+        states.append(frontier.remove().state)
+    return states
+
+
+def test_stack_frontier_is_last_in_first_out():
+    assert drain(fill(StackFrontier(), [1, 2, 3])) == [3, 2, 1]
+
+
+def test_queue_frontier_is_first_in_first_out():
+    assert drain(fill(QueueFrontier(), [1, 2, 3])) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("cls", [StackFrontier, QueueFrontier])
+def test_contains_state_follows_adds_and_removes(cls):
+    frontier = fill(cls(), [(0, 0), (0, 1)])
+    assert frontier.contains_state((0, 0)) and frontier.contains_state((0, 1))
+    assert not frontier.contains_state((1, 1))
+    removed = frontier.remove().state
+    assert not frontier.contains_state(removed)
+    assert len(frontier) == 1
+    assert (frontier.pushes, frontier.pops, frontier.peak) == (2, 1, 2)
+
+
+@pytest.mark.parametrize("cls", [StackFrontier, QueueFrontier, PriorityFrontier])
+def test_remove_from_empty_frontier_raises(cls):
+    with pytest.raises(Exception, match="empty frontier"):
+        cls().remove()
+
+
+def test_priority_frontier_keeps_the_cheapest_node_per_state():
+    frontier = PriorityFrontier()
+    frontier.add(Node("a", None, None, cost=5, heuristic=1))
+    frontier.add(Node("b", None, None, cost=3, heuristic=1))
+    # Not cheaper: ignored. Cheaper: replaces the queued node
+    frontier.add(Node("a", None, None, cost=6, heuristic=1))
+    frontier.add(Node("a", None, None, cost=1, heuristic=1))
+    assert len(frontier) == 2
+
+    first = frontier.remove()
+    assert (first.state, first.cost) == ("a", 1)
+    assert frontier.remove().state == "b"
+    assert frontier.empty()
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from helpers import MAZE_FILES
+from mazes import grid as grid_module, maze
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze
+
+
+def expected_neighbors(grid, index):
+    """The (action, index) moves to open neighbors, worked out cell by cell."""
+    row, col = grid.cell(index)
+    if grid.walls[index]:
+        return []
+    moves = []
+    for action, (r, c) in (("up", (row - 1, col)), ("down", (row + 1, col)),
+                           ("left", (row, col - 1)), ("right", (row, col + 1))):
+        if 0 <= r < grid.height and 0 <= c < grid.width and not grid.walls[grid.index((r, c))]:
+            moves.append((action, grid.index((r, c))))
+    return moves
+
+
+def test_masks_match_neighbors():
+    grid = Grid.from_walls(random_maze(23, 41, 0.35, seed=1).tolist())
+    for index in range(grid.height * grid.width):
+        assert grid.neighbors(index) == expected_neighbors(grid, index)
+
+
+def test_set_wall_updates_masks():
+    grid = Grid.from_walls(random_maze(20, 20, 0.3, seed=2).tolist())
+    rng = random.Random(2)
+    for _ in range(100):
+        grid.set_wall(rng.randrange(400), rng.random() < 0.5)
+    fresh = Grid(grid.height, grid.width, bytearray(grid.walls))
+    assert grid.masks == fresh.masks
+
+
+@pytest.mark.parametrize("filename", MAZE_FILES)
+def test_compact_grid_matches_wall_lists(filename):
+    lists = maze.Maze(filename)
+    grid = maze.Maze(filename, compact=True).grid
+    assert (grid.height, grid.width) == (lists.height, lists.width)
+    assert (grid.cell(grid.start), grid.cell(grid.goal)) == (lists.start, lists.goal)
+    assert [[bool(cell) for cell in row] for row in grid.rows()] == lists.walls
+    assert grid.index(grid.cell(57)) == 57
+
+
+def test_wall_buffer_must_match_dimensions():
+    with pytest.raises(Exception, match="dimensions"):
+        Grid(3, 3, bytearray(8))
+
+
+@pytest.mark.parametrize("contents", [
+    "#A #\n#  #\n# B#\n",
+    # Short and ragged lines are padded with open cells
+    "A\n## #\n#\n   B\n",
+    "#A #\r\n#  #\r\n# B#",
+    # Any other character is a wall, one cell per character
+    "éA ─\n·  #\n  B☐\n",
+])
+def test_streamed_file_matches_text(tmp_path, monkeypatch, contents):
+    filename = tmp_path / "maze.txt"
+    filename.write_bytes(contents.encode())
+    expected = Grid.from_text(contents)
+
+    # Tiny buffers and bands so the passes cross their boundaries
+    monkeypatch.setattr(grid_module, "BUFFER_SIZE", 4)
+    monkeypatch.setattr(grid_module, "BAND_CELLS", 3)
+    grid = Grid.from_file(str(filename), packed=False)
+    assert (grid.height, grid.width, grid.start, grid.goal) == \
+        (expected.height, expected.width, expected.start, expected.goal)
+    assert grid.walls == expected.walls
+    assert grid.masks == expected.masks
+
+
+@pytest.mark.parametrize("contents, message", [
+    ("#A A\n#  B\n", "one start"),
+    ("A\nA\nB\n", "one start"),
+    ("# A #\n#   #\n", "one goal"),
+    ("AB\nB \n", "one goal"),
+])
+def test_file_needs_one_start_and_goal(tmp_path, contents, message):
+    filename = tmp_path / "maze.txt"
+    filename.write_text(contents)
+    with pytest.raises(Exception, match=message):
+        Grid.from_file(str(filename), packed=False)
@@ -0,0 +1,26 @@
+import pytest
+
+from helpers import bfs_cost
+from mazes.heuristic_search import a_star_search, jump_point_search, manhattan_distance
+from mazes.maze_generator import random_maze, to_grid
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_jump_point_search_matches_a_star(seed):
+    walls = random_maze(60, 60, 0.3, seed=seed)
+    optimal = a_star_search(walls.tolist(), manhattan_distance)[1]
+    assert optimal == bfs_cost(to_grid(walls))
+    assert jump_point_search(walls.tolist(), manhattan_distance)[1] == optimal
+
+
+def test_jump_point_search_skips_open_space():
+    walls = [[0] * 40 for _ in range(40)]
+    expanded, cost, _ = jump_point_search(walls, manhattan_distance)
+    assert cost == 78
+    assert expanded < a_star_search(walls, manhattan_distance)[0]
+
+
+def test_jump_point_search_without_a_path():
+    walls = [[0] * 10 for _ in range(10)]
+    walls[8][9] = walls[9][8] = 1
+    assert jump_point_search(walls, manhattan_distance)[1] == float("inf")
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from helpers import bfs_cost, check_path
+from mazes import hpa
+from mazes.heuristic_search import a_star_search, hpa_star_search, manhattan_distance
+from mazes.hpa import Abstraction, AbstractionFileError
+from mazes.maze_generator import random_maze, to_grid
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return to_grid(random_maze(70, 90, 0.3, seed=7))
+
+
+def path_cells(grid, cells):
+    return [grid.cell(index) for index in cells]
+
+
+@pytest.mark.parametrize("cluster_size", [8, 16, 32])
+def test_paths_are_valid_and_near_optimal(grid, cluster_size):
+    abstraction = Abstraction.build(grid, cluster_size)
+    walls = [grid.walls[row * grid.width:(row + 1) * grid.width] for row in range(grid.height)]
+    open_cells = [index for index in range(grid.height * grid.width) if not grid.walls[index]]
+    rng = random.Random(cluster_size)
+    for _ in range(30):
+        start, goal = rng.choice(open_cells), rng.choice(open_cells)
+        optimal = bfs_cost(grid, start, goal)
+        solution = abstraction.find_path(start, goal)
+        if optimal is None:
+            assert solution is None
+            continue
+        actions, cells = solution
+        assert len(actions) == len(cells) >= optimal
+        if cells:
+            check_path(walls, path_cells(grid, cells), grid.cell(start), grid.cell(goal))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_hpa_star_search_is_never_shorter_than_a_star(seed, tmp_path, monkeypatch):
+    monkeypatch.setattr(hpa, "CACHE_DIR", str(tmp_path))
+    walls = random_maze(60, 60, 0.3, seed=seed).tolist()
+    optimal = a_star_search(walls, manhattan_distance)[1]
+    assert hpa_star_search(walls, manhattan_distance)[1] >= optimal
+
+
+def test_save_and_load(grid, tmp_path):
+    abstraction = Abstraction.build(grid, 16)
+    filename = str(tmp_path / "maze.hpa")
+    abstraction.save(filename)
+    loaded = Abstraction.load(filename, grid, 16)
+    assert loaded.cluster_size == 16
+    assert loaded.edges == abstraction.edges
+    assert loaded.find_path(grid.start, grid.goal) == abstraction.find_path(grid.start, grid.goal)
+
+    with pytest.raises(AbstractionFileError, match="16 cell clusters"):
+        Abstraction.load(filename, grid, 32)
+    with pytest.raises(AbstractionFileError, match="different maze"):
+        Abstraction.load(filename, to_grid(random_maze(70, 90, 0.3, seed=8)))
+
+    with open(filename, "r+b") as f:
+        f.truncate(hpa.HEADER.size + 5)
+    with pytest.raises(AbstractionFileError, match="truncated"):
+        Abstraction.load(filename, grid)
+    with open(filename, "wb") as f:
+        f.write(b"garbage")
+    with pytest.raises(AbstractionFileError, match="not an HPA"):
+        Abstraction.load(filename, grid)
+
+
+def test_cached_builds_once_per_maze(grid, tmp_path, monkeypatch):
+    built = Abstraction.cached(grid, 16, str(tmp_path))
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1 and files[0].suffix == ".hpa"
+
+    # Later calls load the file instead of building
+    def fail(*args):
+        raise AssertionError("rebuilt a cached abstraction")
+    monkeypatch.setattr(Abstraction, "build", classmethod(fail))
+    assert Abstraction.cached(grid, 16, str(tmp_path)).edges == built.edges
+    monkeypatch.undo()
+
+    # A corrupt file is replaced by a fresh build
+    files[0].write_bytes(b"garbage")
+    assert Abstraction.cached(grid, 16, str(tmp_path)).edges == built.edges
+    assert Abstraction.load(str(files[0]), grid, 16).edges == built.edges
@@ -0,0 +1,61 @@
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost
+from mazes import astar_maze
+from mazes.heuristic_search import a_star_search, ida_star_search, manhattan_distance
+from mazes.ida_star import ENTRY_BYTES, IDAStar, table_size
+from mazes.maze_generator import random_maze, to_grid
+from mazes.search_stats import SearchStats
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_ida_star_matches_a_star(seed):
+    walls = random_maze(60, 60, 0.3, seed=seed).tolist()
+    optimal = a_star_search(walls, manhattan_distance)[1]
+    assert ida_star_search(walls, manhattan_distance)[1] == optimal
+    assert ida_star_search(walls, manhattan_distance, budget_kb=1)[1] == optimal
+
+
+def test_full_table_never_re_expands():
+    grid = to_grid(random_maze(50, 50, 0.25, seed=1))
+    solver = IDAStar(grid, 50 * 50)
+    actions, cells = solver.search(grid.start, grid.goal)
+    assert len(actions) == len(cells) == bfs_cost(grid)
+    assert solver.re_expansions == solver.table_overflows == 0
+    assert solver.iterations >= 1
+
+
+def test_capped_table_stays_optimal():
+    grid = to_grid(random_maze(50, 50, 0.25, seed=1))
+    solver = IDAStar(grid, table_size(1))
+    assert solver.max_entries == 1024 // ENTRY_BYTES
+    assert len(solver.keys) == solver.max_entries
+    actions, _ = solver.search(grid.start, grid.goal)
+    assert len(actions) == bfs_cost(grid)
+    assert solver.table_overflows > 0
+    assert solver.re_expansions <= solver.num_explored
+
+
+def test_table_is_no_larger_than_the_grid():
+    grid = to_grid(random_maze(10, 10, 0.2, seed=0))
+    assert IDAStar(grid).max_entries == 100
+
+
+def test_no_path_and_empty_path():
+    # Every bound up to exhaustion is searched before giving up, so keep it small
+    walls = random_maze(10, 10, 0.2, seed=0)
+    walls[5, :] = 1
+    grid = to_grid(walls)
+    assert IDAStar(grid).search(grid.start, grid.goal) is None
+    assert IDAStar(grid).search(grid.start, grid.start) == ([], [])
+
+
+def test_ida_mode_reports_every_expansion():
+    expanded = []
+    stats = SearchStats(on_expand=lambda state, frontier: expanded.append(state))
+    m = astar_maze.Maze(MAZE_FILES[5], stats=stats)
+    m.memory_budget_kb = 4
+    m.solve("ida")
+    assert len(m.solution[0]) == bfs_cost(m.as_grid())
+    assert len(expanded) == m.num_explored == stats["nodes_expanded"]
+    assert expanded[0] == m.start
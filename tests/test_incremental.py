@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from helpers import bfs_cost, check_path
+from mazes import maze
+from mazes.grid import Grid
+from mazes.incremental import LPAStar
+from mazes.maze_generator import random_maze
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_incremental_after_wall_edits(maze_file, compact):
+    m = maze.Maze(maze_file, compact=compact)
+    rng = random.Random(maze_file)
+    for _ in range(40):
+        cell = (rng.randrange(m.height), rng.randrange(m.width))
+        if cell in (m.start, m.goal):
+            continue
+        m.set_wall(cell, not m.walls[cell[0]][cell[1]])
+        expected = bfs_cost(Grid.from_walls(m.walls, m.start, m.goal))
+        if expected is None:
+            with pytest.raises(Exception):
+                m.solve("incremental")
+            continue
+        m.solve("incremental")
+        actions, cells = m.solution
+        check_path(m.walls, cells, m.start, m.goal)
+        assert len(actions) == expected
+
+
+def test_replanning_repairs_only_the_affected_cells():
+    grid = Grid.from_walls(random_maze(80, 80, 0.2, seed=4).tolist(), (0, 0), (79, 79))
+    planner = LPAStar(grid)
+    assert planner.compute()
+    full = planner.num_explored
+    _, cells = planner.path()
+
+    # Blocking a cell on the path forces a detour through nearby cells
+    # only; unblocking it again restores the old cost
+    blocked = cells[len(cells) // 2]
+    grid.set_wall(blocked)
+    planner.wall_changed(blocked)
+    assert planner.compute() == (bfs_cost(grid) is not None)
+    assert planner.num_explored < full
+    if bfs_cost(grid) is not None:
+        assert len(planner.path()[0]) == bfs_cost(grid)
+
+    grid.set_wall(blocked, False)
+    planner.wall_changed(blocked)
+    assert planner.compute()
+    assert len(planner.path()[0]) == len(cells)
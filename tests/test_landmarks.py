@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost, check_path
+from mazes import astar_maze
+from mazes.grid import Grid
+from mazes.landmarks import Landmarks
+from mazes.maze_generator import random_maze
+from mazes.path_cache import PathCache, maze_key
+from mazes.search import SearchSpace
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_landmark_estimate_is_a_lower_bound(seed):
+    grid = Grid.from_walls(random_maze(30, 30, 0.35, seed=seed).tolist(), (0, 0), (29, 29))
+    landmarks = Landmarks.build(grid, k=4)
+    assert len(landmarks.cells) == 4
+    cells = [index for index in range(900) if not grid.walls[index]]
+    rng = random.Random(seed)
+    space = SearchSpace(grid)
+    for _ in range(50):
+        a, b = rng.choice(cells), rng.choice(cells)
+        estimate = landmarks.estimate(a, b)
+        assert estimate >= grid.manhattan(a, b)
+        assert landmarks.heuristic(grid.cell(a), grid.cell(b)) == estimate
+        true = bfs_cost(grid, a, b)
+        if true is not None:
+            assert estimate <= true
+            # ALT-guided A* stays optimal
+            assert space.astar(a, b, estimate=landmarks.estimate)
+            assert space.cost[b] == true
+
+
+def test_path_cache_evicts_least_recently_used():
+    cache = PathCache(max_cells=10)
+    cache.put("maze", 1, 2, (["up"] * 3, [0, 1, 2]))
+    cache.put("maze", 3, 4, (["up"] * 3, [0, 1, 2]))
+    assert cache.get("maze", 1, 2) is not None
+    # Too big for the budget with both others: 3, 4 was used least recently
+    cache.put("maze", 5, 6, (["up"] * 3, [0, 1, 2]))
+    assert len(cache) == 2 and cache.cells == 8
+    with pytest.raises(KeyError):
+        cache.get("maze", 3, 4)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # "No path" is an answer too; a path over the whole budget is not kept
+    cache.put("maze", 7, 8, None)
+    assert cache.get("maze", 7, 8) is None
+    cache.put("maze", 9, 9, (["up"] * 20, list(range(20))))
+    with pytest.raises(KeyError):
+        cache.get("maze", 9, 9)
+
+
+def test_solve_between_uses_the_cache():
+    cache = PathCache()
+    m = astar_maze.Maze(MAZE_FILES[5])
+    m.precompute_landmarks()
+    actions, cells = m.solve_between(m.start, m.goal, cache)
+    check_path(m.walls, cells, m.start, m.goal)
+    assert len(actions) == bfs_cost(m.as_grid())
+
+    # Another Maze on the same walls gets the cached answer
+    other = astar_maze.Maze(MAZE_FILES[5], compact=True)
+    assert other.solve_between(m.start, m.goal, cache) == (actions, cells)
+    assert cache.hits == 1
+    assert m.key == maze_key(other.as_grid())
+
+    with pytest.raises(ValueError):
+        m.solve_between(m.start, (m.height, 0), cache)
+
+
+def test_wall_edit_changes_the_cache_key():
+    cache = PathCache()
+    m = astar_maze.Maze(MAZE_FILES[5])
+    before = m.solve_between(m.start, m.goal, cache)
+    key = m.key
+    cell = before[1][len(before[1]) // 2]
+    m.set_wall(cell)
+    try:
+        actions, cells = m.solve_between(m.start, m.goal, cache)
+    except Exception:
+        assert bfs_cost(m.as_grid()) is None
+    else:
+        assert cell not in cells
+        assert len(actions) == bfs_cost(m.as_grid())
+    assert m.key != key
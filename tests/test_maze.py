@@ -0,0 +1,26 @@
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost, solved
+from mazes import astar_maze, maze
+
+
+@pytest.mark.parametrize("filename", MAZE_FILES)
+@pytest.mark.parametrize("mode", maze.Maze.MODES)
+def test_bfs_modes_match_bfs(filename, mode):
+    m, cost = solved(maze.Maze, filename, mode)
+    assert cost == bfs_cost(m.as_grid())
+
+
+@pytest.mark.parametrize("filename", MAZE_FILES)
+@pytest.mark.parametrize("mode", astar_maze.Maze.MODES)
+def test_astar_modes_match_bfs(filename, mode):
+    m, cost = solved(astar_maze.Maze, filename, mode)
+    assert cost == bfs_cost(m.as_grid())
+
+
+@pytest.mark.parametrize("cls", [maze.Maze, astar_maze.Maze])
+def test_modes_on_random_mazes(cls, maze_file):
+    expected = bfs_cost(cls(maze_file).as_grid())
+    for mode in cls.MODES:
+        for compact in (False, True):
+            assert solved(cls, maze_file, mode, compact)[1] == expected
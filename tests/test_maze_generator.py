@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from helpers import bfs_cost
+from mazes.grid import Grid
+from mazes.maze_generator import backtracker_maze, kruskal_maze, random_maze, to_grid, to_text
+from mazes.search import SearchSpace
+
+
+@pytest.mark.parametrize("density", [0.1, 0.3, 0.6, 0.9])
+@pytest.mark.parametrize("seed", range(5))
+def test_random_maze_is_solvable(density, seed):
+    walls = random_maze(40, 55, density, seed=seed)
+    assert walls.shape == (40, 55)
+    assert bfs_cost(to_grid(walls)) is not None
+    assert np.array_equal(walls, random_maze(40, 55, density, seed=seed))
+
+
+def test_random_maze_density():
+    walls = random_maze(300, 300, 0.3, seed=0)
+    # The carved route clears a few cells below the drawn density
+    assert 0.27 < walls.mean() < 0.31
+
+
+@pytest.mark.parametrize("generator", [backtracker_maze, kruskal_maze])
+@pytest.mark.parametrize("seed", range(3))
+def test_perfect_maze_is_a_spanning_tree(generator, seed):
+    walls = generator(31, 45, seed=seed)
+    assert np.array_equal(walls, generator(31, 45, seed=seed))
+    grid = to_grid(walls)
+    open_cells = int((walls == 0).sum())
+    assert open_cells == 16 * 23 * 2 - 1
+
+    # Every open cell is reachable from the corner, over exactly one
+    # fewer open adjacencies than cells: a tree, so one path per pair
+    space = SearchSpace(grid)
+    assert not space.bfs_many(0, [index for index in range(31 * 45) if not grid.walls[index]])
+    edges = int((~walls[:, :-1].astype(bool) & ~walls[:, 1:].astype(bool)).sum()
+                + (~walls[:-1, :].astype(bool) & ~walls[1:, :].astype(bool)).sum())
+    assert edges == open_cells - 1
+
+
+@pytest.mark.parametrize("generator", [backtracker_maze, kruskal_maze])
+def test_perfect_maze_needs_odd_dimensions(generator):
+    with pytest.raises(Exception, match="odd"):
+        generator(30, 31)
+
+
+def test_text_round_trip():
+    walls = kruskal_maze(21, 35, seed=1)
+    grid = Grid.from_text(to_text(walls))
+    assert (grid.height, grid.width, grid.start, grid.goal) == (21, 35, 0, 21 * 35 - 1)
+    assert grid.walls == to_grid(walls).walls
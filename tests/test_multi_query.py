@@ -0,0 +1,62 @@
+import random
+
+from helpers import check_path
+from mazes import maze
+from mazes.grid import Grid
+from mazes.multi_query import group_queries, solve_pairs
+from mazes.reachability import Components
+from mazes.search import SearchSpace
+
+
+def test_solve_many_matches_a_star(maze_file):
+    m = maze.Maze(maze_file)
+    grid = m.as_grid()
+    rng = random.Random(0)
+    open_cells = [grid.cell(index) for index in range(grid.height * grid.width) if not grid.walls[index]]
+    goals = rng.sample(open_cells, 3)
+    # Enough queries per goal to be answered by one shared search, plus
+    # some that each get their own A*
+    pairs = [(rng.choice(open_cells), rng.choice(goals)) for _ in range(60)]
+    pairs += [(rng.choice(open_cells), rng.choice(open_cells)) for _ in range(20)]
+
+    space = SearchSpace(grid)
+    for (start, goal), solution in zip(pairs, m.solve_many(pairs)):
+        if not space.astar(grid.index(start), grid.index(goal)):
+            assert solution is None
+            continue
+        actions, cells = solution
+        assert len(actions) == space.cost[grid.index(goal)]
+        if start != goal:
+            check_path(m.walls, cells, start, goal)
+
+
+def test_group_queries():
+    pairs = [(s, 9) for s in range(4)] + [(5, g) for g in range(10, 13)] + [(1, 2)]
+    groups = group_queries(pairs, min_group=3)
+    assert groups == [
+        ("goal", 9, [(0, 0), (1, 1), (2, 2), (3, 3)]),
+        ("start", 5, [(4, 10), (5, 11), (6, 12)]),
+        ("pair", 1, [(7, 2)]),
+    ]
+
+
+def test_solve_pairs_across_workers_and_components(maze_file):
+    grid = maze.Maze(maze_file).as_grid()
+    rng = random.Random(1)
+    open_cells = [index for index in range(grid.height * grid.width) if not grid.walls[index]]
+    pairs = [(rng.choice(open_cells), rng.choice(open_cells[:5])) for _ in range(200)]
+    pairs += [(rng.choice(open_cells), rng.choice(open_cells)) for _ in range(50)]
+
+    expected = [None if solution is None else len(solution[0]) for solution in solve_pairs(grid, pairs)]
+    for options in ({"workers": 2, "chunk_size": 32}, {"components": Components(grid)}):
+        lengths = [None if solution is None else len(solution[0]) for solution in solve_pairs(grid, pairs, **options)]
+        assert lengths == expected
+
+
+def test_disconnected_pairs_skip_the_search():
+    # Two open cells with a wall between them
+    grid = Grid(1, 3, bytearray([0, 1, 0]))
+    pairs = [(0, 2), (2, 0), (0, 0)]
+    groups = group_queries(pairs, components=Components(grid))
+    assert groups[0] == ("none", None, [(0, 2), (1, 0)])
+    assert list(solve_pairs(grid, pairs, components=Components(grid)))[:2] == [None, None]
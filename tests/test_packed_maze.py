@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+from helpers import bfs_cost, solved
+from mazes import maze, packed_maze
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze
+from mazes.packed_maze import PackedFileError
+
+
+@pytest.fixture
+def packed(maze_file, tmp_path):
+    filename = str(tmp_path / "maze.mzb")
+    packed_maze.save(filename, maze.Maze(maze_file, compact=True).grid)
+    return filename
+
+
+def test_packed_round_trip(maze_file, packed):
+    grid = maze.Maze(maze_file, compact=True).grid
+    assert packed_maze.is_packed(packed)
+    assert not packed_maze.is_packed(maze_file)
+
+    loaded = packed_maze.load(packed)
+    assert (loaded.height, loaded.width, loaded.start, loaded.goal) == (grid.height, grid.width, grid.start, grid.goal)
+    assert loaded.walls == grid.walls
+    assert solved(maze.Maze, packed, "bfs")[1] == bfs_cost(grid)
+
+
+@pytest.mark.parametrize("width", [1, 7, 8, 9, 17])
+def test_rows_round_trip(width):
+    walls = random_maze(3, width, 0.5, seed=width).tobytes()
+    for i in range(3):
+        row = walls[i * width:(i + 1) * width]
+        packed = packed_maze.pack_row(row)
+        assert len(packed) == packed_maze.row_bytes(width)
+        assert packed_maze.unpack_row(packed, width) == row
+
+
+def test_grid_reads_the_mapping_until_searched(maze_file, packed):
+    expected = maze.Maze(maze_file, compact=True).grid
+    grid = packed_maze.open_grid(packed)
+    assert not grid.unpacked
+    assert [grid.is_wall(index) for index in range(len(expected.walls))] == \
+        [bool(wall) for wall in expected.walls]
+    assert [bytes(row) for row in grid.rows()] == [bytes(row) for row in expected.rows()]
+    assert not grid.unpacked
+
+    # A windowed print of a packed maze reads rows from the mapping too
+    m = maze.Maze(packed)
+    m.print(window=(0, 0, 5, 5), file=io.StringIO())
+    assert not m.grid.unpacked
+
+    assert grid.neighbors(grid.start) == expected.neighbors(expected.start)
+    assert grid.unpacked
+    assert grid.walls == expected.walls
+
+
+def header(height=3, width=3, start=0, goal=8):
+    return packed_maze.HEADER.pack(packed_maze.MAGIC, height, width, start, goal)
+
+
+@pytest.mark.parametrize("contents, message", [
+    (b"MZBP", "too short"),
+    (b"XXXX" + header()[4:] + bytes(3), "not a packed maze"),
+    (header(), "truncated"),
+    (header(goal=9) + bytes(3), "outside the maze"),
+])
+def test_malformed_files_raise(tmp_path, contents, message):
+    filename = tmp_path / "bad.mzb"
+    filename.write_bytes(contents)
+    with pytest.raises(PackedFileError, match=message):
+        packed_maze.PackedMaze(str(filename))
+
+
+def test_save_needs_start_and_goal(tmp_path):
+    with pytest.raises(Exception, match="start and a goal"):
+        packed_maze.save(str(tmp_path / "maze.mzb"), Grid(2, 2, bytearray(4)))
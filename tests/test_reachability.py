@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from mazes import maze
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze, to_text
+from mazes.reachability import UNLABELED, Components, is_reachable
+from mazes.search import SearchSpace
+
+
+def reference_components(grid):
+    """Maps each open cell to the frozenset of cells in its component, by BFS."""
+    space = SearchSpace(grid)
+    components = {}
+    for index in range(grid.height * grid.width):
+        if grid.walls[index] or index in components:
+            continue
+        space.bfs(index, -1)
+        component = frozenset(space.explored_cells)
+        for cell in component:
+            components[cell] = component
+    return components
+
+
+# Widths around the bitboard's byte and word boundaries
+@pytest.mark.parametrize("width", [1, 7, 8, 9, 63, 64, 65])
+@pytest.mark.parametrize("seed", range(2))
+def test_components_match_bfs(width, seed):
+    grid = Grid.from_walls(random_maze(30, width, 0.45, seed=seed).tolist())
+    expected = reference_components(grid)
+    components = Components(grid)
+    count = components.label_all()
+    assert count == len(set(expected.values()))
+    assert sum(components.sizes) == len(expected)
+    for index in range(grid.height * grid.width):
+        if grid.walls[index]:
+            assert components.label(index) == UNLABELED
+            continue
+        assert components.sizes[components.label(index)] == len(expected[index])
+
+    # Labeled on demand, one component at a time
+    lazy = Components(grid)
+    rng = random.Random(width)
+    cells = list(expected)
+    for _ in range(100):
+        a, b = rng.choice(cells), rng.choice(cells)
+        connected = b in expected[a]
+        assert lazy.connected(a, b) == connected
+        assert is_reachable(grid, a, b) == connected
+
+
+def test_maze_rejects_pairs_in_different_components(tmp_path):
+    # A wall across the middle cuts the goal off from the start
+    walls = random_maze(21, 21, 0.2, seed=3)
+    walls[10, :] = 1
+    path = tmp_path / "split.txt"
+    path.write_text(to_text(walls))
+
+    m = maze.Maze(str(path))
+    assert not m.is_solvable()
+    with pytest.raises(Exception, match="no solution"):
+        m.solve()
+    with pytest.raises(Exception, match="no solution"):
+        m.solve_from((0, 0))
+    assert not m.connected((0, 0), m.goal)
+
+    # Opening the wall again drops the old labels
+    m.set_wall((10, 0), False)
+    m.set_wall((9, 0), False)
+    m.set_wall((11, 0), False)
+    assert m.components is None
+    assert m.connected((9, 0), (11, 0))
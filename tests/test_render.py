@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from helpers import MAZE_FILES
+from mazes import astar_maze, render
+
+
+def drawn(m, cell_size=50, cell_border=2):
+    """The solved maze drawn one rectangle per cell, as output_image used to."""
+    fills = {render.WALL: (40, 40, 40), render.START: (255, 0, 0), render.GOAL: (0, 171, 28),
+             render.SOLUTION: (220, 235, 113), render.EXPLORED: (212, 97, 85), render.EMPTY: (237, 240, 252)}
+    solution = set(m.solution[1])
+    img = Image.new("RGBA", (m.width * cell_size, m.height * cell_size), "black")
+    draw = ImageDraw.Draw(img)
+    for i, row in enumerate(m.walls):
+        for j, wall in enumerate(row):
+            if wall:
+                code = render.WALL
+            elif (i, j) == m.start:
+                code = render.START
+            elif (i, j) == m.goal:
+                code = render.GOAL
+            elif (i, j) in solution:
+                code = render.SOLUTION
+            elif (i, j) in m.explored:
+                code = render.EXPLORED
+            else:
+                code = render.EMPTY
+            draw.rectangle([(j * cell_size + cell_border, i * cell_size + cell_border),
+                            ((j + 1) * cell_size - cell_border, (i + 1) * cell_size - cell_border)],
+                           fill=fills[code])
+    return img
+
+
+@pytest.fixture
+def solved_maze():
+    m = astar_maze.Maze(MAZE_FILES[1])
+    m.solve()
+    return m
+
+
+def test_image_matches_per_cell_drawing(solved_maze, tmp_path):
+    filename = str(tmp_path / "maze.png")
+    assert solved_maze.output_image(filename, show_explored=True) == [filename]
+    with Image.open(filename) as img:
+        assert img.mode == "RGBA"
+        assert np.array_equal(np.asarray(img), np.asarray(drawn(solved_maze)))
+
+
+def test_downscale_keeps_the_highest_code():
+    codes = np.zeros((5, 5), dtype=np.uint8)
+    codes[0, 1] = render.WALL
+    codes[1, 0] = render.SOLUTION
+    codes[4, 4] = render.GOAL
+    small = render.downscale(codes, 2)
+    assert small.shape == (3, 3)
+    assert small[0, 0] == render.SOLUTION
+    assert small[2, 2] == render.GOAL
+    assert small[1, 1] == render.EMPTY
+
+
+def test_scaled_and_tiled_output(solved_maze, tmp_path):
+    m = solved_maze
+    scaled = str(tmp_path / "small.png")
+    m.output_image(scaled, cell_size=4, scale=2)
+    with Image.open(scaled) as img:
+        assert img.size == (-(-m.width // 2) * 4, -(-m.height // 2) * 4)
+
+    tiles = m.output_image(str(tmp_path / "tile.png"), cell_size=4, tile=5)
+    rows, cols = -(-m.height // 5), -(-m.width // 5)
+    assert len(tiles) == rows * cols
+    assert tiles[0].endswith("tile_r0_c0.png")
+    with Image.open(tiles[-1]) as img:
+        assert img.size == ((m.width - (cols - 1) * 5) * 4, (m.height - (rows - 1) * 5) * 4)
@@ -0,0 +1,87 @@
+import random
+from collections import deque
+
+import pytest
+
+from mazes.grid import Grid
+from mazes.maze_generator import random_maze
+from mazes.search import SearchSpace
+
+
+def reference_costs(grid, start):
+    """Breadth-first distances from start over wall rows, without SearchSpace."""
+    walls = [grid.walls[row * grid.width:(row + 1) * grid.width] for row in range(grid.height)]
+    costs = {start: 0}
+    queue = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < grid.height and 0 <= c < grid.width and not walls[r][c] and (r, c) not in costs:
+                costs[(r, c)] = costs[(row, col)] + 1
+                queue.append((r, c))
+    return costs
+
+
+@pytest.fixture
+def grid():
+    return Grid.from_walls(random_maze(30, 30, 0.3, seed=5).tolist())
+
+
+def open_cells(grid):
+    return [index for index in range(grid.height * grid.width) if not grid.walls[index]]
+
+
+def test_reused_space_matches_reference(grid):
+    # One space answers every query: stale entries from earlier searches
+    # must never leak into a later one
+    space = SearchSpace(grid)
+    rng = random.Random(5)
+    cells = open_cells(grid)
+    for _ in range(60):
+        start, goal = rng.choice(cells), rng.choice(cells)
+        expected = reference_costs(grid, grid.cell(start)).get(grid.cell(goal))
+        for search in (space.bfs, space.astar, lambda s, g: space.astar(s, g, use_heuristic=False)):
+            found = search(start, goal)
+            assert found == (expected is not None)
+            if found:
+                actions, path = space.path(goal)
+                assert len(actions) == len(path) == expected == space.cost[goal]
+                assert (path[-1] if path else start) == goal
+
+
+def test_path_back_reverses_path(grid):
+    space = SearchSpace(grid)
+    cells = open_cells(grid)
+    start = cells[0]
+    costs = reference_costs(grid, grid.cell(start))
+    goal = max(cells, key=lambda index: costs.get(grid.cell(index), -1))
+    assert space.bfs(start, goal)
+    actions, path = space.path(goal)
+    back_actions, back_cells = space.path_back(goal)
+    opposite = {"up": "down", "down": "up", "left": "right", "right": "left"}
+    assert back_actions == [opposite[action] for action in reversed(actions)]
+    assert back_cells == ([start] + path[:-1])[::-1]
+
+
+def test_bfs_many_reaches_every_reachable_target(grid):
+    space = SearchSpace(grid)
+    cells = open_cells(grid)
+    source = cells[0]
+    costs = reference_costs(grid, grid.cell(source))
+    targets = random.Random(1).sample(cells, 20)
+    missed = space.bfs_many(source, targets)
+    assert missed == {target for target in targets if grid.cell(target) not in costs}
+    for target in set(targets) - missed:
+        if target != source:
+            assert space.cost[target] == costs[grid.cell(target)]
+            assert len(space.path(target)[0]) == costs[grid.cell(target)]
+
+
+def test_counters_after_search(grid):
+    space = SearchSpace(grid)
+    cells = open_cells(grid)
+    assert space.astar(cells[0], cells[-1])
+    # Stale entries count in stale_pops only, and the goal is explored
+    assert space.pops == space.num_explored == len(space.explored_cells) + 1
+    assert space.pushes >= space.pops + space.stale_pops
+    assert space.peak >= 1
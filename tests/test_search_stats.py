@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from helpers import MAZE_FILES
+from mazes import astar_maze, maze
+from mazes.heuristic_search import a_star_search, manhattan_distance
+from mazes.maze_generator import random_maze
+from mazes.search_stats import SearchStats, expansion_hook, phase
+
+
+@pytest.mark.parametrize("cls, mode", [(maze.Maze, "bfs"), (astar_maze.Maze, "astar"), (astar_maze.Maze, "anytime")])
+@pytest.mark.parametrize("compact", [False, True])
+def test_hook_sees_every_expansion(cls, mode, compact):
+    expanded = []
+    stats = SearchStats(on_expand=lambda state, frontier: expanded.append(state))
+    m = cls(MAZE_FILES[5], compact=compact, stats=stats)
+    m.solve(mode)
+    assert len(expanded) == m.num_explored == stats["nodes_expanded"]
+    assert stats["pops"] == stats["nodes_expanded"]
+    assert stats["pushes"] >= stats["pops"] + stats["stale_pops"]
+    assert {"parse", "solve"} <= set(stats["phases"])
+
+
+def test_sampled_trace(tmp_path):
+    stats = SearchStats(sample_every=10, max_events=5)
+    walls = random_maze(40, 40, 0.3, seed=0).tolist()
+    expanded = a_star_search(walls, manhattan_distance, stats)[0]
+    assert stats.expansions == expanded == stats["nodes_expanded"]
+    assert [event["expansion"] for event in stats.events] == [10, 20, 30, 40, 50]
+
+    filename = tmp_path / "trace.json"
+    stats.write_trace(str(filename))
+    trace = json.loads(filename.read_text())
+    assert trace["stats"]["nodes_expanded"] == expanded
+    assert len(trace["events"]) == 5
+
+
+def test_untraced_stats_skip_the_hook():
+    assert expansion_hook(SearchStats()) is None
+    assert expansion_hook({}) is None
+    assert expansion_hook(SearchStats(sample_every=1)) is not None
+    # Plain dicts and None get a context that does nothing
+    with phase(None, "solve"), phase({}, "solve"):
+        pass
+
+
+def test_nested_phase_keeps_outer_memory_peak():
+    stats = SearchStats(track_memory=True)
+    with stats.phase("solve"):
+        block = bytearray(4 << 20)
+        del block
+        with stats.phase("reconstruct"):
+            pass
+    assert stats["phase_peak_kb"]["solve"] >= 4 << 10
+    assert stats["phase_peak_kb"]["reconstruct"] < 4 << 10
+    assert stats["peak_memory_kb"] == stats["phase_peak_kb"]["solve"]
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from helpers import MAZE_FILES, bfs_cost
+from mazes import maze
+from mazes.maze_generator import random_maze, to_text
+from mazes.solve_service import MazeCache, SolveService, solve_request
+
+
+def expected_cost(filename):
+    return bfs_cost(maze.Maze(filename, compact=True).grid)
+
+
+def test_cache_reparses_edited_files(tmp_path):
+    filename = tmp_path / "maze.txt"
+    filename.write_text(to_text(random_maze(15, 15, 0.3, seed=0)))
+    cache = MazeCache(max_entries=2)
+    first, cached = cache.get(str(filename))
+    assert not cached
+    assert cache.get(str(filename)) == (first, True)
+
+    filename.write_text(to_text(random_maze(15, 15, 0.3, seed=1)))
+    os.utime(filename, ns=(0, os.stat(filename).st_mtime_ns + 10 ** 9))
+    second, cached = cache.get(str(filename))
+    assert not cached and second is not first
+    assert len(cache) == 1
+
+    # Least recently used files go first
+    cache.get(MAZE_FILES[0])
+    cache.get(MAZE_FILES[1])
+    assert len(cache) == 2
+    assert not cache.get(str(filename))[1]
+    assert (cache.hits, cache.misses) == (1, 5)
+
+
+def test_solve_request():
+    cache = MazeCache()
+    filename = MAZE_FILES[5]
+    for mode in ("bfs", "bidirectional", "contracted"):
+        response = solve_request({"file": filename, "mode": mode, "id": 7}, cache)
+        assert response["ok"] and response["id"] == 7
+        assert response["cost"] == expected_cost(filename)
+
+    m = maze.Maze(filename)
+    response = solve_request({"file": filename, "start": list(m.start), "path": True}, cache)
+    assert response["cost"] == expected_cost(filename)
+    assert response["path"][-1] == list(m.goal)
+
+    assert "unknown solve mode" in solve_request({"file": filename, "mode": "dfs"}, cache)["error"]
+    assert not solve_request({"file": "missing.txt"}, cache)["ok"]
+
+
+async def exchange(socket_path, *messages):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    replies = []
+    for message in messages:
+        writer.write((message if isinstance(message, bytes) else json.dumps(message).encode()) + b"\n")
+        await writer.drain()
+        replies.append(json.loads(await reader.readline()))
+    writer.close()
+    return replies
+
+
+async def wait_for_socket(path):
+    for _ in range(200):
+        if os.path.exists(path):
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError(path)
+
+
+def test_service_over_a_socket(tmp_path):
+    socket_path = str(tmp_path / "solve.sock")
+    service = SolveService(workers=1, batch_size=4)
+
+    async def run():
+        server = asyncio.create_task(service.serve(socket_path))
+        await wait_for_socket(socket_path)
+        try:
+            single, batch, bad, invalid = await exchange(
+                socket_path,
+                {"file": MAZE_FILES[5], "id": "a"},
+                [{"file": name} for name in MAZE_FILES],
+                b"{not json",
+                {"mode": "bfs"},
+            )
+
+            # A killed worker fails its batch, then a fresh one takes over
+            pid = next(iter(service.executors[0]._processes))
+            os.kill(pid, signal.SIGKILL)
+            await asyncio.sleep(0.2)
+            failed, recovered = await exchange(socket_path, {"file": MAZE_FILES[0]}, {"file": MAZE_FILES[0]})
+        finally:
+            server.cancel()
+            await asyncio.gather(server, return_exceptions=True)
+        return single, batch, bad, invalid, failed, recovered
+
+    single, batch, bad, invalid, failed, recovered = asyncio.run(run())
+    assert single["ok"] and single["id"] == "a" and single["cost"] == expected_cost(MAZE_FILES[5])
+    assert [response["cost"] for response in batch] == [expected_cost(name) for name in MAZE_FILES]
+    assert "bad JSON" in bad["error"]
+    assert not invalid["ok"]
+    assert not failed["ok"] and "worker failed" in failed["error"]
+    assert recovered["ok"] and not recovered["cached"]
+    assert service.restarts == 1
+
+
+def test_serve_refuses_to_replace_other_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(Exception, match="not a socket"):
+        asyncio.run(SolveService(workers=1).serve(str(path)))
+    assert path.read_text() == "keep me"
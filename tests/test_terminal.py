@@ -0,0 +1,55 @@
+import io
+
+import pytest
+
+from helpers import MAZE_FILES
+from mazes import maze, terminal
+
+
+def printed(m):
+    """The maze printed one character at a time, as Maze.print used to."""
+    solution = m.solution[1] if m.solution is not None else None
+    out = ["\n"]
+    for i, row in enumerate(m.walls):
+        for j, wall in enumerate(row):
+            if wall:
+                out.append("█")
+            elif (i, j) == m.start:
+                out.append("A")
+            elif (i, j) == m.goal:
+                out.append("B")
+            elif solution is not None and (i, j) in solution:
+                out.append("*")
+            else:
+                out.append(" ")
+        out.append("\n")
+    out.append("\n")
+    return "".join(out)
+
+
+@pytest.mark.parametrize("filename", MAZE_FILES)
+@pytest.mark.parametrize("compact", [False, True])
+def test_print_matches_per_cell_output(filename, compact, capsys):
+    m = maze.Maze(filename, compact=compact)
+    m.print()
+    assert capsys.readouterr().out == printed(m)
+    m.solve()
+    m.print()
+    assert capsys.readouterr().out == printed(m)
+
+    streamed = io.StringIO()
+    m.print(file=streamed, stream=True)
+    assert streamed.getvalue() == printed(m)
+
+
+def test_window_crops_the_frame():
+    m = maze.Maze(MAZE_FILES[5])
+    m.solve()
+    full = printed(m).strip("\n").split("\n")
+    window = io.StringIO()
+    m.print(window=(5, 10, 8, 12), file=window)
+    assert window.getvalue().strip("\n").split("\n") == [line[10:22] for line in full[5:13]]
+
+    # A window past the edge is clipped to the maze
+    lines = list(terminal.rows(m.walls, m.start, m.goal, m.solution[1], window=(m.height - 2, m.width - 3, 10, 10)))
+    assert lines == [line[m.width - 3:] for line in full[m.height - 2:]]